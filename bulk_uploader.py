@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Bulk Uploader - Upload banyak video dari manifest JSONL/CSV
+Baris manifest dibaca secara streaming dan dikerjakan oleh worker pool terbatas
+"""
+
+import os
+import csv
+import json
+import math
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from colorama import init, Fore, Style
+
+from social_media_uploader import SocialMediaUploader, VIDEO_PLATFORMS
+from job_queue import JobQueue, job_key
+
+# Initialize colorama
+init(autoreset=True)
+
+# Kolom manifest:
+#   video                 path file video (wajib)
+#   platforms             subset 'tiktok,facebook_reels,youtube_shorts' (default: semua)
+#   tiktok_caption        caption TikTok
+#   facebook_description  deskripsi Facebook Reels
+#   youtube_title         title YouTube (wajib jika youtube_shorts dipakai)
+#   youtube_description   deskripsi YouTube
+#   youtube_privacy       public / unlisted / private
+
+# Kolom yang disimpan sebagai parameter job di antrian
+JOB_PARAM_KEYS = ("tiktok_caption", "facebook_description", "youtube_title", "youtube_description", "youtube_privacy")
+
+
+def iter_manifest(manifest_path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Baca manifest baris per baris tanpa memuat seluruh file
+
+    Yields:
+        (nomor baris, dict baris)
+    """
+    path = Path(manifest_path)
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.suffix.lower() == ".csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                # Header ada di baris 1
+                yield reader.line_num, {k.strip(): (v or "").strip() for k, v in row.items() if k}
+            return
+
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_num, {"_error": f"JSON tidak valid: {e}"}
+                continue
+            yield line_num, row if isinstance(row, dict) else {"_error": "Baris harus berupa object JSON"}
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Percentile nearest-rank"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class BulkUploader:
+    def __init__(self, headless: bool = False, debug: bool = False, workers: int = 1,
+                 offline_driver: bool = False, max_browser_uses: int = 25, force_upload: bool = False,
+                 block_requests: bool = False, page_load_strategy: str = 'normal', timings_log: Optional[str] = None,
+                 defaults: Optional[Dict[str, str]] = None, queue: Optional[JobQueue] = None,
+                 parallel: bool = False, timeouts: Optional[Dict[str, float]] = None):
+        """
+        Initialize Bulk Uploader
+
+        Args:
+            headless: Jalankan browser dalam mode headless
+            debug: Enable debug logging
+            workers: Jumlah baris manifest yang dikerjakan bersamaan
+            offline_driver: Resolusi ChromeDriver tanpa akses network
+            max_browser_uses: Recycle browser setelah dipakai sebanyak ini
+            force_upload: Upload ulang walaupun video sudah tercatat di ledger
+            block_requests: Blokir analytics, iklan, font dan preview media di browser
+            page_load_strategy: pageLoadStrategy browser ('normal', 'eager' atau 'none')
+            timings_log: File JSON lines untuk timing per fase setiap upload
+            defaults: Nilai default kolom manifest (misalnya tiktok_caption dari CLI)
+            queue: Antrian persisten; jika diisi, status per platform disimpan sehingga
+                   manifest yang dijalankan ulang hanya mengerjakan platform yang belum selesai
+            parallel: Upload satu baris ke semua platformnya bersamaan (dengan atau tanpa antrian)
+            timeouts: Batas waktu per platform dalam detik (mode paralel)
+        """
+        if workers < 1:
+            raise ValueError("workers minimal 1")
+
+        self.headless = headless
+        self.debug = debug
+        self.workers = workers
+        self.offline_driver = offline_driver
+        self.force_upload = force_upload
+        self.block_requests = block_requests
+        self.page_load_strategy = page_load_strategy
+        self.timings_log = timings_log
+        self.defaults = defaults or {}
+        self.queue = queue
+        self.parallel = parallel
+        self.timeouts = timeouts
+
+        # Pool browser dipakai bersama semua worker, maksimal satu browser per worker
+        self._prototype = self._new_uploader()
+        self.tiktok_pool = self._prototype.tiktok_uploader.enable_driver_pool(max_size=workers, max_uses=max_browser_uses)
+        self.facebook_pool = self._prototype.facebook_uploader.enable_driver_pool(max_size=workers, max_uses=max_browser_uses)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._durations: Dict[str, List[float]] = {p: [] for p in VIDEO_PLATFORMS}
+        self._outcomes: Dict[str, Dict[str, int]] = {p: {"success": 0, "failed": 0} for p in VIDEO_PLATFORMS}
+        self.items_done = 0
+        self.items_failed = 0
+
+    def _log(self, message: str, level: str = "INFO"):
+        self._prototype._log(message, level)
+
+    def _new_uploader(self) -> SocialMediaUploader:
+        return SocialMediaUploader(headless=self.headless, debug=self.debug, offline_driver=self.offline_driver,
+                                   force_upload=self.force_upload, block_requests=self.block_requests,
+                                   page_load_strategy=self.page_load_strategy, timings_log=self.timings_log)
+
+    def _worker_uploader(self) -> SocialMediaUploader:
+        """SocialMediaUploader per thread worker (state driver tidak boleh dibagi antar thread)"""
+        uploader = getattr(self._local, "uploader", None)
+        if uploader is None:
+            uploader = self._new_uploader()
+            uploader.driver_pools = {'tiktok': self.tiktok_pool, 'facebook': self.facebook_pool}
+            self._local.uploader = uploader
+        return uploader
+
+    def _parse_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalisasi dan validasi satu baris manifest"""
+        if "_error" in row:
+            raise ValueError(row["_error"])
+
+        item = {**self.defaults, **{k: v for k, v in row.items() if v not in (None, "")}}
+        video = item.get("video") or item.get("video_path")
+        if not video:
+            raise ValueError("Kolom 'video' kosong")
+        if not os.path.exists(video):
+            raise FileNotFoundError(f"File video tidak ditemukan: {video}")
+
+        platforms = item.get("platforms") or VIDEO_PLATFORMS
+        if isinstance(platforms, str):
+            platforms = [p.strip() for p in platforms.split(",") if p.strip()]
+        unknown = [p for p in platforms if p not in VIDEO_PLATFORMS]
+        if unknown:
+            raise ValueError(f"Platform tidak dikenal: {', '.join(unknown)}")
+
+        if "youtube_shorts" in platforms and not item.get("youtube_title"):
+            raise ValueError("youtube_title diperlukan untuk youtube_shorts")
+
+        return {
+            "video": video,
+            "platforms": platforms,
+            "tiktok_caption": item.get("tiktok_caption", "#fyp #viral #trending"),
+            "facebook_description": item.get("facebook_description", ""),
+            "youtube_title": item.get("youtube_title", ""),
+            "youtube_description": item.get("youtube_description", ""),
+            "youtube_privacy": item.get("youtube_privacy", "public")
+        }
+
+    def process_row(self, line_num: int, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Upload satu baris manifest ke platform-platformnya"""
+        try:
+            item = self._parse_row(row)
+        except Exception as e:
+            self._log(f"Baris {line_num} dilewati: {e}", "ERROR")
+            return {"line": line_num, "success": False, "message": str(e), "results": {}}
+
+        self._log(f"Baris {line_num}: {os.path.basename(item['video'])} -> {', '.join(item['platforms'])}")
+        results = self._worker_uploader().upload_to_all_video_platforms(
+            item["video"],
+            item["tiktok_caption"],
+            item["facebook_description"],
+            item["youtube_title"],
+            item["youtube_description"],
+            item["youtube_privacy"],
+            parallel=self.parallel,
+            timeouts=self.timeouts,
+            platforms=item["platforms"]
+        )
+
+        return {
+            "line": line_num,
+            "video": item["video"],
+            "success": all(r.get("success", False) for r in results.values()),
+            "results": results
+        }
+
+    def process_queued_row(self, line_num: int, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Masukkan baris manifest ke antrian lalu jalankan sub-job yang belum selesai"""
+        try:
+            item = self._parse_row(row)
+        except Exception as e:
+            self._log(f"Baris {line_num} dilewati: {e}", "ERROR")
+            return {"line": line_num, "success": False, "message": str(e), "results": {}}
+
+        # Job dikenali dari isi baris (video, platform, parameter); nomor baris hanya untuk tampilan
+        params = {key: item[key] for key in JOB_PARAM_KEYS}
+        job_id = self.queue.enqueue(
+            item["video"],
+            item["platforms"],
+            params,
+            source=job_key(item["video"], item["platforms"], params)
+        )
+        outcome = self.run_job(job_id)
+        outcome["line"] = line_num
+        return outcome
+
+    def run_job(self, job_id: int) -> Dict[str, Any]:
+        """Jalankan satu job dari antrian dengan uploader milik thread ini"""
+        outcome = self.queue.run_job(job_id, self._worker_uploader(), parallel=self.parallel, timeouts=self.timeouts)
+        if outcome["skipped"]:
+            self._log(f"Job {job_id} tidak punya platform tersisa, dilewati", "DEBUG")
+        else:
+            self._log(f"Job {job_id}: {os.path.basename(outcome['video'])} -> {', '.join(outcome['results'])}")
+        return outcome
+
+    def _record(self, outcome: Dict[str, Any], report_file):
+        with self._lock:
+            if outcome.get("skipped"):
+                return
+            self.items_done += 1
+            if not outcome["success"]:
+                self.items_failed += 1
+            for platform, result in outcome["results"].items():
+                self._outcomes[platform]["success" if result.get("success") else "failed"] += 1
+                if "elapsed_seconds" in result:
+                    self._durations[platform].append(result["elapsed_seconds"])
+            if report_file:
+                report_file.write(json.dumps(outcome, ensure_ascii=False, default=str) + "\n")
+                report_file.flush()
+
+    def run(self, manifest_path: str, report_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Proses seluruh manifest
+
+        Args:
+            manifest_path: Path manifest .jsonl atau .csv
+            report_path: Tulis hasil per baris sebagai JSON lines (opsional)
+
+        Returns:
+            Dict ringkasan throughput
+        """
+        if self.queue is None:
+            work = ((
+                {"line": line_num}, partial(self.process_row, line_num, row)
+            ) for line_num, row in iter_manifest(manifest_path))
+        else:
+            self.queue.reset_interrupted()
+            work = ((
+                {"line": line_num}, partial(self.process_queued_row, line_num, row)
+            ) for line_num, row in iter_manifest(manifest_path))
+
+        return self._drain(work, report_path)
+
+    def resume(self, report_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Lanjutkan semua job di antrian yang belum selesai (setelah crash atau upload gagal)
+
+        Args:
+            report_path: Tulis hasil per job sebagai JSON lines (opsional)
+
+        Returns:
+            Dict ringkasan throughput
+        """
+        if self.queue is None:
+            raise ValueError("Resume memerlukan antrian job")
+
+        interrupted = self.queue.reset_interrupted()
+        if interrupted:
+            self._log(f"{interrupted} sub-job terputus dikembalikan ke antrian", "WARNING")
+
+        work = (({"job_id": job_id}, partial(self.run_job, job_id)) for job_id in self.queue.unfinished_jobs())
+        return self._drain(work, report_path)
+
+    def _drain(self, work: Iterator[Tuple[Dict[str, Any], Callable[[], Dict[str, Any]]]],
+               report_path: Optional[str]) -> Dict[str, Any]:
+        """Kerjakan item dengan worker pool, membaca item baru hanya jika ada slot"""
+        start = time.time()
+        # Batasi item yang sudah dibaca tapi belum selesai supaya input tetap streaming
+        in_flight = threading.BoundedSemaphore(self.workers * 2)
+        report_file = open(report_path, 'a', encoding='utf-8') if report_path else None
+
+        def task(label, fn):
+            try:
+                outcome = fn()
+            except Exception as e:
+                outcome = {**label, "success": False, "message": str(e), "results": {}}
+            try:
+                self._record(outcome, report_file)
+            finally:
+                in_flight.release()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bulk") as executor:
+                for label, fn in work:
+                    in_flight.acquire()
+                    executor.submit(task, label, fn)
+        finally:
+            if report_file:
+                report_file.close()
+            self.close()
+
+        return self.summary(time.time() - start)
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        """Ringkasan throughput: items/menit dan p50/p95 per platform"""
+        per_platform = {}
+        for platform in VIDEO_PLATFORMS:
+            durations = self._durations[platform]
+            if not durations and not any(self._outcomes[platform].values()):
+                continue
+            per_platform[platform] = {
+                **self._outcomes[platform],
+                "p50_seconds": percentile(durations, 50),
+                "p95_seconds": percentile(durations, 95)
+            }
+
+        return {
+            "items": self.items_done,
+            "failed_items": self.items_failed,
+            "elapsed_seconds": round(elapsed, 2),
+            "items_per_minute": round(self.items_done / (elapsed / 60.0), 2) if elapsed > 0 else 0.0,
+            "platforms": per_platform
+        }
+
+    def close(self):
+        """Tutup semua browser di pool"""
+        self.tiktok_pool.close()
+        self.facebook_pool.close()
+
+
+def print_summary(summary: Dict[str, Any]):
+    """Cetak ringkasan throughput bulk upload"""
+    print(f"\n{Fore.MAGENTA}📊 RINGKASAN BULK UPLOAD:")
+    print(f"Items: {summary['items']} ({summary['failed_items']} gagal)")
+    print(f"Waktu: {summary['elapsed_seconds']:.1f}s")
+    print(f"Throughput: {summary['items_per_minute']:.2f} items/menit")
+
+    for platform, stats in summary["platforms"].items():
+        p50 = f"{stats['p50_seconds']:.1f}s" if stats["p50_seconds"] is not None else "-"
+        p95 = f"{stats['p95_seconds']:.1f}s" if stats["p95_seconds"] is not None else "-"
+        color = Fore.GREEN if not stats["failed"] else Fore.YELLOW
+        print(f"{color}{platform.upper()}: {stats['success']} berhasil, {stats['failed']} gagal, "
+              f"p50 {p50}, p95 {p95}{Style.RESET_ALL}")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+CDP Cookies - Pasang cookies lewat Chrome DevTools Protocol sebelum navigasi pertama
+Satu panggilan Network.setCookies menggantikan page load ke domain target + add_cookie per cookie
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+# Nilai sameSite dari export Selenium ('Lax') maupun ekstensi browser ('no_restriction', 'unspecified')
+_SAME_SITE = {
+    "strict": "Strict",
+    "lax": "Lax",
+    "none": "None",
+    "no_restriction": "None"
+}
+
+
+def to_cdp_cookie(cookie: Dict[str, Any], default_domain: str) -> Optional[Dict[str, Any]]:
+    """
+    Ubah cookie dari file JSON ke format CookieParam CDP
+
+    Returns:
+        Dict CookieParam, atau None jika cookie tidak punya name/value
+    """
+    if 'name' not in cookie or 'value' not in cookie:
+        return None
+
+    domain = cookie.get('domain') or default_domain
+    param = {
+        'name': cookie['name'],
+        'value': str(cookie['value']),
+        'domain': domain,
+        'path': cookie.get('path', '/'),
+        # CDP butuh url supaya cookie host-only (tanpa titik di depan) punya scheme yang benar
+        'url': f"https://{domain.lstrip('.')}{cookie.get('path', '/')}"
+    }
+
+    expiry = cookie.get('expiry', cookie.get('expirationDate', cookie.get('expires')))
+    if expiry is not None and not cookie.get('session'):
+        try:
+            if float(expiry) > 0:
+                param['expires'] = float(expiry)
+        except (TypeError, ValueError):
+            pass
+
+    if 'secure' in cookie:
+        param['secure'] = bool(cookie['secure'])
+    if 'httpOnly' in cookie:
+        param['httpOnly'] = bool(cookie['httpOnly'])
+
+    same_site = _SAME_SITE.get(str(cookie.get('sameSite', '')).lower())
+    if same_site:
+        param['sameSite'] = same_site
+        # Chrome menolak SameSite=None tanpa Secure
+        if same_site == "None":
+            param['secure'] = True
+
+    return param
+
+
+def set_cookies(driver, cookies: List[Dict[str, Any]], default_domain: str,
+                log: Optional[Callable[[str, str], None]] = None) -> Optional[int]:
+    """
+    Pasang semua cookies dalam satu perintah CDP, tanpa perlu membuka halaman dulu
+
+    Args:
+        driver: Chrome WebDriver
+        cookies: Cookies dari file JSON
+        default_domain: Domain untuk cookie yang tidak mencantumkan domain
+        log: Fungsi logging (message, level)
+
+    Returns:
+        Jumlah cookie yang terpasang, atau None jika driver tidak mendukung CDP
+    """
+    params = [param for param in (to_cdp_cookie(cookie, default_domain) for cookie in cookies) if param]
+    if not params:
+        return 0
+
+    execute_cdp = getattr(driver, 'execute_cdp_cmd', None)
+    if execute_cdp is None:
+        return None
+
+    try:
+        execute_cdp("Network.setCookies", {"cookies": params})
+        return len(params)
+    except WebDriverException as e:
+        # Satu cookie tidak valid menggagalkan seluruh batch; ulangi per cookie supaya sisanya tetap terpasang
+        if log:
+            log(f"Network.setCookies gagal ({e.msg or e}), mencoba per cookie", "DEBUG")
+
+    added = 0
+    for param in params:
+        try:
+            result = execute_cdp("Network.setCookie", param)
+            if result.get('success', True):
+                added += 1
+        except WebDriverException as e:
+            if log:
+                log(f"Gagal menambahkan cookie {param['name']}: {e.msg or e}", "DEBUG")
+    return added
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+ChromeDriver Cache - Resolusi path ChromeDriver yang disimpan di disk
+Di-key berdasarkan binary Chrome lokal, dengan mode offline tanpa akses network
+"""
+
+import os
+import re
+import json
+import shutil
+import platform
+import subprocess
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable
+
+# Set environment variable ini ke "1" untuk memaksa mode offline
+OFFLINE_ENV = "CHROMEDRIVER_OFFLINE"
+
+CHROME_BINARY_NAMES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome"
+]
+
+CHROME_COMMON_PATHS = {
+    "Windows": [
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+        os.path.expandvars(r"%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe")
+    ],
+    "Darwin": [
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        "/Applications/Chromium.app/Contents/MacOS/Chromium"
+    ]
+}
+
+CHROMEDRIVER_COMMON_PATHS = [
+    r"C:\Program Files\Google\Chrome\Application\chromedriver.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chromedriver.exe",
+    r"C:\chromedriver\chromedriver.exe",
+    r"C:\tools\chromedriver.exe"
+]
+
+_VERSION_RE = re.compile(r"(\d+\.\d+\.\d+(?:\.\d+)?)")
+
+# Cache in-process supaya launch berikutnya tidak membaca disk lagi
+_memory_cache: Dict[str, str] = {}
+_lock = threading.Lock()
+
+
+def find_chrome_binary() -> Optional[str]:
+    """Cari binary Chrome/Chromium yang terinstall"""
+    for path in CHROME_COMMON_PATHS.get(platform.system(), []):
+        if os.path.exists(path):
+            return path
+
+    for name in CHROME_BINARY_NAMES:
+        path = shutil.which(name)
+        if path:
+            return os.path.realpath(path)
+
+    return None
+
+
+def get_chrome_version(chrome_path: str) -> Optional[str]:
+    """Baca versi Chrome secara lokal (tanpa network)"""
+    if platform.system() == "Windows":
+        # chrome.exe --version tidak mencetak apa-apa di Windows, pakai nama folder versi
+        app_dir = os.path.dirname(chrome_path)
+        versions = [d for d in os.listdir(app_dir) if _VERSION_RE.fullmatch(d)]
+        if versions:
+            return max(versions, key=lambda v: tuple(int(p) for p in v.split(".")))
+        return None
+
+    try:
+        output = subprocess.run(
+            [chrome_path, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        ).stdout
+    except Exception:
+        return None
+
+    match = _VERSION_RE.search(output or "")
+    return match.group(1) if match else None
+
+
+def chrome_fingerprint(chrome_path: str) -> Dict[str, Any]:
+    """Fingerprint binary Chrome - berubah jika Chrome diupdate/diganti"""
+    stat = os.stat(chrome_path)
+    return {
+        "chrome_path": chrome_path,
+        "size": stat.st_size,
+        "mtime": int(stat.st_mtime)
+    }
+
+
+def is_offline(offline: bool = False) -> bool:
+    """Cek apakah mode offline aktif (argumen atau environment variable)"""
+    return offline or os.environ.get(OFFLINE_ENV, "").lower() in ("1", "true", "yes")
+
+
+class ChromeDriverResolver:
+    def __init__(self, cache_path: Path, offline: bool = False,
+                 log: Optional[Callable[[str, str], None]] = None):
+        """
+        Initialize ChromeDriver Resolver
+
+        Args:
+            cache_path: Path file JSON untuk cache hasil resolusi
+            offline: Jangan pernah menghubungi network (tanpa ChromeDriverManager)
+            log: Fungsi logging (message, level)
+        """
+        self.cache_path = Path(cache_path)
+        self.offline = is_offline(offline)
+        self._log_fn = log
+
+    def _log(self, message: str, level: str = "INFO"):
+        if self._log_fn:
+            self._log_fn(message, level)
+
+    def _read_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, data: Dict[str, Any]):
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            self._log(f"Gagal menyimpan cache ChromeDriver: {e}", "DEBUG")
+
+    def _cached_path(self, fingerprint: Optional[Dict[str, Any]]) -> Optional[str]:
+        cache = self._read_cache()
+        driver_path = cache.get("driver_path")
+        if not driver_path or not os.path.exists(driver_path):
+            return None
+
+        if fingerprint is None:
+            # Chrome tidak terdeteksi: hanya pakai cache di mode offline
+            return driver_path if self.offline else None
+
+        for key, value in fingerprint.items():
+            if cache.get(key) != value:
+                return None
+        return driver_path
+
+    def _download(self) -> str:
+        """Resolusi via webdriver-manager (butuh network)"""
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        self._log("Mendownload ChromeDriver terbaru...")
+        driver_path = ChromeDriverManager().install()
+
+        if not os.path.exists(driver_path):
+            raise FileNotFoundError("ChromeDriver tidak ditemukan setelah download")
+
+        # Untuk Windows, pastikan file adalah .exe
+        if platform.system() == "Windows" and not driver_path.endswith('.exe'):
+            driver_dir = os.path.dirname(driver_path)
+            for file in os.listdir(driver_dir):
+                if file.endswith('.exe') and 'chromedriver' in file.lower():
+                    driver_path = os.path.join(driver_dir, file)
+                    break
+
+        return driver_path
+
+    def _find_local(self) -> Optional[str]:
+        """Cari ChromeDriver di PATH dan lokasi umum Windows"""
+        self._log("Mencari ChromeDriver di sistem PATH...")
+
+        for name in ['chromedriver', 'chromedriver.exe']:
+            path = shutil.which(name)
+            if path:
+                return path
+
+        if platform.system() == "Windows":
+            for path in CHROMEDRIVER_COMMON_PATHS:
+                if os.path.exists(path):
+                    return path
+
+        return None
+
+    def resolve(self) -> str:
+        """
+        Resolusi path ChromeDriver: memory -> cache disk -> download -> PATH
+
+        Returns:
+            Path ke executable ChromeDriver
+        """
+        chrome_path = find_chrome_binary()
+        fingerprint = chrome_fingerprint(chrome_path) if chrome_path else None
+        memory_key = json.dumps(fingerprint, sort_keys=True)
+
+        with _lock:
+            cached = _memory_cache.get(memory_key)
+            if cached and os.path.exists(cached):
+                return cached
+
+            cached = self._cached_path(fingerprint)
+            if cached:
+                self._log(f"ChromeDriver dari cache: {cached}", "SUCCESS")
+                _memory_cache[memory_key] = cached
+                return cached
+
+            driver_path = None
+            if self.offline:
+                self._log("Mode offline: melewati download ChromeDriver", "INFO")
+            else:
+                try:
+                    driver_path = self._download()
+                except Exception as e:
+                    self._log(f"Error downloading ChromeDriver: {e}", "WARNING")
+
+            if not driver_path:
+                driver_path = self._find_local()
+
+            if not driver_path:
+                raise FileNotFoundError("ChromeDriver tidak ditemukan. Silakan install Chrome dan ChromeDriver.")
+
+            self._log(f"ChromeDriver ditemukan: {driver_path}", "SUCCESS")
+
+            if fingerprint:
+                entry = dict(fingerprint)
+                entry["chrome_version"] = get_chrome_version(chrome_path)
+                entry["driver_path"] = driver_path
+                self._write_cache(entry)
+            elif self.offline:
+                self._write_cache({"driver_path": driver_path})
+
+            _memory_cache[memory_key] = driver_path
+            return driver_path
+
+    def clear(self):
+        """Hapus cache ChromeDriver"""
+        with _lock:
+            _memory_cache.clear()
+            if self.cache_path.exists():
+                self.cache_path.unlink()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Credential Manager - Refresh token OAuth di background sebelum expired
+Semua upload memakai satu objek Credentials, sehingga token baru langsung terpakai
+tanpa upload harus menunggu refresh
+"""
+
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+# Refresh sekian detik sebelum expired; harus lebih besar dari ambang 'valid' google-auth (~4 menit)
+REFRESH_MARGIN_SECONDS = 10 * 60
+
+# Jeda sebelum mencoba lagi jika refresh gagal
+RETRY_SECONDS = 60
+
+_managers: Dict[str, "CredentialManager"] = {}
+_managers_lock = threading.Lock()
+
+
+def write_token_file(creds: Credentials, token_path: Path):
+    """Tulis token secara atomik (file lama tetap utuh jika proses mati di tengah penulisan)"""
+    token_path = Path(token_path)
+    tmp_path = token_path.with_suffix(".tmp")
+    with open(tmp_path, 'w') as token:
+        token.write(creds.to_json())
+    os.replace(tmp_path, token_path)
+
+
+class CredentialManager:
+    def __init__(self, credentials: Credentials, token_path: Path,
+                 log: Optional[Callable[[str, str], None]] = None,
+                 margin: float = REFRESH_MARGIN_SECONDS):
+        """
+        Initialize Credential Manager
+
+        Args:
+            credentials: Credentials yang dipakai bersama semua upload
+            token_path: Path youtube_token.json
+            log: Fungsi logging (message, level)
+            margin: Refresh sekian detik sebelum token expired
+        """
+        self.credentials = credentials
+        self.token_path = Path(token_path)
+        self.margin = margin
+        self._log_fn = log
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.refresh_count = 0
+
+    @classmethod
+    def shared(cls, token_path: Path) -> Optional["CredentialManager"]:
+        """Manager yang sudah berjalan untuk file token ini (None jika belum ada)"""
+        with _managers_lock:
+            return _managers.get(str(Path(token_path).resolve()))
+
+    @classmethod
+    def register(cls, credentials: Credentials, token_path: Path,
+                 log: Optional[Callable[[str, str], None]] = None) -> "CredentialManager":
+        """Buat dan jalankan manager process-wide untuk file token ini (atau kembalikan yang sudah ada)"""
+        key = str(Path(token_path).resolve())
+        with _managers_lock:
+            manager = _managers.get(key)
+            if manager is None:
+                manager = cls(credentials, token_path, log=log)
+                manager.start()
+                _managers[key] = manager
+            return manager
+
+    @classmethod
+    def unregister(cls, token_path: Path):
+        """Hentikan dan lupakan manager untuk file token ini"""
+        with _managers_lock:
+            manager = _managers.pop(str(Path(token_path).resolve()), None)
+        if manager:
+            manager.stop()
+
+    def _log(self, message: str, level: str = "INFO"):
+        if self._log_fn:
+            self._log_fn(message, level)
+
+    def seconds_until_refresh(self) -> Optional[float]:
+        """Detik sampai refresh berikutnya (None jika token tidak punya expiry)"""
+        expiry = self.credentials.expiry
+        if expiry is None:
+            return None
+        # google-auth menyimpan expiry sebagai UTC naive
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return max(0.0, (expiry - now).total_seconds() - self.margin)
+
+    def refresh(self):
+        """Refresh token sekarang lalu simpan ke disk"""
+        with self._lock:
+            self.credentials.refresh(Request())
+            write_token_file(self.credentials, self.token_path)
+            self.refresh_count += 1
+        self._log(f"Token YouTube direfresh di background (berlaku sampai {self.credentials.expiry} UTC)", "DEBUG")
+
+    def _run(self):
+        while not self._stop.is_set():
+            delay = self.seconds_until_refresh()
+            if delay is None:
+                return
+            if self._stop.wait(delay):
+                return
+            try:
+                self.refresh()
+            except Exception as e:
+                self._log(f"Refresh token di background gagal: {e}", "WARNING")
+                self._stop.wait(RETRY_SECONDS)
+
+    def start(self):
+        """Jalankan thread refresh (daemon, ikut berhenti saat proses selesai)"""
+        if not self.credentials.refresh_token:
+            self._log("Token tidak punya refresh token, refresh background tidak dijalankan", "WARNING")
+            return
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="youtube-token-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Driver Pool - Pool Chrome WebDriver yang bisa dipakai ulang
+Browser yang sudah login dipinjam dan dikembalikan antar upload
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class PooledDriver:
+    """Satu browser di dalam pool beserta metadata pemakaiannya"""
+
+    def __init__(self, driver: Any):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        # True jika cookies sudah dimuat / user sudah login di browser ini
+        self.warm = False
+
+
+class DriverPool:
+    def __init__(self, factory: Callable[[], Any], max_size: int = 2, max_uses: int = 25,
+                 max_idle: int = 900, log: Optional[Callable[[str, str], None]] = None):
+        """
+        Initialize Driver Pool
+
+        Args:
+            factory: Fungsi tanpa argumen yang membuat WebDriver baru
+            max_size: Jumlah maksimum browser yang hidup bersamaan
+            max_uses: Browser di-recycle setelah dipakai sebanyak ini
+            max_idle: Browser idle lebih lama dari ini (detik) di-recycle
+            log: Fungsi logging (message, level), misalnya uploader._log
+        """
+        if max_size < 1:
+            raise ValueError("max_size minimal 1")
+
+        self.factory = factory
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.max_idle = max_idle
+        self._log_fn = log
+
+        self._idle: List[PooledDriver] = []
+        self._in_use = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self.launches = 0
+        self.recycled = 0
+
+    def _log(self, message: str, level: str = "INFO"):
+        if self._log_fn:
+            self._log_fn(message, level)
+
+    def _quit(self, entry: PooledDriver):
+        try:
+            entry.driver.quit()
+        except Exception:
+            pass
+
+    def is_healthy(self, entry: PooledDriver) -> bool:
+        """Cek apakah browser masih hidup dan merespon"""
+        try:
+            if not entry.driver.window_handles:
+                return False
+            entry.driver.execute_script("return document.readyState")
+            return True
+        except Exception:
+            return False
+
+    def _is_expired(self, entry: PooledDriver) -> bool:
+        if self.max_uses and entry.uses >= self.max_uses:
+            return True
+        if self.max_idle and time.time() - entry.last_used > self.max_idle:
+            return True
+        return False
+
+    def checkout(self, timeout: Optional[float] = None) -> PooledDriver:
+        """
+        Pinjam browser dari pool (blocking jika semua sedang dipakai)
+
+        Args:
+            timeout: Batas waktu menunggu browser kosong (None = tanpa batas)
+
+        Returns:
+            PooledDriver yang siap dipakai
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+
+        while True:
+            # Ambil kandidat idle atau reservasi slot untuk browser baru; keduanya memakai satu slot
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Driver pool sudah ditutup")
+
+                    if self._idle or self._in_use < self.max_size:
+                        entry = self._idle.pop() if self._idle else None
+                        self._in_use += 1
+                        break
+
+                    remaining = None
+                    if deadline is not None:
+                        remaining = deadline - time.time()
+                        if remaining <= 0:
+                            raise TimeoutError("Timeout menunggu browser kosong di pool")
+                    self._cond.wait(remaining)
+
+            if entry is None:
+                break
+
+            # Health check dan quit di luar lock: browser yang hang tidak memblokir checkout/release thread lain
+            if not self._is_expired(entry) and self.is_healthy(entry):
+                with self._cond:
+                    entry.uses += 1
+                    entry.last_used = time.time()
+                self._log(f"Browser dipinjam dari pool (pemakaian ke-{entry.uses})", "DEBUG")
+                return entry
+
+            self._log("Browser di pool di-recycle (expired/tidak sehat)", "DEBUG")
+            self._quit(entry)
+            with self._cond:
+                self.recycled += 1
+                self._in_use -= 1
+                self._cond.notify()
+
+        # Slot sudah direservasi, launch browser di luar lock
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        entry = PooledDriver(driver)
+        entry.uses = 1
+        with self._cond:
+            self.launches += 1
+        self._log(f"Browser baru ditambahkan ke pool ({self.launches} launch)", "DEBUG")
+        return entry
+
+    def release(self, entry: PooledDriver, discard: bool = False):
+        """
+        Kembalikan browser ke pool
+
+        Args:
+            entry: PooledDriver dari checkout()
+            discard: Tutup browser alih-alih menyimpannya untuk dipakai ulang
+        """
+        with self._cond:
+            self._in_use -= 1
+            keep = not discard and not self._closed and not (self.max_uses and entry.uses >= self.max_uses)
+            if keep:
+                entry.last_used = time.time()
+                self._idle.append(entry)
+            else:
+                self.recycled += 1
+            self._cond.notify()
+
+        if not keep:
+            self._log("Browser ditutup dan dikeluarkan dari pool", "DEBUG")
+            self._quit(entry)
+
+    def close(self):
+        """Tutup semua browser idle dan tolak checkout berikutnya"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+
+        for entry in idle:
+            self._quit(entry)
+
+    def stats(self) -> Dict[str, int]:
+        """Statistik pool"""
+        with self._cond:
+            return {
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "launches": self.launches,
+                "recycled": self.recycled
+            }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -8,44 +8,66 @@ import os
 import sys
 import json
 import time
-import platform
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
-    WebDriverException,
-    ElementNotInteractableException,
     StaleElementReferenceException
 )
-from webdriver_manager.chrome import ChromeDriverManager
 from colorama import init, Fore, Style, Back
 import argparse
 
+from driver_pool import DriverPool
+from chromedriver_cache import ChromeDriverResolver
+from page_waits import PageWaiter, SelectorMatch, PAGE_LOAD_STRATEGIES, find_first_match, find_button_by_text
+from selector_stats import SelectorStats
+from upload_ledger import UploadLedger, cookie_account
+from cdp_cookies import set_cookies
+from phase_timer import PhaseTimer
+import metrics
+from network_blocking import BLOCKLIST_FILENAME, load_blocklist, apply_blocklist, enable_network_log
+
 # Initialize colorama untuk Windows compatibility
 init(autoreset=True)
 
 class FacebookUploader:
-    def __init__(self, headless: bool = False, debug: bool = False):
+    def __init__(self, headless: bool = False, debug: bool = False, driver_pool: Optional[DriverPool] = None,
+                 offline_driver: bool = False, force_upload: bool = False, block_requests: bool = False,
+                 page_load_strategy: str = 'normal', timings_log: Optional[str] = None):
         """
         Initialize Facebook Uploader
         
         Args:
             headless: Jalankan browser dalam mode headless
             debug: Enable debug logging
+            driver_pool: Pool browser yang dipakai ulang antar upload (opsional)
+            offline_driver: Resolusi ChromeDriver tanpa akses network (cache/PATH saja)
+            force_upload: Upload ulang walaupun video sudah tercatat di ledger
+            block_requests: Blokir analytics, iklan, font dan preview media lewat CDP
+            page_load_strategy: 'normal', 'eager' atau 'none'; selain 'normal' navigasi tidak menunggu
+                                semua resource, halaman dianggap siap begitu elemen kuncinya ada
+            timings_log: File JSON lines untuk timing per fase setiap upload (opsional)
         """
+        if page_load_strategy not in PAGE_LOAD_STRATEGIES:
+            raise ValueError(f"page_load_strategy harus salah satu dari {', '.join(PAGE_LOAD_STRATEGIES)}")
+        
         self.headless = headless
         self.debug = debug
+        self.force_upload = force_upload
+        self.page_load_strategy = page_load_strategy
         self.driver = None
         self.wait = None
+        self.driver_pool = driver_pool
+        self._pooled = None
+        self.waiter = None
         
         # Setup paths - menggunakan folder cookies dengan file JSON
         self.base_dir = Path(__file__).parent
@@ -54,11 +76,36 @@ class FacebookUploader:
         self.cookies_path = self.cookies_dir / "facebook_cookies.json"
         self.screenshots_dir = self.base_dir / "screenshots"
         self.screenshots_dir.mkdir(exist_ok=True)
+        self.cache_dir = self.base_dir / "cache"
+        
+        # Resolver ChromeDriver dengan cache di disk
+        self.driver_resolver = ChromeDriverResolver(
+            self.cache_dir / "chromedriver.json",
+            offline=offline_driver,
+            log=self._log
+        )
+        
+        # Statistik hit/miss selector untuk urutan adaptif
+        self.selector_stats = SelectorStats(self.cache_dir / "selector_stats.json", log=self._log)
+        
+        # Ledger video yang sudah dipublish, mencegah upload ganda ke akun yang sama
+        self.ledger = UploadLedger(self.base_dir / "jobs" / "upload_ledger.db")
+        
+        # Pola URL yang diblokir di browser (default per platform, bisa diganti lewat network_blocklist.json)
+        self.blocked_urls = load_blocklist('facebook', self.base_dir / BLOCKLIST_FILENAME) if block_requests else []
+        
+        # Timing per fase alur upload yang sedang berjalan
+        self.timer = PhaseTimer('facebook', 'idle')
+        self.timings_log = Path(timings_log) if timings_log else None
+        
+        # Rekam event network Chrome (dipakai network_benchmark.py untuk menghitung bytes)
+        self.measure_network = False
         
         # Facebook URLs
         self.facebook_url = "https://www.facebook.com"
         self.reels_create_url = "https://www.facebook.com/reels/create/?surface=PROFILE_PLUS"
         self.login_url = "https://www.facebook.com/login"
+        self.login_keywords = ["login", "checkpoint"]
         
         # Selectors untuk Facebook Status
         self.status_selectors = {
@@ -138,6 +185,12 @@ class FacebookUploader:
                 "button:contains('Terbitkan')"
             ]
         }
+        
+        # Label tombol reels (EN/ID) untuk pencarian berdasarkan teks
+        self.reels_button_texts = {
+            'next': ["next", "berikutnya"],
+            'publish': ["publish", "terbitkan"]
+        }
 
     def _log(self, message: str, level: str = "INFO"):
         """Enhanced logging dengan warna - versi sederhana"""
@@ -165,61 +218,11 @@ class FacebookUploader:
         print(f"{color}{icon} {message}{Style.RESET_ALL}")
 
     def _get_chromedriver_path(self):
-        """Get ChromeDriver path dengan fallback untuk Windows"""
-        try:
-            # Coba download ChromeDriver terbaru
-            self._log("Mendownload ChromeDriver terbaru...")
-            driver_path = ChromeDriverManager().install()
-            
-            # Validasi file exists dan executable
-            if os.path.exists(driver_path):
-                # Untuk Windows, pastikan file adalah .exe
-                if platform.system() == "Windows" and not driver_path.endswith('.exe'):
-                    # Cari file .exe di direktori yang sama
-                    driver_dir = os.path.dirname(driver_path)
-                    for file in os.listdir(driver_dir):
-                        if file.endswith('.exe') and 'chromedriver' in file.lower():
-                            driver_path = os.path.join(driver_dir, file)
-                            break
-                
-                self._log(f"ChromeDriver ditemukan: {driver_path}", "SUCCESS")
-                return driver_path
-            else:
-                raise FileNotFoundError("ChromeDriver tidak ditemukan setelah download")
-                
-        except Exception as e:
-            self._log(f"Error downloading ChromeDriver: {e}", "WARNING")
-            
-            # Fallback: cari ChromeDriver di PATH
-            self._log("Mencari ChromeDriver di sistem PATH...")
-            
-            chrome_names = ['chromedriver', 'chromedriver.exe']
-            for name in chrome_names:
-                # Cek di PATH
-                import shutil
-                path = shutil.which(name)
-                if path:
-                    self._log(f"ChromeDriver ditemukan di PATH: {path}", "SUCCESS")
-                    return path
-            
-            # Fallback terakhir: cek lokasi umum Windows
-            if platform.system() == "Windows":
-                common_paths = [
-                    r"C:\Program Files\Google\Chrome\Application\chromedriver.exe",
-                    r"C:\Program Files (x86)\Google\Chrome\Application\chromedriver.exe",
-                    r"C:\chromedriver\chromedriver.exe",
-                    r"C:\tools\chromedriver.exe"
-                ]
-                
-                for path in common_paths:
-                    if os.path.exists(path):
-                        self._log(f"ChromeDriver ditemukan: {path}", "SUCCESS")
-                        return path
-            
-            raise FileNotFoundError("ChromeDriver tidak ditemukan. Silakan install Chrome dan ChromeDriver.")
+        """Get ChromeDriver path (cache disk, download, lalu fallback PATH/Windows)"""
+        return self.driver_resolver.resolve()
 
-    def _setup_driver(self):
-        """Setup Chrome WebDriver dengan konfigurasi optimal dan suppress logs"""
+    def _create_driver(self):
+        """Buat Chrome WebDriver baru dengan konfigurasi optimal dan suppress logs"""
         self._log("Menyiapkan browser untuk Facebook...")
         
         chrome_options = Options()
@@ -287,6 +290,11 @@ class FacebookUploader:
         if self.headless:
             self._log("Mode headless diaktifkan")
         
+        if self.measure_network:
+            enable_network_log(chrome_options)
+        
+        chrome_options.page_load_strategy = self.page_load_strategy
+        
         try:
             # Get ChromeDriver path dengan error handling
             driver_path = self._get_chromedriver_path()
@@ -302,15 +310,18 @@ class FacebookUploader:
             os.environ['WDM_LOG_LEVEL'] = '0'
             os.environ['WDM_PRINT_FIRST_LINE'] = 'False'
             
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # Anti-detection script
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
-            # Setup wait
-            self.wait = WebDriverWait(self.driver, 30)
+            if self.blocked_urls:
+                apply_blocklist(driver, self.blocked_urls, log=self._log)
+            
+            metrics.BROWSER_LAUNCHES.inc(platform='facebook')
             
             self._log("Browser siap digunakan", "SUCCESS")
+            return driver
             
         except Exception as e:
             self._log(f"Gagal menyiapkan browser: {str(e)}", "ERROR")
@@ -325,30 +336,178 @@ class FacebookUploader:
             
             raise
 
-    def _find_element_by_selectors(self, selectors: list, timeout: int = 10, visible: bool = True) -> Optional[Any]:
-        """Mencari elemen menggunakan multiple selectors"""
-        for i, selector in enumerate(selectors):
+    def _setup_driver(self):
+        """Setup Chrome WebDriver untuk satu sesi upload"""
+        self.driver = self._create_driver()
+        
+        # Setup wait
+        self.wait = WebDriverWait(self.driver, 30)
+        self.waiter = PageWaiter(self.driver, log=self._log)
+
+    def enable_driver_pool(self, max_size: int = 1, max_uses: int = 25) -> DriverPool:
+        """
+        Aktifkan pool browser sehingga upload berikutnya memakai ulang browser yang sudah login
+        
+        Args:
+            max_size: Jumlah maksimum browser di pool
+            max_uses: Browser di-recycle setelah dipakai sebanyak ini
+        """
+        if not self.driver_pool:
+            self.driver_pool = DriverPool(self._create_driver, max_size=max_size, max_uses=max_uses, log=self._log)
+        return self.driver_pool
+
+    def _start_session(self) -> bool:
+        """
+        Siapkan browser untuk satu upload (baru atau dari pool) dan load cookies
+        
+        Returns:
+            True jika cookies dimuat / browser sudah login
+        """
+        self.timer.begin('driver_setup')
+        if not self.driver_pool:
+            self._setup_driver()
+            self.timer.begin('cookie_load')
+            return self.load_cookies()
+        
+        self._pooled = self.driver_pool.checkout()
+        self.driver = self._pooled.driver
+        self.wait = WebDriverWait(self.driver, 30)
+        self.waiter = PageWaiter(self.driver, log=self._log)
+        
+        if self._pooled.warm:
+            self._log("Memakai browser dari pool (sudah login)", "SUCCESS")
+            return True
+        
+        self.timer.begin('cookie_load')
+        cookies_loaded = self.load_cookies()
+        self._pooled.warm = cookies_loaded
+        return cookies_loaded
+
+    def account_id(self) -> str:
+        """Identitas akun Facebook (kunci ledger upload): cookie browser yang sedang login, selain itu file cookies"""
+        if self.driver:
             try:
-                if visible:
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                else:
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                
-                if i == 0:
-                    self._log("Elemen ditemukan", "SUCCESS")
-                else:
-                    self._log(f"Elemen ditemukan (alternatif {i+1})", "SUCCESS")
-                return element
-                
-            except TimeoutException:
-                continue
-                
+                cookie = self.driver.get_cookie('c_user')
+                if cookie and cookie.get('value'):
+                    return str(cookie['value'])
+            except Exception:
+                pass
+        return cookie_account(self.cookies_path, ['c_user'])
+
+    def _previous_upload(self, video_path: str, flow: str):
+        """
+        Cek ledger untuk video/media yang sama di akun yang sama
+        
+        Args:
+            video_path: Path file yang akan diupload
+            flow: Kunci platform di ledger ('facebook_reels' atau 'facebook_status')
+        
+        Returns:
+            (content hash, hasil upload sebelumnya atau None)
+        """
+        content_hash = self.ledger.content_hash(video_path)
+        return content_hash, self._lookup_previous(content_hash, flow)
+
+    def _lookup_previous(self, content_hash: str, flow: str) -> Optional[Dict[str, Any]]:
+        """Hasil upload sebelumnya untuk akun saat ini (None jika belum ada atau force_upload)"""
+        if self.force_upload:
+            return None
+        
+        previous = self.ledger.lookup(content_hash, flow, self.account_id())
+        if previous:
+            self._log("Video ini sudah pernah diupload ke akun yang sama, dilewati (pakai --force untuk upload ulang)", "WARNING")
+        return previous
+
+    def _end_session(self, discard: bool = False):
+        """Tutup browser, atau kembalikan ke pool jika pool aktif"""
+        if self.driver:
+            self.timer.begin('teardown')
+        self.selector_stats.save()
+        
+        if self.waiter and self.driver:
+            self._log(f"Total waktu wait: {self.waiter.total_seconds():.2f}s ({len(self.waiter.timings)} wait)", "DEBUG")
+        
+        if self._pooled:
+            self._log("Mengembalikan browser ke pool...", "DEBUG")
+            self.driver_pool.release(self._pooled, discard=discard)
+            self._pooled = None
+            self.driver = None
+            return
+        
+        if self.driver:
+            self._log("Menutup browser...")
+            try:
+                self.driver.quit()
+            except:
+                pass
+            self.driver = None
+
+    def abort(self):
+        """
+        Paksa hentikan upload yang sedang berjalan (dari thread lain): browser ditutup, dan upload yang
+        belum punya browser (membuat driver, menunggu pool) berhenti di batas fase berikutnya
+        """
+        if self.timer.cancel is not None:
+            self.timer.cancel.set()
+        driver = self.driver
+        if driver:
+            self._log("Menghentikan upload, menutup browser...", "WARNING")
+            try:
+                driver.quit()
+            except:
+                pass
+
+    def close(self):
+        """Tutup semua browser di pool"""
+        if self.driver_pool:
+            self.driver_pool.close()
+
+    def _selector_group(self, selectors: list) -> Optional[str]:
+        """Nama grup statistik untuk list selector, misalnya 'facebook.reels.next_button'"""
+        for prefix, selector_dict in (("status", self.status_selectors), ("reels", self.reels_selectors)):
+            for name, candidates in selector_dict.items():
+                if candidates is selectors:
+                    return f"facebook.{prefix}.{name}"
         return None
 
+    def _match_selectors(self, selectors: list, timeout: int = 10, visible: bool = True) -> Optional[SelectorMatch]:
+        """
+        Race semua selector dengan satu deadline bersama (satu execute_script per poll tick)
+        
+        Returns:
+            SelectorMatch berisi elemen dan index (di list asli) selector yang cocok, atau None
+        """
+        group = self._selector_group(selectors)
+        if not group:
+            return find_first_match(self.driver, selectors, timeout=timeout, visible=visible)
+        
+        # Selector dengan tingkat sukses tertinggi dicoba lebih dulu
+        ordered = self.selector_stats.order(group, selectors)
+        match = find_first_match(self.driver, ordered, timeout=timeout, visible=visible)
+        
+        if not match:
+            self.selector_stats.record(group, ordered, None)
+            metrics.observe_selector(group, None)
+            return None
+        
+        self.selector_stats.record(group, ordered, match.selector, match.seconds)
+        index = selectors.index(match.selector)
+        metrics.observe_selector(group, index)
+        return match._replace(index=index)
+
+    def _find_element_by_selectors(self, selectors: list, timeout: int = 10, visible: bool = True) -> Optional[Any]:
+        """Mencari elemen menggunakan multiple selectors"""
+        match = self._match_selectors(selectors, timeout=timeout, visible=visible)
+        if not match:
+            return None
+        
+        # Log sederhana tanpa menampilkan selector panjang
+        if match.index == 0:
+            self._log("Elemen ditemukan", "SUCCESS")
+        else:
+            self._log(f"Elemen ditemukan (alternatif {match.index+1})", "SUCCESS")
+        return match.element
+
     def check_media_upload_status(self, timeout: int = 30) -> bool:
         """
         Cek apakah media sudah berhasil diupload menggunakan selector baru
@@ -361,28 +520,29 @@ class FacebookUploader:
         """
         self._log("Mengecek status upload media...")
         
-        start_time = time.time()
+        # Cek menggunakan selector baru yang diberikan user
+        media_status_element = self.waiter.selector(
+            self.status_selectors['media_upload_status'],
+            timeout=timeout,
+            label="media diupload"
+        )
         
-        while time.time() - start_time < timeout:
-            # Cek menggunakan selector baru yang diberikan user
-            media_status_element = self._find_element_by_selectors(
-                self.status_selectors['media_upload_status'], 
-                timeout=2, 
-                visible=False
-            )
-            
-            if media_status_element:
-                # Cek apakah elemen terlihat dan memiliki konten
-                if media_status_element.is_displayed():
-                    self._log("Media berhasil diupload dan terdeteksi!", "SUCCESS")
-                    return True
-            
-            # Tunggu sebentar sebelum cek lagi
-            time.sleep(1)
+        if media_status_element:
+            self._log("Media berhasil diupload dan terdeteksi!", "SUCCESS")
+            return True
         
         self._log("Timeout menunggu konfirmasi upload media", "WARNING")
         return False
 
+    def _navigate(self, url: Optional[str] = None):
+        """Buka URL (atau refresh jika url kosong); pemanggil menunggu kondisi siap halaman sesudahnya"""
+        if self.page_load_strategy == 'none':
+            self.waiter.mark_navigation()
+        if url:
+            self.driver.get(url)
+        else:
+            self.driver.refresh()
+
     def load_cookies(self) -> bool:
         """Load cookies dari file JSON"""
         if not self.cookies_path.exists():
@@ -403,9 +563,24 @@ class FacebookUploader:
                 self._log("File cookies kosong", "WARNING")
                 return False
             
-            # Navigate ke Facebook dulu sebelum set cookies
-            self.driver.get("https://www.facebook.com")
-            time.sleep(2)
+            # Pasang semua cookies sekaligus lewat CDP, sebelum halaman apa pun dibuka
+            cookies_added = set_cookies(self.driver, cookies, '.facebook.com', log=self._log)
+            if cookies_added:
+                self._log(f"Cookies dimuat: {cookies_added}/{len(cookies)}", "SUCCESS")
+                return True
+            
+            return self._add_cookies_via_page(cookies)
+            
+        except Exception as e:
+            self._log(f"Gagal memuat cookies: {str(e)}", "ERROR")
+            return False
+
+    def _add_cookies_via_page(self, cookies: list) -> bool:
+        """Fallback tanpa CDP: buka Facebook dulu lalu add_cookie satu per satu"""
+        try:
+            self._log("CDP tidak tersedia, memuat cookies lewat halaman Facebook", "DEBUG")
+            self._navigate("https://www.facebook.com")
+            self.waiter.ready_state()
             
             # Add cookies
             cookies_added = 0
@@ -480,25 +655,24 @@ class FacebookUploader:
     def check_login_required(self) -> bool:
         """Cek apakah perlu login"""
         current_url = self.driver.current_url
-        return "login" in current_url or "checkpoint" in current_url
+        return any(keyword in current_url for keyword in self.login_keywords)
+
+    def _wait_page(self, selectors: list, label: str):
+        """Tunggu halaman siap (elemen kunci ada) atau dialihkan ke login"""
+        self.waiter.page_ready(selectors, self.login_keywords, label=label)
 
     def wait_for_login(self, timeout: int = 180):
         """Tunggu user login manual"""
         self._log("Silakan login secara manual di browser...", "WARNING")
         self._log(f"Menunggu login selesai (timeout {timeout} detik)...", "INFO")
         
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            current_url = self.driver.current_url
-            
-            # Cek apakah sudah tidak di halaman login
-            if not ("login" in current_url or "checkpoint" in current_url):
-                self._log("Login berhasil!", "SUCCESS")
-                self.save_cookies()  # Simpan cookies setelah login
-                return True
-            
-            time.sleep(2)
+        # Cek apakah sudah tidak di halaman login
+        if self.waiter.url_excludes(self.login_keywords, timeout=timeout, label="login"):
+            self._log("Login berhasil!", "SUCCESS")
+            self.save_cookies()  # Simpan cookies setelah login
+            if self._pooled:
+                self._pooled.warm = True
+            return True
         
         raise TimeoutException("Timeout menunggu login")
 
@@ -511,8 +685,18 @@ class FacebookUploader:
             media_path: Path ke file media (video/gambar)
             
         Returns:
-            Dict dengan status upload
+            Dict dengan status upload dan timing per fase (key 'timings')
         """
+        self.timer = PhaseTimer('facebook', 'upload_status', log=self._log, cancel=threading.Event())
+        self.waiter = None
+        result = self._upload_status(status_text, media_path)
+        return self._attach_timings(result)
+
+    def _attach_timings(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        wait_seconds = self.waiter.total_seconds() if self.waiter else None
+        return self.timer.attach(result, wait_seconds, self.timings_log)
+
+    def _upload_status(self, status_text: str, media_path: str) -> Dict[str, Any]:
         try:
             # Validasi input
             if not status_text.strip() and not media_path:
@@ -521,32 +705,45 @@ class FacebookUploader:
             if media_path and not os.path.exists(media_path):
                 raise FileNotFoundError(f"File media tidak ditemukan: {media_path}")
             
-            # Setup driver
-            self._setup_driver()
+            # Post status dengan media yang sama tidak dikirim ulang (status text saja tidak dicatat)
+            content_hash = None
+            if media_path:
+                content_hash, previous = self._previous_upload(media_path, 'facebook_status')
+                if previous:
+                    return previous
             
-            # Load cookies
-            cookies_loaded = self.load_cookies()
+            # Setup driver dan load cookies
+            cookies_loaded = self._start_session()
             
             # Navigate ke Facebook
+            self.timer.begin('navigation')
             self._log("Navigasi ke Facebook...")
-            self.driver.get(self.facebook_url)
-            time.sleep(3)
+            self._navigate(self.facebook_url)
+            self._wait_page(self.status_selectors['status_input'], label="halaman feed")
             
             # Cek apakah perlu login
+            self.timer.begin('login_check')
             if self.check_login_required():
                 if cookies_loaded:
                     self._log("Cookies dimuat tapi masih perlu login, refresh halaman...", "WARNING")
-                    self.driver.refresh()
-                    time.sleep(3)
+                    self._navigate()
+                    self._wait_page(self.status_selectors['status_input'], label="halaman feed")
                 
                 if self.check_login_required():
                     self.wait_for_login()
                     # Navigate ulang ke Facebook setelah login
-                    self.driver.get(self.facebook_url)
-                    time.sleep(3)
+                    self._navigate(self.facebook_url)
+                    self._wait_page(self.status_selectors['status_input'], label="halaman feed")
+            
+            # Cek ulang dengan akun yang benar-benar login (cookies bisa belum ada / basi saat cek awal)
+            if content_hash:
+                previous = self._lookup_previous(content_hash, 'facebook_status')
+                if previous:
+                    return previous
             
             # Cari input status menggunakan selector baru
             if status_text.strip():
+                self.timer.begin('caption')
                 self._log(f"Memposting status: {status_text[:50]}{'...' if len(status_text) > 50 else ''}")
                 
                 status_input = self._find_element_by_selectors(self.status_selectors['status_input'])
@@ -556,20 +753,21 @@ class FacebookUploader:
                 
                 # Klik dan masukkan text
                 status_input.click()
-                time.sleep(1)
+                self.waiter.focused(status_input)
                 
                 # Clear existing content jika ada
                 status_input.send_keys(Keys.CONTROL + "a")
                 status_input.send_keys(Keys.BACKSPACE)
-                time.sleep(0.5)
+                self.waiter.text_cleared(status_input)
                 
                 # Type status text
                 status_input.send_keys(status_text)
                 self._log("Status text berhasil dimasukkan", "SUCCESS")
-                time.sleep(2)
+                self.waiter.selector(self.status_selectors['post_button'], timeout=5, label="tombol post")
             
             # Upload media jika ada
             if media_path:
+                self.timer.begin('file_handoff')
                 self._log(f"Mengupload media: {os.path.basename(media_path)}")
                 
                 # Cari input file untuk media
@@ -581,6 +779,7 @@ class FacebookUploader:
                     self._log("Media berhasil dikirim ke input", "SUCCESS")
                     
                     # Tunggu dan cek status upload menggunakan selector baru
+                    self.timer.begin('processing_wait')
                     upload_success = self.check_media_upload_status(timeout=30)
                     
                     if upload_success:
@@ -588,11 +787,13 @@ class FacebookUploader:
                     else:
                         self._log("Media mungkin berhasil diupload tapi tidak dapat dikonfirmasi", "WARNING")
                     
-                    time.sleep(3)  # Tunggu tambahan untuk memastikan processing selesai
+                    # Tunggu tombol post siap untuk memastikan processing selesai
+                    self.waiter.selector(self.status_selectors['post_button'], timeout=5, label="tombol post")
                 else:
                     self._log("Input media tidak ditemukan, melanjutkan tanpa media", "WARNING")
             
             # Cari dan klik tombol Post
+            self.timer.begin('post')
             self._log("Mencari tombol post...")
             
             post_button = self._find_element_by_selectors(self.status_selectors['post_button'])
@@ -603,18 +804,22 @@ class FacebookUploader:
             # Klik tombol post
             post_button.click()
             self._log("Tombol post berhasil diklik!", "SUCCESS")
-            time.sleep(5)
+            self.timer.begin('confirmation')
+            self.waiter.detached_or_hidden(post_button, label="composer ditutup")
             
             # Cek apakah berhasil (kembali ke feed)
             current_url = self.driver.current_url
             if "facebook.com" in current_url and "login" not in current_url:
                 self._log("Post berhasil (kembali ke feed)", "SUCCESS")
-                return {
+                result = {
                     "success": True,
                     "message": "Status berhasil dipost",
                     "status_text": status_text,
                     "media_path": media_path
                 }
+                if content_hash:
+                    self.ledger.record(content_hash, 'facebook_status', self.account_id(), result)
+                return result
             else:
                 return {
                     "success": False,
@@ -630,6 +835,10 @@ class FacebookUploader:
             # Ambil screenshot untuk debugging
             self.take_screenshot(f"facebook_status_error_{int(time.time())}.png")
             
+            # Browser dengan state error tidak dikembalikan ke pool
+            self.timer.end(ok=False)
+            self._end_session(discard=True)
+            
             return {
                 "success": False,
                 "message": error_msg,
@@ -638,12 +847,7 @@ class FacebookUploader:
             }
         
         finally:
-            if self.driver:
-                self._log("Menutup browser...")
-                try:
-                    self.driver.quit()
-                except:
-                    pass
+            self._end_session()
 
     def upload_reels(self, video_path: str, description: str = "") -> Dict[str, Any]:
         """
@@ -654,8 +858,14 @@ class FacebookUploader:
             description: Deskripsi untuk reels
             
         Returns:
-            Dict dengan status upload
+            Dict dengan status upload dan timing per fase (key 'timings')
         """
+        self.timer = PhaseTimer('facebook', 'upload_reels', log=self._log, cancel=threading.Event())
+        self.waiter = None
+        result = self._upload_reels(video_path, description)
+        return self._attach_timings(result)
+
+    def _upload_reels(self, video_path: str, description: str) -> Dict[str, Any]:
         try:
             if not os.path.exists(video_path):
                 raise FileNotFoundError(f"File video tidak ditemukan: {video_path}")
@@ -663,31 +873,40 @@ class FacebookUploader:
             file_size = os.path.getsize(video_path) / (1024 * 1024)  # MB
             self._log(f"Mengupload reels: {os.path.basename(video_path)} ({file_size:.2f}MB)")
             
-            # Setup driver
-            self._setup_driver()
+            content_hash, previous = self._previous_upload(video_path, 'facebook_reels')
+            if previous:
+                return previous
             
-            # Load cookies
-            cookies_loaded = self.load_cookies()
+            # Setup driver dan load cookies
+            cookies_loaded = self._start_session()
             
             # Navigate ke Facebook Reels Create
+            self.timer.begin('navigation')
             self._log("Navigasi ke Facebook Reels Create...")
-            self.driver.get(self.reels_create_url)
-            time.sleep(3)
+            self._navigate(self.reels_create_url)
+            self._wait_page(self.reels_selectors['upload_input'], label="halaman reels")
             
             # Cek apakah perlu login
+            self.timer.begin('login_check')
             if self.check_login_required():
                 if cookies_loaded:
                     self._log("Cookies dimuat tapi masih perlu login, refresh halaman...", "WARNING")
-                    self.driver.refresh()
-                    time.sleep(3)
+                    self._navigate()
+                    self._wait_page(self.reels_selectors['upload_input'], label="halaman reels")
                 
                 if self.check_login_required():
                     self.wait_for_login()
                     # Navigate ulang ke reels create setelah login
-                    self.driver.get(self.reels_create_url)
-                    time.sleep(3)
+                    self._navigate(self.reels_create_url)
+                    self._wait_page(self.reels_selectors['upload_input'], label="halaman reels")
+            
+            # Cek ulang dengan akun yang benar-benar login (cookies bisa belum ada / basi saat cek awal)
+            previous = self._lookup_previous(content_hash, 'facebook_reels')
+            if previous:
+                return previous
             
             # Upload video
+            self.timer.begin('file_handoff')
             self._log("Memulai upload video reels...")
             
             upload_input = self._find_element_by_selectors(self.reels_selectors['upload_input'], visible=False)
@@ -701,8 +920,9 @@ class FacebookUploader:
             upload_input.send_keys(abs_path)
             self._log("File video berhasil dikirim ke input.", "SUCCESS")
             
-            # Tunggu processing dan navigasi
-            time.sleep(10)
+            # Tunggu processing sampai tombol Next muncul
+            self.timer.begin('processing_wait')
+            self.waiter.text_button(self.reels_button_texts['next'], timeout=60, label="tombol Next")
             
             # Klik Next button (bisa ada beberapa step)
             next_buttons_clicked = 0
@@ -712,17 +932,9 @@ class FacebookUploader:
                 try:
                     self._log(f"Mencari tombol 'Next' (step {i+1})...")
                     
-                    # Cari tombol Next dengan berbagai selector
-                    next_button = None
-                    
-                    # Coba cari berdasarkan text content
-                    buttons = self.driver.find_elements(By.TAG_NAME, "div")
-                    for button in buttons:
-                        if button.get_attribute("role") == "button":
-                            text = button.text.lower()
-                            if "next" in text or "berikutnya" in text:
-                                next_button = button
-                                break
+                    # Cari tombol Next berdasarkan teks (satu script di dalam halaman)
+                    match = find_button_by_text(self.driver, self.reels_button_texts['next'])
+                    next_button = match.element if match else None
                     
                     if not next_button:
                         # Fallback ke selector CSS
@@ -732,7 +944,7 @@ class FacebookUploader:
                         next_button.click()
                         next_buttons_clicked += 1
                         self._log(f"Tombol 'Next' berhasil diklik (index {next_buttons_clicked})!", "SUCCESS")
-                        time.sleep(3)
+                        self.waiter.dom_stable(label="step berikutnya")
                     else:
                         self._log(f"Tombol 'Next' tidak ditemukan atau tidak enabled pada step {i+1}", "INFO")
                         break
@@ -743,13 +955,14 @@ class FacebookUploader:
             
             # Tambahkan deskripsi jika ada
             if description.strip():
+                self.timer.begin('caption')
                 self._log("Menambahkan deskripsi...")
                 
                 desc_input = self._find_element_by_selectors(self.reels_selectors['description_input'], timeout=5)
                 
                 if desc_input:
                     desc_input.click()
-                    time.sleep(0.5)
+                    self.waiter.focused(desc_input)
                     desc_input.send_keys(Keys.CONTROL + "a")
                     desc_input.send_keys(Keys.BACKSPACE)
                     desc_input.send_keys(description)
@@ -758,18 +971,12 @@ class FacebookUploader:
                     self._log("Input deskripsi tidak ditemukan", "WARNING")
             
             # Klik Publish button
+            self.timer.begin('post')
             self._log("Mencari tombol 'Publish'...")
             
-            publish_button = None
-            
-            # Coba cari berdasarkan text content
-            buttons = self.driver.find_elements(By.TAG_NAME, "div")
-            for button in buttons:
-                if button.get_attribute("role") == "button":
-                    text = button.text.lower()
-                    if "publish" in text or "terbitkan" in text:
-                        publish_button = button
-                        break
+            # Cari tombol Publish berdasarkan teks (satu script di dalam halaman)
+            match = find_button_by_text(self.driver, self.reels_button_texts['publish'], timeout=5)
+            publish_button = match.element if match else None
             
             if not publish_button:
                 # Fallback ke selector CSS
@@ -782,16 +989,19 @@ class FacebookUploader:
             publish_button.click()
             publish_buttons_clicked = 1
             self._log(f"Tombol 'Publish' berhasil diklik (index {publish_buttons_clicked})!", "SUCCESS")
-            time.sleep(5)
+            self.timer.begin('confirmation')
+            self.waiter.detached_or_hidden(publish_button, label="publish selesai")
             
             self._log("Upload video reels berhasil!", "SUCCESS")
             
-            return {
+            result = {
                 "success": True,
                 "message": "Reels berhasil diupload",
                 "video_path": video_path,
                 "description": description
             }
+            self.ledger.record(content_hash, 'facebook_reels', self.account_id(), result)
+            return result
                 
         except Exception as e:
             error_msg = f"Upload reels gagal: {str(e)}"
@@ -800,6 +1010,10 @@ class FacebookUploader:
             # Ambil screenshot untuk debugging
             self.take_screenshot(f"facebook_reels_error_{int(time.time())}.png")
             
+            # Browser dengan state error tidak dikembalikan ke pool
+            self.timer.end(ok=False)
+            self._end_session(discard=True)
+            
             return {
                 "success": False,
                 "message": error_msg,
@@ -808,12 +1022,7 @@ class FacebookUploader:
             }
         
         finally:
-            if self.driver:
-                self._log("Menutup browser...")
-                try:
-                    self.driver.quit()
-                except:
-                    pass
+            self._end_session()
 
     def take_screenshot(self, filename: str = None):
         """Ambil screenshot untuk debugging"""
@@ -907,10 +1116,18 @@ def main():
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--clear-cookies", action="store_true", help="Hapus cookies")
     parser.add_argument("--check-cookies", action="store_true", help="Cek status cookies")
+    parser.add_argument("--offline-driver", action="store_true", help="Resolusi ChromeDriver tanpa akses network")
+    parser.add_argument("--force", action="store_true", help="Upload ulang walaupun video sudah pernah diupload")
+    parser.add_argument("--block-requests", action="store_true", help="Blokir analytics, iklan, font dan preview media di browser")
+    parser.add_argument("--page-load-strategy", choices=['normal', 'eager', 'none'], default='normal',
+                        help="Strategi load halaman; eager/none lanjut begitu elemen kunci halaman ada")
+    parser.add_argument("--timings-log", help="Tulis timing per fase setiap upload ke file JSON lines")
     
     args = parser.parse_args()
     
-    uploader = FacebookUploader(headless=args.headless, debug=args.debug)
+    uploader = FacebookUploader(headless=args.headless, debug=args.debug, offline_driver=args.offline_driver,
+                               force_upload=args.force, block_requests=args.block_requests,
+                               page_load_strategy=args.page_load_strategy, timings_log=args.timings_log)
     
     # Handle different actions
     if args.clear_cookies:
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Fake YouTube Server - Tiruan lokal YouTube Data API v3 untuk benchmark upload tanpa memakai quota
+Meniru protokol resumable videos.insert, channels.list dan endpoint token OAuth,
+dengan bandwidth, latency dan ack chunk yang bisa diatur
+"""
+
+import json
+import time
+import uuid
+import socket
+import struct
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+from colorama import init, Fore
+import argparse
+
+# Initialize colorama
+init(autoreset=True)
+
+UPLOAD_PATH = "/upload/youtube/v3/videos"
+CHANNELS_PATH = "/youtube/v3/channels"
+TOKEN_PATH = "/token"
+STATS_PATH = "/_fake/stats"
+FAULTS_PATH = "/_fake/faults"
+
+# Server resumable Google hanya mengakui byte dalam kelipatan 256 KiB (kecuali chunk terakhir)
+ACK_ALIGNMENT = 256 * 1024
+
+DEFAULT_CONFIG = {
+    "latency": 0.0,             # Delay sebelum setiap response (detik), meniru round trip
+    "bandwidth": 0,             # Batas kecepatan terima body (bytes/detik, 0 = tanpa batas)
+    "ack_ratio": 1.0,           # Fraksi chunk yang diakui per PUT (<1 = server menyimpan sebagian, sisanya dikirim ulang)
+    "token_lifetime": 3600,     # Umur access token dari endpoint token (detik)
+    "require_auth": True,       # Tolak request tanpa access token yang diterbitkan server ini (401)
+    "faults": []                # Skrip fault per session upload, lihat FAULT_KINDS
+}
+
+# Fault yang bisa disuntikkan ke PUT chunk. Setiap fault: {"kind": ..., "after": chunk sukses sebelum fault
+# aktif (default 0), "count": berapa PUT berturut-turut yang kena (default 1), "status": untuk kind status,
+# "seconds": lama server diam untuk kind timeout}
+FAULT_KINDS = ("status", "quota", "rate_limit", "reset", "timeout")
+
+
+class FakeYouTubeServer:
+    def __init__(self, port: int = 0, config: Optional[Dict[str, Any]] = None,
+                 log: Optional[Callable[[str, str], None]] = None):
+        """
+        Initialize Fake YouTube Server
+
+        Args:
+            port: Port lokal (0 = pilih port bebas)
+            config: Override DEFAULT_CONFIG (latency, bandwidth, ack_ratio, ...)
+            log: Fungsi logging (message, level)
+        """
+        self.config = dict(DEFAULT_CONFIG, **(config or {}))
+        self._log_fn = log
+        self._lock = threading.Lock()
+        self._tokens = set()
+        self.sessions: Dict[str, Dict[str, Any]] = {}
+        self.videos: Dict[str, Dict[str, Any]] = {}
+        self.stats: Dict[str, int] = {}
+        self.reset_stats()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    @property
+    def api_root(self) -> str:
+        """Nilai untuk YouTubeAPIUploader(api_root=...)"""
+        return f"{self.base_url}/"
+
+    @property
+    def token_uri(self) -> str:
+        """Nilai token_uri di file token OAuth"""
+        return f"{self.base_url}{TOKEN_PATH}"
+
+    def reset_stats(self):
+        """Reset counter request (dipanggil di antara run benchmark)"""
+        with self._lock:
+            self.stats = {
+                "requests": 0,
+                "token_requests": 0,
+                "sessions": 0,
+                "chunks": 0,
+                "status_queries": 0,
+                "bytes_received": 0,
+                "bytes_acked": 0,
+                "unauthorized": 0,
+                "faults": 0
+            }
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _log(self, message: str, level: str = "DEBUG"):
+        if self._log_fn:
+            self._log_fn(message, level)
+
+    def issue_token(self) -> Dict[str, Any]:
+        token = f"fake-{uuid.uuid4().hex}"
+        with self._lock:
+            self._tokens.add(token)
+        self._count("token_requests")
+        return {"access_token": token, "expires_in": self.config["token_lifetime"], "token_type": "Bearer"}
+
+    def authorized(self, header: Optional[str]) -> bool:
+        if not self.config["require_auth"]:
+            return True
+        token = (header or "").replace("Bearer ", "", 1)
+        with self._lock:
+            return token in self._tokens
+
+    def start_session(self, metadata: Dict[str, Any], total: Optional[int]) -> str:
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self.sessions[upload_id] = {"metadata": metadata, "total": total, "received": 0,
+                                        "sha256": hashlib.sha256(), "chunks_ok": 0,
+                                        "faults": [dict(fault) for fault in self.config["faults"]]}
+        self._count("sessions")
+        return upload_id
+
+    def set_faults(self, faults: List[Dict[str, Any]]):
+        """Ganti skrip fault untuk session upload berikutnya"""
+        for fault in faults:
+            if fault.get("kind") not in FAULT_KINDS:
+                raise ValueError(f"Fault tidak dikenal: {fault.get('kind')} (pilihan: {', '.join(FAULT_KINDS)})")
+        self.config["faults"] = list(faults)
+
+    def next_fault(self, session: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Fault pertama dalam skrip yang aktif untuk PUT chunk ini (None = proses normal)"""
+        with self._lock:
+            for fault in session["faults"]:
+                if fault.get("count", 1) > 0 and session["chunks_ok"] >= fault.get("after", 0):
+                    fault["count"] = fault.get("count", 1) - 1
+                    self.stats["faults"] += 1
+                    return fault
+        return None
+
+    def ack_end(self, start: int, length: int) -> int:
+        """Offset akhir (eksklusif) yang diakui dari chunk [start, start+length)"""
+        if self.config["ack_ratio"] >= 1:
+            return start + length
+        acked = int(length * self.config["ack_ratio"]) // ACK_ALIGNMENT * ACK_ALIGNMENT
+        # Potongan terakhir yang lebih kecil dari 256 KiB diterima utuh supaya upload tetap bisa selesai
+        return start + (acked or length)
+
+    def finish_video(self, session: Dict[str, Any]) -> Dict[str, Any]:
+        video_id = uuid.uuid4().hex[:11]
+        video = {
+            "kind": "youtube#video",
+            "id": video_id,
+            "snippet": session["metadata"].get("snippet", {}),
+            "status": dict(session["metadata"].get("status", {}), uploadStatus="uploaded"),
+            "fileDetails": {"fileSize": str(session["received"]), "sha256": session["sha256"].hexdigest()}
+        }
+        with self._lock:
+            self.videos[video_id] = video
+        return video
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _send_json(self, status: int, payload: Optional[Dict[str, Any]] = None,
+                           headers: Optional[Dict[str, str]] = None):
+                data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+                if server.config["latency"]:
+                    time.sleep(server.config["latency"])
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if payload is not None:
+                    self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _error(self, status: int, reason: str, message: str):
+                self._send_json(status, {"error": {"code": status, "message": message,
+                                                   "errors": [{"reason": reason, "message": message}]}})
+
+            def _read_body(self, on_block: Optional[Callable[[bytes], None]] = None,
+                           limit: Optional[int] = None) -> bytes:
+                """Baca body per blok (atau hanya limit bytes pertama), dibatasi config bandwidth"""
+                remaining = int(self.headers.get("Content-Length") or 0)
+                if limit is not None:
+                    remaining = min(remaining, limit)
+                bandwidth = server.config["bandwidth"]
+                start = time.perf_counter()
+                received = 0
+                blocks = []
+                while remaining > 0:
+                    block = self.rfile.read(min(remaining, 64 * 1024))
+                    if not block:
+                        break
+                    remaining -= len(block)
+                    received += len(block)
+                    if on_block:
+                        on_block(block)
+                    else:
+                        blocks.append(block)
+                    if bandwidth:
+                        ahead = received / bandwidth - (time.perf_counter() - start)
+                        if ahead > 0:
+                            time.sleep(ahead)
+                server._count("bytes_received", received)
+                return b"".join(blocks)
+
+            def _discard_body(self):
+                self._read_body(on_block=lambda block: None)
+
+            def _inject(self, fault: Dict[str, Any]):
+                kind = fault["kind"]
+                server._log(f"fake-youtube: fault {kind}", "DEBUG")
+                if kind == "reset":
+                    # Putus di tengah chunk: baca setengah body lalu tutup dengan RST
+                    self._read_body(on_block=lambda block: None,
+                                    limit=int(self.headers.get("Content-Length") or 0) // 2)
+                    self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+                    self.close_connection = True
+                    return
+                self._discard_body()
+                if kind == "timeout":
+                    # Tidak ada response sampai client menyerah
+                    time.sleep(fault.get("seconds", 30))
+                    self.close_connection = True
+                elif kind == "quota":
+                    self._error(403, "quotaExceeded", "The request cannot be completed because you have exceeded your quota.")
+                elif kind == "rate_limit":
+                    self._error(403, "rateLimitExceeded", "The request rate is too high.")
+                else:
+                    self._error(fault.get("status", 503), "backendError", "Backend Error")
+
+            def _check_auth(self) -> bool:
+                if server.authorized(self.headers.get("Authorization")):
+                    return True
+                self._discard_body()
+                server._count("unauthorized")
+                self._error(401, "authError", "Invalid Credentials")
+                return False
+
+            def do_POST(self):
+                server._count("requests")
+                url = urlparse(self.path)
+                if url.path == TOKEN_PATH:
+                    self._read_body()
+                    self._send_json(200, server.issue_token())
+                    return
+                if url.path == FAULTS_PATH:
+                    try:
+                        server.set_faults(json.loads(self._read_body() or b"[]"))
+                    except ValueError as e:
+                        self._error(400, "badRequest", str(e))
+                        return
+                    self._send_json(200, {"faults": server.config["faults"]})
+                    return
+                if url.path != UPLOAD_PATH:
+                    self._error(404, "notFound", "Not Found")
+                    return
+                if not self._check_auth():
+                    return
+                if parse_qs(url.query).get("uploadType") != ["resumable"]:
+                    self._discard_body()
+                    self._error(400, "badRequest", "Hanya uploadType=resumable yang didukung")
+                    return
+
+                body = self._read_body()
+                metadata = json.loads(body or b"{}")
+                total = self.headers.get("X-Upload-Content-Length")
+                upload_id = server.start_session(metadata, int(total) if total else None)
+                self._send_json(200, headers={"Location": f"{server.base_url}{UPLOAD_PATH}?uploadType=resumable&upload_id={upload_id}"})
+
+            def do_PUT(self):
+                server._count("requests")
+                url = urlparse(self.path)
+                upload_id = (parse_qs(url.query).get("upload_id") or [""])[0]
+                with server._lock:
+                    session = server.sessions.get(upload_id)
+                if url.path != UPLOAD_PATH or session is None:
+                    self._discard_body()
+                    self._error(404, "notFound", "Upload session tidak ditemukan")
+                    return
+                if not self._check_auth():
+                    return
+
+                # Content-Range: "bytes start-end/total" (chunk) atau "bytes */total" (query offset)
+                content_range = self.headers.get("Content-Range", "bytes */*")
+                span, _, total = content_range.replace("bytes ", "", 1).partition("/")
+                if total not in ("", "*"):
+                    session["total"] = int(total)
+
+                if span == "*":
+                    self._discard_body()
+                    server._count("status_queries")
+                else:
+                    fault = server.next_fault(session)
+                    if fault:
+                        self._inject(fault)
+                        return
+                    start = int(span.split("-")[0])
+                    received = session["received"]
+                    chunk = self._read_body()
+                    server._count("chunks")
+                    if start > received:
+                        self._error(400, "badContent", f"Chunk mulai dari {start}, server baru menerima {received}")
+                        return
+                    # Byte yang sudah diakui sebelumnya dibuang (chunk dikirim ulang)
+                    fresh = chunk[received - start:]
+                    acked_end = server.ack_end(received, len(fresh))
+                    session["sha256"].update(fresh[:acked_end - received])
+                    session["received"] = acked_end
+                    session["chunks_ok"] += 1
+                    server._count("bytes_acked", acked_end - received)
+
+                if session["total"] is not None and session["received"] >= session["total"]:
+                    with server._lock:
+                        server.sessions.pop(upload_id, None)
+                    self._send_json(200, server.finish_video(session))
+                    return
+
+                headers = {"Range": f"bytes=0-{session['received'] - 1}"} if session["received"] else {}
+                self._send_json(308, headers=headers)
+
+            def do_GET(self):
+                server._count("requests")
+                url = urlparse(self.path)
+                if url.path == STATS_PATH:
+                    # Endpoint kontrol untuk benchmark yang menjalankan server di proses terpisah
+                    with server._lock:
+                        stats = dict(server.stats)
+                    self._send_json(200, stats)
+                    return
+                if url.path != CHANNELS_PATH:
+                    self._error(404, "notFound", "Not Found")
+                    return
+                if not self._check_auth():
+                    return
+                with server._lock:
+                    video_count = len(server.videos)
+                self._send_json(200, {
+                    "kind": "youtube#channelListResponse",
+                    "items": [{
+                        "kind": "youtube#channel",
+                        "id": "UCfakechannel000000000000",
+                        "snippet": {"title": "Fake Channel"},
+                        "statistics": {"subscriberCount": "0", "videoCount": str(video_count), "viewCount": "0"}
+                    }]
+                })
+
+            def log_message(self, format: str, *args):
+                server._log(f"fake-youtube: {format % args}")
+
+        return Handler
+
+    def start(self) -> "FakeYouTubeServer":
+        """Jalankan server di thread daemon"""
+        if not self._thread:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-youtube-server", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread = None
+
+    def __enter__(self) -> "FakeYouTubeServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    """Main function untuk CLI"""
+    parser = argparse.ArgumentParser(description="Server tiruan YouTube Data API (videos.insert resumable, channels.list, token OAuth)")
+    parser.add_argument("--port", type=int, default=8766, help="Port lokal")
+    parser.add_argument("--latency", type=float, default=DEFAULT_CONFIG["latency"], help="Delay per response (detik)")
+    parser.add_argument("--bandwidth", type=float, default=0, help="Batas bandwidth upload (MB/detik, 0 = tanpa batas)")
+    parser.add_argument("--ack-ratio", type=float, default=DEFAULT_CONFIG["ack_ratio"], help="Fraksi chunk yang diakui per PUT")
+    parser.add_argument("--faults", type=json.loads, default=[], help='Skrip fault JSON, misalnya \'[{"kind": "status", "status": 503, "after": 1, "count": 3}]\'')
+
+    args = parser.parse_args()
+
+    server = FakeYouTubeServer(args.port, {
+        "latency": args.latency,
+        "bandwidth": int(args.bandwidth * 1024 * 1024),
+        "ack_ratio": args.ack_ratio
+    })
+    server.set_faults(args.faults)
+    print(f"{Fore.CYAN}ℹ️ api_root : {server.api_root}")
+    print(f"{Fore.CYAN}ℹ️ token_uri: {server.token_uri}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Fault Injection - Jalankan loop retry upload YouTube melewati kegagalan yang diskrip
+(badai 5xx, timeout, connection reset di tengah chunk, rate limit, quota 403) di fake_youtube_server,
+lalu bandingkan time-to-success / time-to-failure loop retry lama dengan RetryPolicy
+"""
+
+import json
+import socket
+import tempfile
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httplib2
+from colorama import init, Fore, Style
+import argparse
+
+from fake_youtube_server import FAULTS_PATH
+from retry_policy import RetryPolicy, SERVER, NETWORK, UNKNOWN
+from youtube_benchmark import MB, start_server_process, make_uploader, make_video
+
+# Initialize colorama
+init(autoreset=True)
+
+# Loop retry sebelum RetryPolicy: 5xx dan semua exception non-HTTP di-retry 3x dengan delay 2, 4, 8 detik
+# tanpa jitter; error HTTP lain (termasuk rate limit 403/429) langsung gagal
+LEGACY_POLICY = RetryPolicy(max_retries=3, base_delays={SERVER: 1.0, NETWORK: 1.0, UNKNOWN: 1.0},
+                            max_delay=8.0, jitter=False, retryable=frozenset({SERVER, NETWORK, UNKNOWN}))
+
+POLICIES = {
+    "lama": LEGACY_POLICY,
+    "policy": RetryPolicy()
+}
+
+
+def scenarios(timeout: float) -> Dict[str, List[Dict[str, Any]]]:
+    """Skrip fault per skenario; semua mulai setelah chunk pertama di-ack"""
+    return {
+        "5xx-storm": [{"kind": "status", "status": 503, "after": 1, "count": 3}],
+        "5xx-long-storm": [{"kind": "status", "status": 503, "after": 1, "count": 5}],
+        "timeouts": [{"kind": "timeout", "after": 1, "count": 2, "seconds": timeout + 1}],
+        "resets": [{"kind": "reset", "after": 1, "count": 3}],
+        "rate-limit": [{"kind": "rate_limit", "after": 1, "count": 2}],
+        "quota": [{"kind": "quota", "after": 1}],
+        "mixed": [{"kind": "reset", "after": 1},
+                  {"kind": "status", "status": 502, "after": 1, "count": 2},
+                  {"kind": "timeout", "after": 1, "seconds": timeout + 1}]
+    }
+
+
+def set_faults(base_url: str, faults: List[Dict[str, Any]]):
+    resp, content = httplib2.Http().request(base_url + FAULTS_PATH, "POST", body=json.dumps(faults),
+                                            headers={"Content-Type": "application/json"})
+    if resp.status != 200:
+        raise ValueError(f"Gagal mengatur fault: {content.decode('utf-8', 'ignore')}")
+
+
+def fresh_state(uploader, workdir: Path, run: int):
+    """Quota ledger dan session store baru: quota 403 menandai ledger habis, upload gagal menyimpan session"""
+    from quota_ledger import QuotaLedger
+    from resumable_upload import UploadSessionStore
+
+    uploader.quota.close()
+    uploader.quota = QuotaLedger("fault-injection", workdir / f"youtube_quota_{run}.db", daily_limit=10 ** 9)
+    uploader.upload_sessions = UploadSessionStore(workdir / f"youtube_upload_sessions_{run}.json", log=uploader._log)
+
+
+def run_once(uploader, video: str, chunk_mb: float, time_scale: float) -> Dict[str, Any]:
+    start = time.perf_counter()
+    result = uploader.upload_video(video, "Fault injection", chunk_size=int(chunk_mb * MB))
+    seconds = time.perf_counter() - start
+    sleep_seconds = result.get("timings", {}).get("sleep_seconds", 0.0)
+    return {
+        "success": bool(result.get("success")),
+        "message": result.get("message"),
+        "seconds": seconds,
+        # Backoff dan durasi jika delay tidak diperkecil --time-scale
+        "sleep_seconds": sleep_seconds / time_scale,
+        "projected_seconds": seconds - sleep_seconds + sleep_seconds / time_scale
+    }
+
+
+def summarize(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    ok = [s["projected_seconds"] for s in samples if s["success"]]
+    failed = [s["projected_seconds"] for s in samples if not s["success"]]
+    return {
+        "runs": len(samples),
+        "success": len(ok),
+        "time_to_success": statistics.median(ok) if ok else None,
+        "time_to_failure": statistics.median(failed) if failed else None,
+        "sleep_seconds": statistics.median(s["sleep_seconds"] for s in samples),
+        "messages": sorted({s["message"] for s in samples if not s["success"]})
+    }
+
+
+def _seconds(value: Optional[float]) -> str:
+    return f"{value:8.2f}s" if value is not None else f"{'-':>9}"
+
+
+def verdict(legacy: Dict[str, Any], policy: Dict[str, Any]) -> str:
+    if policy["success"] > legacy["success"]:
+        return f"{Fore.GREEN}lebih banyak sukses{Style.RESET_ALL}"
+    if policy["success"] < legacy["success"]:
+        return f"{Fore.RED}lebih sedikit sukses{Style.RESET_ALL}"
+    key = "time_to_success" if policy["success"] else "time_to_failure"
+    if legacy[key] is None or policy[key] is None:
+        return ""
+    saved = legacy[key] - policy[key]
+    color = Fore.GREEN if saved > 0 else (Fore.RED if saved < 0 else Fore.WHITE)
+    return f"{color}{saved:+.2f}s ({key.replace('_', '-')}){Style.RESET_ALL}"
+
+
+def main():
+    """Main function untuk CLI"""
+    parser = argparse.ArgumentParser(description="Fault injection untuk loop retry upload YouTube")
+    parser.add_argument("--scenario", action="append", help="Skenario (default: semua): " + ", ".join(scenarios(0)))
+    parser.add_argument("--runs", type=int, default=5, help="Jumlah run per skenario per policy (jitter acak)")
+    parser.add_argument("--size", type=float, default=8, help="Ukuran file video (MB)")
+    parser.add_argument("--chunk-size", type=float, default=1, help="Ukuran chunk awal (MB)")
+    parser.add_argument("--timeout", type=float, default=2.0, help="Timeout socket client (detik)")
+    parser.add_argument("--time-scale", type=float, default=0.1, help="Faktor pengali delay backoff supaya harness cepat; hasil diproyeksikan ke skala penuh")
+    parser.add_argument("--report", help="Tulis hasil ke file JSON")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+
+    args = parser.parse_args()
+    all_scenarios = scenarios(args.timeout)
+    names = args.scenario or list(all_scenarios)
+    unknown = [name for name in names if name not in all_scenarios]
+    if unknown:
+        parser.error(f"Skenario tidak dikenal: {', '.join(unknown)}")
+
+    process, base_url = start_server_process({})
+    # Setelah fork server: timeout hanya berlaku untuk socket client proses ini
+    socket.setdefaulttimeout(args.timeout)
+    results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    try:
+        with tempfile.TemporaryDirectory(prefix="sosmd-faults-") as tmp:
+            workdir = Path(tmp)
+            uploader = make_uploader(base_url, workdir, debug=args.debug)
+            if not uploader.initialize_youtube_service():
+                print(f"{Fore.RED}❌ Tidak bisa terhubung ke fake server {base_url}")
+                return
+            video = make_video(workdir, args.size)
+
+            run = 0
+            for name in names:
+                set_faults(base_url, all_scenarios[name])
+                results[name] = {}
+                for policy_name, policy in POLICIES.items():
+                    print(f"{Fore.CYAN}▶ {name} ({policy_name})")
+                    uploader.retry_policy = policy.scaled(args.time_scale)
+                    samples = []
+                    for _ in range(args.runs):
+                        run += 1
+                        fresh_state(uploader, workdir, run)
+                        samples.append(run_once(uploader, video, args.chunk_size, args.time_scale))
+                    results[name][policy_name] = summarize(samples)
+            uploader.quota.close()
+            uploader.ledger.close()
+    finally:
+        process.terminate()
+        process.join()
+
+    print(f"\n{Fore.MAGENTA}💥 Fault injection ({args.runs} run, median, backoff diproyeksikan ke skala penuh, "
+          f"timeout client {args.timeout:g}s)")
+    print(f"{'Skenario':<16}{'Policy':<8}{'sukses':>8}{'to-success':>12}{'to-failure':>12}{'sleep':>10}  selisih")
+    for name, by_policy in results.items():
+        legacy, policy = by_policy["lama"], by_policy["policy"]
+        for policy_name, summary in by_policy.items():
+            diff = verdict(legacy, policy) if policy_name == "policy" else ""
+            print(f"{name if policy_name == 'lama' else '':<16}{policy_name:<8}"
+                  f"{summary['success']:>5}/{summary['runs']:<2}{_seconds(summary['time_to_success']):>12}"
+                  f"{_seconds(summary['time_to_failure']):>12}{summary['sleep_seconds']:9.2f}s  {diff}")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({"time_scale": args.time_scale, "timeout": args.timeout, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Job Queue - Antrian upload persisten berbasis SQLite
+Setiap video adalah satu job dengan sub-job per platform, sehingga setelah crash
+hanya platform yang belum selesai yang dijalankan ulang
+"""
+
+import os
+import json
+import time
+import socket
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from colorama import init, Fore, Style
+
+# Initialize colorama
+init(autoreset=True)
+
+DEFAULT_DB_PATH = Path(__file__).parent / "jobs" / "upload_jobs.db"
+
+# State sub-job
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# Proses yang menjalankan sub-job memperbarui heartbeat secara berkala; sub-job 'running' yang
+# heartbeat-nya lebih tua dari lease dianggap milik proses yang sudah mati
+HEARTBEAT_INTERVAL = 30
+LEASE_SECONDS = 120
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    video_path TEXT NOT NULL,
+    params TEXT NOT NULL,
+    source TEXT UNIQUE,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sub_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL REFERENCES jobs(id),
+    platform TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    result TEXT,
+    started_at REAL,
+    finished_at REAL,
+    owner TEXT,
+    heartbeat_at REAL,
+    UNIQUE (job_id, platform)
+);
+CREATE INDEX IF NOT EXISTS idx_sub_jobs_state ON sub_jobs(state);
+"""
+
+
+def job_key(video_path: str, platforms: List[str], params: Dict[str, Any]) -> str:
+    """
+    Kunci unik job dari isinya (path absolut video, platform dan parameter), bukan dari posisi baris
+    di manifest, supaya manifest yang diedit tidak memetakan baris baru ke job lama
+    """
+    raw = json.dumps({"video": os.path.abspath(video_path), "platforms": sorted(platforms), "params": params},
+                     sort_keys=True, ensure_ascii=False)
+    return "sha256:" + hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def call_platform(uploader: Any, platform: str, video_path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Panggil entry point upload SocialMediaUploader untuk satu platform"""
+    if platform == 'tiktok':
+        return uploader.upload_to_tiktok(video_path, params.get("tiktok_caption", "#fyp #viral #trending"))
+    if platform == 'facebook_reels':
+        return uploader.upload_to_facebook_reels(video_path, params.get("facebook_description", ""))
+    if platform == 'youtube_shorts':
+        return uploader.upload_to_youtube_shorts(
+            video_path,
+            params.get("youtube_title", ""),
+            params.get("youtube_description", ""),
+            params.get("youtube_privacy", "public")
+        )
+    raise ValueError(f"Platform tidak dikenal: {platform}")
+
+
+class JobQueue:
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH, max_attempts: int = 3):
+        """
+        Initialize Job Queue
+
+        Args:
+            db_path: Path database SQLite
+            max_attempts: Sub-job yang gagal sebanyak ini tidak dicoba lagi
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+
+        # Identitas proses ini sebagai pemilik sub-job yang sedang dijalankan
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+    def _migrate(self):
+        """Tambahkan kolom owner/heartbeat ke database antrian versi lama"""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(sub_jobs)")}
+        for column, kind in (("owner", "TEXT"), ("heartbeat_at", "REAL")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE sub_jobs ADD COLUMN {column} {kind}")
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        with self._lock:
+            return self._conn.execute(sql, params)
+
+    def enqueue(self, video_path: str, platforms: List[str], params: Dict[str, Any],
+                source: Optional[str] = None) -> int:
+        """
+        Tambahkan job baru (atau kembalikan job lama dengan source yang sama)
+
+        Args:
+            video_path: Path file video
+            platforms: Platform tujuan, misalnya ['tiktok', 'youtube_shorts']
+            params: Caption/title/privacy per platform
+            source: Kunci unik job (lihat job_key) untuk mencegah duplikat
+
+        Returns:
+            ID job
+        """
+        with self._lock:
+            if source:
+                row = self._conn.execute("SELECT id FROM jobs WHERE source = ?", (source,)).fetchone()
+                if row:
+                    return row["id"]
+
+            self._conn.execute("BEGIN")
+            try:
+                cursor = self._conn.execute(
+                    "INSERT INTO jobs (video_path, params, source, created_at) VALUES (?, ?, ?, ?)",
+                    (video_path, json.dumps(params, ensure_ascii=False), source, time.time())
+                )
+                job_id = cursor.lastrowid
+                self._conn.executemany(
+                    "INSERT INTO sub_jobs (job_id, platform, state) VALUES (?, ?, ?)",
+                    [(job_id, platform, PENDING) for platform in platforms]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return job_id
+
+    def reset_interrupted(self) -> int:
+        """
+        Sub-job 'running' dari proses yang mati (heartbeat lebih tua dari LEASE_SECONDS) dikembalikan ke 'pending';
+        sub-job milik proses lain yang masih hidup tidak disentuh
+        """
+        cursor = self._execute(
+            "UPDATE sub_jobs SET state = ?, owner = NULL, last_error = 'Terputus (proses berhenti)' "
+            "WHERE state = ? AND COALESCE(heartbeat_at, started_at, 0) < ?",
+            (PENDING, RUNNING, time.time() - LEASE_SECONDS)
+        )
+        return cursor.rowcount
+
+    def _heartbeat_loop(self):
+        while not self._heartbeat_stop.wait(HEARTBEAT_INTERVAL):
+            try:
+                self._execute("UPDATE sub_jobs SET heartbeat_at = ? WHERE state = ? AND owner = ?",
+                              (time.time(), RUNNING, self.owner))
+            except sqlite3.Error:
+                pass
+
+    def _start_heartbeat(self):
+        with self._lock:
+            if self._heartbeat_thread is None:
+                self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="job-heartbeat", daemon=True)
+                self._heartbeat_thread.start()
+
+    def unfinished_jobs(self) -> Iterator[int]:
+        """ID job yang masih punya sub-job pending atau gagal dengan sisa attempt"""
+        last_id = 0
+        while True:
+            row = self._execute(
+                "SELECT DISTINCT job_id FROM sub_jobs WHERE job_id > ? AND "
+                "(state = ? OR (state = ? AND attempts < ?)) ORDER BY job_id LIMIT 1",
+                (last_id, PENDING, FAILED, self.max_attempts)
+            ).fetchone()
+            if not row:
+                return
+            last_id = row["job_id"]
+            yield last_id
+
+    def _unfinished_sub_jobs(self, job_id: int) -> List[sqlite3.Row]:
+        return self._execute(
+            "SELECT * FROM sub_jobs WHERE job_id = ? AND (state = ? OR (state = ? AND attempts < ?)) ORDER BY id",
+            (job_id, PENDING, FAILED, self.max_attempts)
+        ).fetchall()
+
+    def _claim(self, sub_job_id: int) -> bool:
+        self._start_heartbeat()
+        now = time.time()
+        cursor = self._execute(
+            "UPDATE sub_jobs SET state = ?, attempts = attempts + 1, started_at = ?, owner = ?, heartbeat_at = ? "
+            "WHERE id = ? AND state IN (?, ?)",
+            (RUNNING, now, self.owner, now, sub_job_id, PENDING, FAILED)
+        )
+        return cursor.rowcount == 1
+
+    def _finish(self, sub_job_id: int, result: Dict[str, Any]):
+        if result.get("deferred"):
+            # Ditunda (misalnya quota habis): kembali ke antrian tanpa menghabiskan attempt
+            self._execute(
+                "UPDATE sub_jobs SET state = ?, attempts = attempts - 1, last_error = ? WHERE id = ?",
+                (PENDING, result.get("message"), sub_job_id)
+            )
+            return
+
+        success = bool(result.get("success"))
+        self._execute(
+            "UPDATE sub_jobs SET state = ?, result = ?, last_error = ?, finished_at = ? WHERE id = ?",
+            (
+                DONE if success else FAILED,
+                json.dumps(result, ensure_ascii=False, default=str),
+                None if success else result.get("message"),
+                time.time(),
+                sub_job_id
+            )
+        )
+
+    def run_job(self, job_id: int, uploader: Any, parallel: bool = False,
+                timeouts: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Jalankan semua sub-job yang belum selesai untuk satu job
+
+        Args:
+            job_id: ID job
+            uploader: SocialMediaUploader
+            parallel: Jalankan sub-job bersamaan lewat upload_to_all_video_platforms
+            timeouts: Batas waktu per platform dalam detik (mode paralel)
+
+        Returns:
+            Dict hasil dengan format sama seperti baris bulk upload
+        """
+        job = self._execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if not job:
+            raise ValueError(f"Job tidak ditemukan: {job_id}")
+        params = json.loads(job["params"])
+
+        if parallel:
+            return self._outcome(job, self._run_parallel(job, params, uploader, timeouts))
+
+        results = {}
+        for sub_job in self._unfinished_sub_jobs(job_id):
+            if not self._claim(sub_job["id"]):
+                continue
+
+            start = time.time()
+            try:
+                result = call_platform(uploader, sub_job["platform"], job["video_path"], params)
+            except Exception as e:
+                result = {"success": False, "message": str(e)}
+            result.setdefault("elapsed_seconds", round(time.time() - start, 2))
+
+            self._finish(sub_job["id"], result)
+            results[sub_job["platform"]] = result
+
+        return self._outcome(job, results)
+
+    def _run_parallel(self, job: sqlite3.Row, params: Dict[str, Any], uploader: Any,
+                      timeouts: Optional[Dict[str, float]]) -> Dict[str, Dict[str, Any]]:
+        """Klaim semua sub-job yang belum selesai lalu upload ke platform-platformnya bersamaan"""
+        claimed = {
+            sub_job["platform"]: sub_job["id"]
+            for sub_job in self._unfinished_sub_jobs(job["id"])
+            if self._claim(sub_job["id"])
+        }
+        if not claimed:
+            return {}
+
+        try:
+            results = uploader.upload_to_all_video_platforms(
+                job["video_path"],
+                params.get("tiktok_caption", "#fyp #viral #trending"),
+                params.get("facebook_description", ""),
+                params.get("youtube_title", ""),
+                params.get("youtube_description", ""),
+                params.get("youtube_privacy", "public"),
+                parallel=True,
+                timeouts=timeouts,
+                platforms=list(claimed)
+            )
+        except Exception as e:
+            results = {platform: {"success": False, "message": str(e)} for platform in claimed}
+
+        for platform, sub_job_id in claimed.items():
+            self._finish(sub_job_id, results.setdefault(platform, {"success": False, "message": "Tidak ada hasil upload"}))
+        return results
+
+    def _outcome(self, job: sqlite3.Row, results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        job_id = job["id"]
+        states = self._execute("SELECT state FROM sub_jobs WHERE job_id = ?", (job_id,)).fetchall()
+        return {
+            "job_id": job_id,
+            "video": job["video_path"],
+            "success": all(row["state"] == DONE for row in states),
+            "skipped": not results,
+            "results": results
+        }
+
+    def status(self) -> Dict[str, Any]:
+        """Jumlah sub-job per platform dan state"""
+        rows = self._execute(
+            "SELECT platform, state, COUNT(*) AS total FROM sub_jobs GROUP BY platform, state"
+        ).fetchall()
+        jobs_total = self._execute("SELECT COUNT(*) AS total FROM jobs").fetchone()["total"]
+
+        platforms: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            platforms.setdefault(row["platform"], {})[row["state"]] = row["total"]
+        return {"jobs": jobs_total, "platforms": platforms}
+
+    def close(self):
+        self._heartbeat_stop.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join()
+        with self._lock:
+            self._conn.close()
+
+
+def print_status(queue: JobQueue):
+    """Cetak ringkasan state antrian"""
+    status = queue.status()
+    print(f"\n{Fore.MAGENTA}📋 ANTRIAN UPLOAD ({queue.db_path}):")
+    print(f"Jobs: {status['jobs']}")
+    if not status["platforms"]:
+        print(f"{Fore.YELLOW}⚠️ Antrian kosong")
+        return
+
+    for platform, states in sorted(status["platforms"].items()):
+        color = Fore.GREEN if not states.get(FAILED) and not states.get(PENDING) else Fore.YELLOW
+        detail = ", ".join(f"{state} {states.get(state, 0)}" for state in (DONE, PENDING, RUNNING, FAILED))
+        print(f"{color}{platform.upper()}: {detail}{Style.RESET_ALL}")
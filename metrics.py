@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Metrics - Counter dan histogram upload dalam format Prometheus/OpenMetrics
+Diekspos lewat endpoint HTTP lokal atau file textfile collector node_exporter, tanpa dependency tambahan
+"""
+
+import os
+import abc
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Bucket default (detik): upload penuh bisa sampai puluhan menit, fase biasanya detik
+UPLOAD_BUCKETS = (5, 15, 30, 60, 120, 180, 300, 600, 1200, 1800, 3600)
+PHASE_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric(abc.ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} butuh label {', '.join(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abc.abstractmethod
+    def _samples(self) -> List[str]:
+        """Baris sample format teks Prometheus"""
+
+    def expose(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        if amount < 0:
+            raise ValueError("Counter hanya bisa bertambah")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = PHASE_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # Per label: (jumlah per bucket non-kumulatif, sum)
+        self._values: Dict[LabelValues, Tuple[List[int], float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * len(self.buckets), 0.0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._values[key] = (counts, total + value)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def expose(self) -> str:
+        """Semua metric dalam format teks Prometheus"""
+        with self._lock:
+            metrics = list(self._metrics)
+        return "\n".join(metric.expose() for metric in metrics) + "\n"
+
+
+REGISTRY = Registry()
+
+UPLOADS = REGISTRY.register(Counter(
+    "sosmd_uploads_total", "Upload selesai per platform, alur dan hasil (success/failed/duplicate/deferred)",
+    ["platform", "flow", "outcome"]))
+UPLOAD_DURATION = REGISTRY.register(Histogram(
+    "sosmd_upload_duration_seconds", "Durasi total satu alur upload", ["platform", "flow"], buckets=UPLOAD_BUCKETS))
+PHASE_DURATION = REGISTRY.register(Histogram(
+    "sosmd_phase_duration_seconds", "Durasi per fase alur upload", ["platform", "flow", "phase"]))
+SLEEP_SECONDS = REGISTRY.register(Counter(
+    "sosmd_sleep_seconds_total", "Total sleep tetap di dalam alur upload", ["platform", "flow"]))
+UPLOADED_BYTES = REGISTRY.register(Counter(
+    "sosmd_uploaded_bytes_total", "Bytes file yang berhasil diupload", ["platform", "flow"]))
+BROWSER_LAUNCHES = REGISTRY.register(Counter(
+    "sosmd_browser_launches_total", "Browser Chrome yang dijalankan", ["platform"]))
+SELECTOR_LOOKUPS = REGISTRY.register(Counter(
+    "sosmd_selector_lookups_total", "Pencarian elemen per grup selector (primary/fallback/miss)",
+    ["group", "result"]))
+QUOTA_UNITS = REGISTRY.register(Counter(
+    "sosmd_youtube_quota_units_total", "Unit quota YouTube Data API yang dipakai", ["project", "method"]))
+QUOTA_REFUNDED_UNITS = REGISTRY.register(Counter(
+    "sosmd_youtube_quota_refunded_units_total", "Unit quota yang dikembalikan karena request tidak diterima API",
+    ["project", "method"]))
+QUOTA_REMAINING = REGISTRY.register(Gauge(
+    "sosmd_youtube_quota_remaining", "Sisa unit quota YouTube hari ini menurut ledger lokal", ["project"]))
+
+_textfile: Optional[Path] = None
+_textfile_lock = threading.Lock()
+_server: Optional[ThreadingHTTPServer] = None
+
+
+def result_outcome(result: Dict[str, Any]) -> str:
+    if result.get("duplicate"):
+        return "duplicate"
+    if result.get("deferred"):
+        return "deferred"
+    return "success" if result.get("success") else "failed"
+
+
+def observe_upload(result: Dict[str, Any], timings: Dict[str, Any]):
+    """Catat satu alur upload yang selesai (dipanggil PhaseTimer.attach)"""
+    platform, flow = timings["platform"], timings["flow"]
+    outcome = result_outcome(result)
+    UPLOADS.inc(platform=platform, flow=flow, outcome=outcome)
+
+    # Hasil duplikat / ditunda tidak menjalankan upload, durasinya tidak relevan
+    if outcome in ("success", "failed"):
+        UPLOAD_DURATION.observe(timings["total_seconds"], platform=platform, flow=flow)
+        for span in timings.get("spans", []):
+            PHASE_DURATION.observe(span["seconds"], platform=platform, flow=flow, phase=span["phase"])
+        if timings.get("sleep_seconds"):
+            SLEEP_SECONDS.inc(timings["sleep_seconds"], platform=platform, flow=flow)
+
+    if outcome == "success":
+        size = result.get("bytes")
+        path = result.get("video_path") or result.get("media_path")
+        if size is None and path:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                size = None
+        if size:
+            UPLOADED_BYTES.inc(size, platform=platform, flow=flow)
+
+    try:
+        write_textfile()
+    except OSError:
+        pass
+
+
+def observe_selector(group: str, index: Optional[int]):
+    """Catat hasil pencarian selector: index 0 = primary, >0 = fallback, None = tidak ketemu"""
+    result = "miss" if index is None else ("primary" if index == 0 else "fallback")
+    SELECTOR_LOOKUPS.inc(group=group, result=result)
+
+
+def write_textfile(path: Optional[Path] = None):
+    """Tulis semua metric ke file textfile collector (atomik, supaya node_exporter tidak membaca file setengah jadi)"""
+    path = path or _textfile
+    if not path:
+        return
+    with _textfile_lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(REGISTRY.expose())
+        os.replace(tmp_path, path)
+
+
+def enable_textfile(path: str):
+    """Tulis ulang file .prom setiap kali upload selesai"""
+    global _textfile
+    _textfile = Path(path)
+    write_textfile()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = REGISTRY.expose().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args):
+        pass
+
+
+def start_http_server(port: int, addr: str = "127.0.0.1",
+                      log: Optional[Callable[[str, str], None]] = None) -> ThreadingHTTPServer:
+    """Jalankan endpoint /metrics di thread daemon"""
+    global _server
+    if _server is None:
+        _server = ThreadingHTTPServer((addr, port), _MetricsHandler)
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+        if log:
+            log(f"Metrics tersedia di http://{addr}:{_server.server_address[1]}/metrics", "INFO")
+    return _server
+
+
+def stop_http_server():
+    global _server
+    if _server is not None:
+        _server.shutdown()
+        _server.server_close()
+        _server = None
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Mock Upload Server - Halaman tiruan TikTok Studio dan composer Facebook untuk benchmark offline
+Hanya meniru kontrak DOM yang dipakai uploader (input file, status sukses, caption, tombol Post/Next/Publish),
+dengan delay processing yang bisa diatur
+"""
+
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from colorama import init, Fore
+import argparse
+
+# Initialize colorama
+init(autoreset=True)
+
+DEFAULT_CONFIG = {
+    "page_delay": 0.0,          # Latency server sebelum halaman dikirim (detik)
+    "processing_delay": 2.0,    # Waktu "processing" video setelah file dipilih (detik)
+    "processing_rate": 0.0,     # Tambahan waktu processing per MB file (detik/MB)
+    "post_delay": 1.0,          # Waktu sampai post/publish dikonfirmasi (detik)
+    "step_delay": 0.3,          # Waktu render step berikutnya setelah klik Next (detik)
+    "next_steps": 2,            # Jumlah tombol Next di alur reels
+    "language": "en"            # 'en' (Next/Publish) atau 'id' (Berikutnya/Terbitkan)
+}
+
+_LABELS = {
+    "en": {"next": "Next", "publish": "Publish", "post": "Post"},
+    "id": {"next": "Berikutnya", "publish": "Terbitkan", "post": "Posting"}
+}
+
+# Helper JS bersama: delay processing dihitung dari ukuran file yang dipilih
+_COMMON_JS = """
+var CONFIG = %s;
+function processingMs(input) {
+    var size = input.files && input.files[0] ? input.files[0].size : 0;
+    return (CONFIG.processing_delay + CONFIG.processing_rate * size / 1048576) * 1000;
+}
+function el(tag, attrs, text) {
+    var e = document.createElement(tag);
+    for (var k in attrs) e.setAttribute(k, attrs[k]);
+    if (text) e.textContent = text;
+    return e;
+}
+"""
+
+_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>%s</title>
+<style>body{font-family:sans-serif} [role=button],button{display:inline-block;padding:6px 12px;border:1px solid #888;cursor:pointer}
+[contenteditable]{border:1px solid #ccc;min-height:40px;padding:4px}</style></head>
+<body>%s<script>%s%s</script></body></html>"""
+
+_TIKTOK_BODY = """
+<div id="root"><div class="upload-card before-upload-new-stage">
+  <div class="upload-text-container"><p>Select video to upload</p>
+  <input type="file" accept="video/*" data-e2e="upload-input"></div>
+</div><div id="editor"></div></div>
+"""
+
+_TIKTOK_JS = """
+var input = document.querySelector("input[type='file']");
+input.addEventListener('change', function() {
+    setTimeout(function() {
+        var editor = document.getElementById('editor');
+        var status = el('div', {'class': 'info-status success'});
+        status.appendChild(el('span', {'class': 'TUXText'}, 'Uploaded'));
+        editor.appendChild(status);
+        var name = input.files[0] ? input.files[0].name.replace(/\\.[^.]+$/, '') : '';
+        editor.appendChild(el('div', {'contenteditable': 'true', 'data-e2e': 'caption-input'}, name));
+        var post = el('button', {'data-e2e': 'publish-button'}, 'Post');
+        post.addEventListener('click', function() {
+            post.disabled = true;
+            setTimeout(function() { location.href = '/tiktokstudio/content'; }, CONFIG.post_delay * 1000);
+        });
+        editor.appendChild(post);
+    }, processingMs(input));
+});
+"""
+
+_REELS_BODY = """
+<div id="reels"><h3>Create reel</h3>
+<input type="file" accept="video/mp4,video/*" data-testid="reels-upload-input">
+<div id="step"></div></div>
+"""
+
+_REELS_JS = """
+var L = %s;
+var input = document.querySelector("input[type='file']");
+var step = document.getElementById('step');
+function showNext(remaining) {
+    step.innerHTML = '';
+    if (remaining <= 0) { showPublish(); return; }
+    var next = el('div', {'role': 'button', 'aria-label': L.next, 'tabindex': '0'}, L.next);
+    next.addEventListener('click', function() {
+        step.innerHTML = '';
+        setTimeout(function() { showNext(remaining - 1); }, CONFIG.step_delay * 1000);
+    });
+    step.appendChild(next);
+}
+function showPublish() {
+    step.appendChild(el('div', {'contenteditable': 'true', 'aria-label': 'Add a description', 'role': 'textbox'}));
+    var publish = el('div', {'role': 'button', 'aria-label': L.publish, 'tabindex': '0'}, L.publish);
+    publish.addEventListener('click', function() {
+        publish.setAttribute('aria-disabled', 'true');
+        setTimeout(function() { step.innerHTML = '<p>Your reel is published</p>'; }, CONFIG.post_delay * 1000);
+    });
+    step.appendChild(publish);
+}
+input.addEventListener('change', function() {
+    setTimeout(function() { showNext(CONFIG.next_steps); }, processingMs(input));
+});
+"""
+
+_FEED_BODY = """
+<div id="composer"><form>
+  <div contenteditable="true" role="textbox" aria-label="What's on your mind?" data-text="What's on your mind?"></div>
+  <input type="file" accept="image/*,video/*">
+  <div id="attachments"></div>
+</form></div>
+"""
+
+_FEED_JS = """
+var L = %s;
+var composer = document.getElementById('composer');
+var input = composer.querySelector("input[type='file']");
+var post = el('div', {'role': 'button', 'aria-label': L.post, 'tabindex': '0'}, L.post);
+post.addEventListener('click', function() {
+    setTimeout(function() { composer.remove(); document.body.appendChild(el('p', {}, 'Posted')); },
+               CONFIG.post_delay * 1000);
+});
+composer.querySelector('form').appendChild(post);
+input.addEventListener('change', function() {
+    setTimeout(function() {
+        document.getElementById('attachments').appendChild(el('div', {'class': 'media-upload-preview'}, 'preview'));
+    }, processingMs(input));
+});
+"""
+
+_LOGIN_BODY = "<h3>Log in</h3><form><input name='username'><input type='password'></form>"
+_DONE_BODY = "<h3>Posts</h3><div class='upload-success'>Your video has been uploaded</div>"
+
+
+class MockUploadServer:
+    def __init__(self, port: int = 0, config: Optional[Dict[str, Any]] = None,
+                 log: Optional[Callable[[str, str], None]] = None):
+        """
+        Initialize Mock Upload Server
+
+        Args:
+            port: Port lokal (0 = pilih port bebas)
+            config: Override DEFAULT_CONFIG (delay processing, jumlah step Next, bahasa)
+            log: Fungsi logging (message, level)
+        """
+        self.config = dict(DEFAULT_CONFIG, **(config or {}))
+        self._log_fn = log
+        self.requests = 0
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    @property
+    def tiktok_upload_url(self) -> str:
+        return f"{self.base_url}/tiktokstudio/upload?from=webapp"
+
+    @property
+    def facebook_url(self) -> str:
+        return f"{self.base_url}/"
+
+    @property
+    def reels_create_url(self) -> str:
+        return f"{self.base_url}/reels/create/?surface=PROFILE_PLUS"
+
+    def page(self, path: str) -> Optional[str]:
+        """HTML untuk path, atau None jika tidak ada halaman"""
+        labels = json.dumps(_LABELS.get(self.config["language"], _LABELS["en"]))
+        common = _COMMON_JS % json.dumps(self.config)
+        if path.startswith("/tiktokstudio/upload"):
+            return _PAGE % ("TikTok Studio", _TIKTOK_BODY, common, _TIKTOK_JS)
+        if path.startswith("/tiktokstudio/content"):
+            return _PAGE % ("TikTok Studio", _DONE_BODY, common, "")
+        if path.startswith("/reels/create"):
+            return _PAGE % ("Facebook Reels", _REELS_BODY, common, _REELS_JS % labels)
+        if path.startswith("/login"):
+            return _PAGE % ("Log in", _LOGIN_BODY, common, "")
+        if path == "/":
+            return _PAGE % ("Facebook", _FEED_BODY, common, _FEED_JS % labels)
+        return None
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                if server.config["page_delay"]:
+                    time.sleep(server.config["page_delay"])
+                body = server.page(urlparse(self.path).path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args):
+                if server._log_fn:
+                    server._log_fn(f"mock: {format % args}", "DEBUG")
+
+        return Handler
+
+    def start(self) -> "MockUploadServer":
+        """Jalankan server di thread daemon"""
+        if not self._thread:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-upload-server", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread = None
+
+    def __enter__(self) -> "MockUploadServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    """Main function untuk CLI"""
+    parser = argparse.ArgumentParser(description="Server halaman tiruan TikTok Studio / Facebook untuk benchmark offline")
+    parser.add_argument("--port", type=int, default=8765, help="Port lokal")
+    parser.add_argument("--processing-delay", type=float, default=DEFAULT_CONFIG["processing_delay"], help="Delay processing video (detik)")
+    parser.add_argument("--post-delay", type=float, default=DEFAULT_CONFIG["post_delay"], help="Delay konfirmasi post (detik)")
+    parser.add_argument("--next-steps", type=int, default=DEFAULT_CONFIG["next_steps"], help="Jumlah tombol Next di alur reels")
+    parser.add_argument("--language", choices=list(_LABELS), default=DEFAULT_CONFIG["language"], help="Bahasa tombol")
+
+    args = parser.parse_args()
+
+    server = MockUploadServer(args.port, {
+        "processing_delay": args.processing_delay,
+        "post_delay": args.post_delay,
+        "next_steps": args.next_steps,
+        "language": args.language
+    })
+    print(f"{Fore.CYAN}ℹ️ TikTok Studio : {server.tiktok_upload_url}")
+    print(f"{Fore.CYAN}ℹ️ Facebook feed : {server.facebook_url}")
+    print(f"{Fore.CYAN}ℹ️ Facebook reels: {server.reels_create_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
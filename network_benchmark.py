@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Network Benchmark - Bandingkan halaman upload dengan dan tanpa blokir network
+Mengukur waktu sampai halaman siap dipakai dan bytes yang ditransfer
+"""
+
+import sys
+import time
+import statistics
+from typing import Any, Dict, List, Optional
+
+from colorama import init, Fore, Style
+import argparse
+
+# Initialize colorama
+init(autoreset=True)
+
+PLATFORMS = ['tiktok', 'facebook']
+
+
+def _new_uploader(platform: str, headless: bool, debug: bool, offline_driver: bool, block_requests: bool,
+                  page_load_strategy: str):
+    if platform == 'tiktok':
+        from tiktok_uploader import TikTokUploader
+        return TikTokUploader(headless=headless, debug=debug, offline_driver=offline_driver,
+                              block_requests=block_requests, page_load_strategy=page_load_strategy)
+    from facebook_uploader import FacebookUploader
+    return FacebookUploader(headless=headless, debug=debug, offline_driver=offline_driver,
+                            block_requests=block_requests, page_load_strategy=page_load_strategy)
+
+
+def _open_upload_page(uploader, platform: str):
+    if platform == 'tiktok':
+        uploader._navigate(uploader.upload_url)
+        uploader._wait_upload_page()
+    else:
+        uploader._navigate(uploader.reels_create_url)
+        uploader._wait_page(uploader.reels_selectors['upload_input'], label="halaman reels")
+
+
+def measure_page(platform: str, block_requests: bool, headless: bool = True, debug: bool = False,
+                 offline_driver: bool = False, page_load_strategy: str = 'normal') -> Optional[Dict[str, Any]]:
+    """
+    Buka halaman upload satu kali di browser baru (cache kosong)
+
+    Returns:
+        Dict ready_seconds, requests, blocked, transferred_bytes (None jika gagal)
+    """
+    from network_blocking import network_usage
+
+    uploader = _new_uploader(platform, headless, debug, offline_driver, block_requests, page_load_strategy)
+    uploader.measure_network = True
+    try:
+        uploader._start_session()
+        network_usage(uploader.driver)  # buang event sebelum navigasi
+
+        start = time.perf_counter()
+        _open_upload_page(uploader, platform)
+        ready_seconds = time.perf_counter() - start
+
+        usage = network_usage(uploader.driver)
+        usage["ready_seconds"] = ready_seconds
+        return usage
+    except Exception as e:
+        print(f"{Fore.RED}❌ {platform} ({'blokir' if block_requests else 'normal'}) gagal: {e}")
+        return None
+    finally:
+        uploader._end_session(discard=True)
+        uploader.close()
+
+
+def summarize(samples: List[Dict[str, Any]]) -> Optional[Dict[str, float]]:
+    if not samples:
+        return None
+    return {
+        "ready_seconds": statistics.median(s["ready_seconds"] for s in samples),
+        "transferred_bytes": statistics.median(s["transferred_bytes"] for s in samples),
+        "requests": statistics.median(s["requests"] for s in samples),
+        "blocked": statistics.median(s["blocked"] for s in samples)
+    }
+
+
+def _fmt(stats: Optional[Dict[str, float]]) -> str:
+    if not stats:
+        return f"{'gagal':>34}"
+    return (f"{stats['ready_seconds']:7.2f}s {stats['transferred_bytes'] / (1024 * 1024):8.2f}MB "
+            f"{stats['requests']:6.0f} req {stats['blocked']:4.0f} blok")
+
+
+def main():
+    """Main function untuk CLI"""
+    parser = argparse.ArgumentParser(description="Benchmark halaman upload dengan/tanpa blokir network")
+    parser.add_argument("--platform", "-p", choices=PLATFORMS, action="append", help="Platform (default: semua)")
+    parser.add_argument("--runs", type=int, default=3, help="Jumlah run per mode")
+    parser.add_argument("--show-browser", action="store_true", help="Jangan jalankan browser headless")
+    parser.add_argument("--offline-driver", action="store_true", help="Resolusi ChromeDriver tanpa akses network")
+    parser.add_argument("--page-load-strategy", choices=['normal', 'eager', 'none'], default='normal',
+                        help="Strategi load halaman untuk kedua mode")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+
+    args = parser.parse_args()
+    platforms = args.platform or PLATFORMS
+
+    results: Dict[str, Dict[bool, Optional[Dict[str, float]]]] = {}
+    for platform in platforms:
+        results[platform] = {}
+        for blocked in (False, True):
+            samples = []
+            for _ in range(args.runs):
+                sample = measure_page(platform, blocked, headless=not args.show_browser, debug=args.debug,
+                                      offline_driver=args.offline_driver, page_load_strategy=args.page_load_strategy)
+                if sample:
+                    samples.append(sample)
+            results[platform][blocked] = summarize(samples)
+
+    print(f"\n{Fore.MAGENTA}🌐 Network benchmark ({args.runs} run, median, browser baru per run, "
+          f"pageLoadStrategy={args.page_load_strategy})")
+    print(f"{'Platform':<10}{'Mode':<8}{'siap':>8}{'transfer':>11}{'request':>10}{'':>6}  hemat")
+    for platform, modes in results.items():
+        normal, blocked = modes[False], modes[True]
+        print(f"{platform:<10}{'normal':<8}{_fmt(normal)}")
+        saving = ""
+        if normal and blocked:
+            time_saved = normal["ready_seconds"] - blocked["ready_seconds"]
+            bytes_saved = normal["transferred_bytes"] - blocked["transferred_bytes"]
+            color = Fore.GREEN if time_saved > 0 else Fore.WHITE
+            saving = f"{color}{time_saved:+.2f}s {bytes_saved / (1024 * 1024):+.2f}MB{Style.RESET_ALL}"
+        print(f"{'':<10}{'blokir':<8}{_fmt(blocked)}  {saving}")
+
+    if any(mode is None for modes in results.values() for mode in modes.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
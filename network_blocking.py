@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Network Blocking - Blokir request yang tidak dibutuhkan otomasi (analytics, iklan, font, preview media)
+Diterapkan lewat CDP Network.setBlockedURLs sehingga request tidak pernah dikirim sama sekali
+"""
+
+import json
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+# File opsional untuk mengganti pola default per platform: {"tiktok": [...], "facebook": [...]}
+BLOCKLIST_FILENAME = "network_blocklist.json"
+
+# Pola wildcard Network.setBlockedURLs ('*' cocok dengan karakter apa pun)
+COMMON_PATTERNS = [
+    # Font dan gambar (--disable-images tidak menghentikan download background CSS / preload)
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.avif", "*.ico",
+    # Analytics dan iklan pihak ketiga
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*googleadservices.com*", "*hotjar.com*"
+]
+
+DEFAULT_BLOCKLISTS: Dict[str, List[str]] = {
+    "tiktok": COMMON_PATTERNS + [
+        # Monitoring / beacon ByteDance
+        "*mon.tiktokv.com*", "*mon-va.byteoversea.com*", "*mcs.tiktokw.us*", "*mcs-va.tiktokv.com*",
+        "*/monitor_browser/collect*", "*/web/report*", "*/v1/list*slardar*",
+        "*analytics.tiktok.com*", "*ads.tiktok.com*",
+        # Stream video feed/rekomendasi (upload memakai host upload terpisah)
+        "*/video/tos/*"
+    ],
+    "facebook": COMMON_PATTERNS + [
+        # Logging dan pixel Facebook
+        "*facebook.com/tr*", "*facebook.com/ajax/bz*", "*facebook.com/ajax/bnzai*",
+        "*/security/hsts-pixel*", "*connect.facebook.net*",
+        # Stream video feed (upload reels lewat rupload.facebook.com)
+        "*video*.fbcdn.net*"
+    ]
+}
+
+
+def load_blocklist(platform: str, config_path: Optional[Path] = None) -> List[str]:
+    """
+    Pola blokir untuk platform: dari network_blocklist.json jika platform tercantum di sana,
+    selain itu pola default
+
+    Args:
+        platform: 'tiktok' atau 'facebook'
+        config_path: Path file blocklist (opsional)
+    """
+    if config_path:
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            if isinstance(config, dict) and isinstance(config.get(platform), list):
+                return [str(pattern) for pattern in config[platform]]
+        except (OSError, ValueError):
+            # File tidak ada / rusak: pakai default daripada upload gagal
+            pass
+    return list(DEFAULT_BLOCKLISTS.get(platform, COMMON_PATTERNS))
+
+
+def apply_blocklist(driver, patterns: List[str], log: Optional[Callable[[str, str], None]] = None) -> bool:
+    """
+    Aktifkan blokir URL di browser (berlaku untuk semua navigasi berikutnya)
+
+    Returns:
+        True jika blokir aktif
+    """
+    if not patterns:
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        if log:
+            log(f"Blokir network aktif ({len(patterns)} pola)", "DEBUG")
+        return True
+    except (AttributeError, WebDriverException) as e:
+        if log:
+            log(f"Blokir network tidak bisa diaktifkan: {e}", "WARNING")
+        return False
+
+
+def enable_network_log(chrome_options):
+    """Aktifkan performance log Chrome (event Network.*) untuk mengukur bytes yang ditransfer"""
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def network_usage(driver) -> Dict[str, int]:
+    """
+    Hitung request dan bytes yang ditransfer sejak pemanggilan sebelumnya (butuh enable_network_log)
+
+    Returns:
+        Dict dengan requests, blocked dan transferred_bytes
+    """
+    usage = {"requests": 0, "blocked": 0, "transferred_bytes": 0}
+    for entry in driver.get_log("performance"):
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            usage["requests"] += 1
+        elif method == "Network.loadingFinished":
+            usage["transferred_bytes"] += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            usage["blocked"] += 1
+    return usage
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Offline Benchmark - Jalankan TikTokUploader / FacebookUploader asli di Chrome headless
+terhadap halaman tiruan mock_upload_server, lalu laporkan timing per fase
+"""
+
+import os
+import sys
+import json
+import tempfile
+import statistics
+from pathlib import Path
+from typing import Any, Dict, List
+
+from colorama import init, Fore, Style
+import argparse
+
+from mock_upload_server import MockUploadServer, DEFAULT_CONFIG
+from phase_timer import PHASES
+
+# Initialize colorama
+init(autoreset=True)
+
+FLOWS = ['tiktok', 'facebook-reels', 'facebook-status']
+
+
+def _isolate(uploader, workdir: Path):
+    """State persisten uploader (cookies, ledger, statistik selector) dialihkan ke folder sementara"""
+    from upload_ledger import UploadLedger
+    from selector_stats import SelectorStats
+
+    uploader.cookies_path = workdir / f"{type(uploader).__name__}_cookies.json"
+    uploader.ledger.close()
+    uploader.ledger = UploadLedger(workdir / "upload_ledger.db")
+    uploader.selector_stats = SelectorStats(workdir / "selector_stats.json", log=uploader._log)
+    uploader.screenshots_dir = workdir
+
+
+def build_uploaders(server: MockUploadServer, workdir: Path, args) -> Dict[str, Any]:
+    from tiktok_uploader import TikTokUploader
+    from facebook_uploader import FacebookUploader
+
+    options = dict(headless=not args.show_browser, debug=args.debug, offline_driver=args.offline_driver,
+                   force_upload=True, page_load_strategy=args.page_load_strategy, timings_log=args.timings_log)
+
+    tiktok = TikTokUploader(**options)
+    tiktok.upload_url = server.tiktok_upload_url
+
+    facebook = FacebookUploader(**options)
+    facebook.facebook_url = server.facebook_url
+    facebook.reels_create_url = server.reels_create_url
+
+    for uploader in (tiktok, facebook):
+        _isolate(uploader, workdir)
+        if args.reuse_browser:
+            uploader.enable_driver_pool()
+    return {'tiktok': tiktok, 'facebook': facebook}
+
+
+def run_flow(uploaders: Dict[str, Any], flow: str, video: str) -> Dict[str, Any]:
+    if flow == 'tiktok':
+        return uploaders['tiktok'].upload_video(video, "#benchmark offline")
+    if flow == 'facebook-reels':
+        return uploaders['facebook'].upload_reels(video, "benchmark offline")
+    return uploaders['facebook'].upload_status("benchmark offline", video)
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Median per fase dan total dari beberapa run"""
+    timings = [r["timings"] for r in results if "timings" in r]
+    phases: Dict[str, float] = {}
+    names = sorted({p for t in timings for p in t["phases"]},
+                   key=lambda p: PHASES.index(p) if p in PHASES else len(PHASES))
+    for name in names:
+        phases[name] = statistics.median(t["phases"].get(name, 0.0) for t in timings)
+    return {
+        "runs": len(results),
+        "success": sum(1 for r in results if r.get("success")),
+        "total_seconds": statistics.median(t["total_seconds"] for t in timings) if timings else None,
+        "wait_seconds": statistics.median(t.get("wait_seconds") or 0.0 for t in timings) if timings else None,
+        "phases": phases
+    }
+
+
+def print_report(summaries: Dict[str, Dict[str, Any]], config: Dict[str, Any]):
+    print(f"\n{Fore.MAGENTA}🧪 Offline benchmark (median) - processing {config['processing_delay']}s, "
+          f"post {config['post_delay']}s, {config['next_steps']} step Next")
+    for flow, summary in summaries.items():
+        color = Fore.GREEN if summary["success"] == summary["runs"] else Fore.RED
+        total = f"{summary['total_seconds']:.2f}s" if summary["total_seconds"] is not None else "-"
+        print(f"\n{Fore.CYAN}{flow}{Style.RESET_ALL}: total {total}, "
+              f"{color}{summary['success']}/{summary['runs']} sukses{Style.RESET_ALL}")
+        for phase, seconds in summary["phases"].items():
+            print(f"  {phase:<16}{seconds:8.2f}s")
+
+
+def main():
+    """Main function untuk CLI"""
+    parser = argparse.ArgumentParser(description="Benchmark uploader browser terhadap halaman tiruan lokal")
+    parser.add_argument("--flow", choices=FLOWS, action="append", help="Alur yang dijalankan (default: semua)")
+    parser.add_argument("--runs", type=int, default=3, help="Jumlah run per alur")
+    parser.add_argument("--video", help="File video (default: file dummy 1MB)")
+    parser.add_argument("--processing-delay", type=float, default=DEFAULT_CONFIG["processing_delay"], help="Delay processing video di halaman tiruan (detik)")
+    parser.add_argument("--post-delay", type=float, default=DEFAULT_CONFIG["post_delay"], help="Delay konfirmasi post (detik)")
+    parser.add_argument("--next-steps", type=int, default=DEFAULT_CONFIG["next_steps"], help="Jumlah tombol Next di alur reels")
+    parser.add_argument("--language", choices=['en', 'id'], default=DEFAULT_CONFIG["language"], help="Bahasa tombol halaman tiruan")
+    parser.add_argument("--page-load-strategy", choices=['normal', 'eager', 'none'], default='normal', help="Strategi load halaman")
+    parser.add_argument("--reuse-browser", action="store_true", help="Pakai ulang browser antar run")
+    parser.add_argument("--show-browser", action="store_true", help="Jangan jalankan browser headless")
+    parser.add_argument("--offline-driver", action="store_true", help="Resolusi ChromeDriver tanpa akses network")
+    parser.add_argument("--timings-log", help="Tulis timing per fase setiap run ke file JSON lines")
+    parser.add_argument("--report", help="Tulis ringkasan ke file JSON")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+
+    args = parser.parse_args()
+    flows = args.flow or FLOWS
+    config = {
+        "processing_delay": args.processing_delay,
+        "post_delay": args.post_delay,
+        "next_steps": args.next_steps,
+        "language": args.language
+    }
+
+    with tempfile.TemporaryDirectory(prefix="sosmd-bench-") as tmp, MockUploadServer(config=config) as server:
+        workdir = Path(tmp)
+        video = args.video
+        if not video:
+            video = str(workdir / "benchmark.mp4")
+            with open(video, 'wb') as f:
+                f.write(os.urandom(1024 * 1024))
+
+        uploaders = build_uploaders(server, workdir, args)
+        results: Dict[str, List[Dict[str, Any]]] = {flow: [] for flow in flows}
+        try:
+            for run in range(args.runs):
+                for flow in flows:
+                    print(f"{Fore.CYAN}▶ {flow} run {run + 1}/{args.runs}")
+                    results[flow].append(run_flow(uploaders, flow, video))
+        finally:
+            for uploader in uploaders.values():
+                uploader.close()
+                uploader.ledger.close()
+
+    summaries = {flow: summarize(flow_results) for flow, flow_results in results.items()}
+    print_report(summaries, server.config)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({"config": server.config, "flows": summaries}, f, indent=2)
+
+    if any(s["success"] < s["runs"] for s in summaries.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Page Waits - Wait engine berbasis event DOM (MutationObserver / readyState)
+Pengganti time.sleep tetap: wait selesai begitu kondisi di halaman terpenuhi
+"""
+
+import time
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Optional
+
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+
+# pageLoadStrategy Chrome: 'normal' tunggu event load, 'eager' tunggu DOMContentLoaded,
+# 'none' langsung kembali (kesiapan halaman sepenuhnya ditentukan wait di bawah)
+PAGE_LOAD_STRATEGIES = ('normal', 'eager', 'none')
+
+# Penanda dokumen lama yang sedang ditinggalkan navigasi (lihat PageWaiter.mark_navigation)
+_STALE_FLAG = "__pageWaiterStale"
+
+# Template script async: cek kondisi sekali, lalu cek ulang setiap ada mutasi DOM
+# (plus interval kecil untuk kondisi non-DOM seperti URL / readyState).
+# Dokumen yang sudah ditandai stale tidak pernah dianggap memenuhi kondisi.
+_CONDITION_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[0];
+var args = arguments[1];
+function check() {
+    if (window.__pageWaiterStale) return null;
+    try { return (%s); } catch (e) { return null; }
+}
+var first = check();
+if (first) { done(first); return; }
+var finished = false, observer = null, interval = null, timer = null;
+function finish(value) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(value);
+}
+function recheck() { var r = check(); if (r) finish(r); }
+observer = new MutationObserver(recheck);
+observer.observe(document.documentElement || document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+interval = setInterval(recheck, 100);
+timer = setTimeout(function() { finish(null); }, timeoutMs);
+"""
+
+# Selesai jika tidak ada mutasi DOM selama quietMs
+_DOM_STABLE_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[0];
+var quietMs = arguments[1];
+var finished = false, quiet = null, timer = null;
+var observer = new MutationObserver(function() {
+    clearTimeout(quiet);
+    quiet = setTimeout(function() { finish(true); }, quietMs);
+});
+function finish(value) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(quiet);
+    clearTimeout(timer);
+    done(value);
+}
+observer.observe(document.documentElement || document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+quiet = setTimeout(function() { finish(true); }, quietMs);
+timer = setTimeout(function() { finish(false); }, timeoutMs);
+"""
+
+# Fungsi JS bersama: elemen terlihat di layar
+_VISIBLE_JS = "(function(el) { var r = el.getBoundingClientRect(); " \
+              "var s = window.getComputedStyle(el); " \
+              "return r.width > 0 && r.height > 0 && s.visibility !== 'hidden' && s.display !== 'none'; })"
+
+# Satu round-trip: cek semua selector sekaligus, return [index, elemen] pertama yang cocok.
+# Mode clickable = terlihat dan tidak disabled (setara EC.element_to_be_clickable).
+_FIRST_MATCH_SCRIPT = """
+var selectors = arguments[0], clickable = arguments[1];
+var isVisible = %s;
+for (var i = 0; i < selectors.length; i++) {
+    var els;
+    try { els = document.querySelectorAll(selectors[i]); } catch (e) { continue; }
+    for (var j = 0; j < els.length; j++) {
+        var el = els[j];
+        if (!clickable) return [i, el];
+        if (isVisible(el) && !el.disabled && el.getAttribute('aria-disabled') !== 'true') return [i, el];
+    }
+}
+return null;
+""" % _VISIBLE_JS
+
+SelectorMatch = namedtuple("SelectorMatch", ["element", "index", "selector", "seconds"])
+
+
+def find_first_match(driver: Any, selectors: List[str], timeout: float = 10, visible: bool = True,
+                     poll: float = 0.25) -> Optional[SelectorMatch]:
+    """
+    Race semua selector dalam satu execute_script per poll tick
+
+    Args:
+        driver: Selenium WebDriver
+        selectors: List selector CSS (urutan = prioritas)
+        timeout: Deadline bersama untuk semua selector
+        visible: True = harus terlihat dan enabled, False = cukup ada di DOM
+        poll: Jeda antar poll tick dalam detik
+
+    Returns:
+        SelectorMatch (elemen, index selector, selector, detik), atau None jika timeout
+    """
+    start = time.time()
+    deadline = start + timeout
+
+    while True:
+        try:
+            result = driver.execute_script(_FIRST_MATCH_SCRIPT, list(selectors), visible)
+        except WebDriverException:
+            # Halaman sedang navigasi, coba lagi di tick berikutnya
+            result = None
+
+        if result:
+            index, element = result
+            return SelectorMatch(element, index, selectors[index], time.time() - start)
+
+        if time.time() + poll > deadline:
+            return None
+        time.sleep(poll)
+
+# Selector default untuk kandidat tombol
+BUTTON_SELECTOR = "[role='button'], button"
+
+# Fungsi JS: cari tombol terlihat & enabled berdasarkan teks / aria-label (case-insensitive).
+# Teks yang sama persis diprioritaskan di atas teks yang hanya mengandung keyword.
+_TEXT_BUTTON_JS = """(function(keywords, selector) {
+    var isVisible = %s;
+    var best = null, bestRank = 0;
+    var els = document.querySelectorAll(selector);
+    for (var i = 0; i < els.length; i++) {
+        var el = els[i];
+        if (el.disabled || el.getAttribute('aria-disabled') === 'true' || !isVisible(el)) continue;
+        var text = (el.innerText || '').trim().toLowerCase();
+        var label = (el.getAttribute('aria-label') || '').trim().toLowerCase();
+        for (var k = 0; k < keywords.length; k++) {
+            var kw = keywords[k];
+            var rank = (text === kw || label === kw) ? 2
+                : (text.indexOf(kw) !== -1 || label.indexOf(kw) !== -1) ? 1 : 0;
+            if (rank > bestRank) {
+                best = [el, (el.innerText || el.getAttribute('aria-label') || '').trim()];
+                bestRank = rank;
+            }
+            if (bestRank === 2) return best;
+        }
+    }
+    return best;
+})""" % _VISIBLE_JS
+
+TextButtonMatch = namedtuple("TextButtonMatch", ["element", "text"])
+
+
+def find_button_by_text(driver: Any, keywords: List[str], selector: str = BUTTON_SELECTOR,
+                        timeout: float = 0, poll: float = 0.25) -> Optional[TextButtonMatch]:
+    """
+    Cari tombol berdasarkan teks seluruhnya di dalam halaman (satu execute_script per tick)
+
+    Args:
+        driver: Selenium WebDriver
+        keywords: Teks tombol yang dicari, misalnya ['next', 'berikutnya']
+        selector: Selector CSS kandidat tombol
+        timeout: Lama menunggu tombol muncul (0 = cek sekali)
+        poll: Jeda antar poll tick dalam detik
+
+    Returns:
+        TextButtonMatch (elemen, teks tombol), atau None
+    """
+    script = "return %s(arguments[0], arguments[1]);" % _TEXT_BUTTON_JS
+    keywords = [k.lower() for k in keywords]
+    deadline = time.time() + timeout
+
+    while True:
+        try:
+            result = driver.execute_script(script, keywords, selector)
+        except WebDriverException:
+            result = None
+
+        if result:
+            return TextButtonMatch(result[0], result[1])
+
+        if time.time() + poll > deadline:
+            return None
+        time.sleep(poll)
+
+
+def _selector_condition(visible: bool) -> str:
+    """Kondisi JS: salah satu selector di args.selectors cocok (selector invalid dilewati)"""
+    check_visible = f"{_VISIBLE_JS}(el)" if visible else "true"
+    return (
+        "(function() { for (var i = 0; i < args.selectors.length; i++) { var el = null; "
+        "try { el = document.querySelector(args.selectors[i]); } catch (e) { continue; } "
+        f"if (el && {check_visible}) return el; }} return null; }})()"
+    )
+
+
+class PageWaiter:
+    def __init__(self, driver: Any, log: Optional[Callable[[str, str], None]] = None):
+        """
+        Initialize Page Waiter
+
+        Args:
+            driver: Selenium WebDriver
+            log: Fungsi logging (message, level)
+        """
+        self.driver = driver
+        self._log_fn = log
+        self.timings: List[Dict[str, Any]] = []
+
+    def _log(self, message: str, level: str = "INFO"):
+        if self._log_fn:
+            self._log_fn(message, level)
+
+    def _record(self, label: str, start: float, ok: bool) -> float:
+        elapsed = time.time() - start
+        self.timings.append({"label": label, "seconds": round(elapsed, 3), "ok": ok})
+        status = "selesai" if ok else "timeout"
+        self._log(f"Wait '{label}' {status} dalam {elapsed:.2f}s", "DEBUG")
+        return elapsed
+
+    def total_seconds(self) -> float:
+        """Total waktu yang dihabiskan di semua wait"""
+        return round(sum(t["seconds"] for t in self.timings), 3)
+
+    def _run_async(self, script: str, timeout: float, *args) -> Any:
+        """
+        Jalankan script async sampai deadline. Navigasi di tengah wait membuat
+        script gagal, jadi script dijalankan ulang di dokumen baru.
+        """
+        deadline = time.time() + timeout
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            try:
+                self.driver.set_script_timeout(remaining + 5)
+                return self.driver.execute_async_script(script, int(remaining * 1000), *args)
+            except StaleElementReferenceException:
+                raise
+            except WebDriverException:
+                time.sleep(0.1)
+
+    def until(self, condition_js: str, timeout: float = 10, label: str = "kondisi",
+              args: Optional[Dict[str, Any]] = None, stale_result: Any = None) -> Any:
+        """
+        Tunggu sampai ekspresi JS bernilai truthy
+
+        Args:
+            condition_js: Ekspresi JS; variabel `args` berisi argumen dari Python
+            timeout: Batas waktu dalam detik
+            label: Nama wait untuk log dan laporan timing
+            args: Dict argumen (boleh berisi WebElement)
+            stale_result: Nilai yang dikembalikan jika WebElement di args sudah stale
+
+        Returns:
+            Nilai kondisi (misalnya WebElement), atau None jika timeout
+        """
+        start = time.time()
+        try:
+            result = self._run_async(_CONDITION_SCRIPT % condition_js, timeout, args or {})
+        except StaleElementReferenceException:
+            result = stale_result
+        self._record(label, start, bool(result))
+        return result
+
+    def mark_navigation(self):
+        """
+        Tandai dokumen saat ini sebelum navigasi. Dengan pageLoadStrategy 'none' driver.get
+        kembali sebelum dokumen baru ada, jadi tanpa penanda ini wait bisa cocok di halaman lama.
+        """
+        try:
+            self.driver.execute_script(f"window.{_STALE_FLAG} = true")
+        except WebDriverException:
+            pass
+
+    def ready_state(self, timeout: float = 15, complete: bool = False) -> bool:
+        """Tunggu document.readyState interactive (atau complete)"""
+        if complete:
+            condition = "document.readyState === 'complete'"
+        else:
+            condition = "document.readyState !== 'loading'"
+        return bool(self.until(condition, timeout, label="readyState"))
+
+    def selector(self, selectors: List[str], timeout: float = 10, visible: bool = True,
+                 label: str = "selector") -> Optional[Any]:
+        """Tunggu salah satu selector CSS muncul, return elemen pertama yang cocok"""
+        if isinstance(selectors, str):
+            selectors = [selectors]
+        return self.until(_selector_condition(visible), timeout, label=label,
+                          args={"selectors": list(selectors)})
+
+    def text_button(self, keywords: List[str], timeout: float = 10, selector: str = BUTTON_SELECTOR,
+                    label: str = "tombol") -> Optional[TextButtonMatch]:
+        """Tunggu tombol dengan teks salah satu keyword muncul (terlihat dan enabled)"""
+        result = self.until(
+            "%s(args.keywords, args.selector)" % _TEXT_BUTTON_JS,
+            timeout,
+            label=label,
+            args={"keywords": [k.lower() for k in keywords], "selector": selector}
+        )
+        return TextButtonMatch(result[0], result[1]) if result else None
+
+    def url_change(self, old_url: str, timeout: float = 10, label: str = "url") -> bool:
+        """Tunggu URL berubah dari old_url"""
+        return bool(self.until("location.href !== args.url", timeout, label=label,
+                               args={"url": old_url}))
+
+    def url_excludes(self, keywords: List[str], timeout: float = 180, label: str = "url") -> bool:
+        """Tunggu URL tidak lagi mengandung keyword manapun (misalnya 'login')"""
+        condition = "args.keywords.every(function(k) { return location.href.indexOf(k) === -1; })"
+        return bool(self.until(condition, timeout, label=label, args={"keywords": list(keywords)}))
+
+    def page_ready(self, selectors: List[str], login_keywords: List[str], timeout: float = 15,
+                   label: str = "halaman siap") -> bool:
+        """
+        Tunggu halaman siap dipakai: salah satu selector kunci muncul, atau
+        halaman dialihkan ke login (supaya pengecekan login bisa langsung jalan)
+        """
+        condition = (
+            "args.keywords.some(function(k) { return location.href.indexOf(k) !== -1; }) || "
+            + _selector_condition(False)
+        )
+        return bool(self.until(condition, timeout, label=label,
+                               args={"selectors": list(selectors), "keywords": list(login_keywords)}))
+
+    def focused(self, element: Any, timeout: float = 2) -> bool:
+        """Tunggu elemen (atau child-nya) mendapat fokus"""
+        condition = ("document.activeElement === args.el || "
+                     "(args.el.contains && args.el.contains(document.activeElement))")
+        return bool(self.until(condition, timeout, label="fokus", args={"el": element}))
+
+    def text_cleared(self, element: Any, timeout: float = 2) -> bool:
+        """Tunggu isi input/contenteditable kosong"""
+        condition = "((args.el.value !== undefined ? args.el.value : args.el.innerText) || '').trim() === ''"
+        return bool(self.until(condition, timeout, label="input kosong", args={"el": element}))
+
+    def detached_or_hidden(self, element: Any, timeout: float = 15, label: str = "elemen hilang") -> bool:
+        """Tunggu elemen dilepas dari DOM atau tidak terlihat lagi"""
+        condition = f"!args.el.isConnected || !{_VISIBLE_JS}(args.el)"
+        return bool(self.until(condition, timeout, label=label, args={"el": element}, stale_result=True))
+
+    def dom_stable(self, quiet_ms: int = 500, timeout: float = 10, label: str = "DOM stabil") -> bool:
+        """Tunggu sampai tidak ada mutasi DOM selama quiet_ms"""
+        start = time.time()
+        result = self._run_async(_DOM_STABLE_SCRIPT, timeout, quiet_ms)
+        self._record(label, start, bool(result))
+        return bool(result)
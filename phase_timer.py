@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Phase Timer - Timing per fase untuk setiap alur upload
+Fase dicatat berurutan (driver setup, cookie load, navigasi, ...) dan dilampirkan ke dict hasil upload,
+opsional juga ditulis sebagai JSON lines
+"""
+
+import json
+import time
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import metrics
+
+# Nama fase standar alur browser (YouTube memakai prepare / session_init / transfer / confirmation)
+PHASES = [
+    "driver_setup", "cookie_load", "navigation", "login_check", "file_handoff",
+    "processing_wait", "caption", "post", "confirmation", "teardown"
+]
+
+# Fase setelah konten terkirim dan pembersihan browser tidak dibatalkan abort()
+UNCANCELLABLE_PHASES = frozenset({"confirmation", "teardown"})
+
+_write_lock = threading.Lock()
+
+
+class UploadCancelled(Exception):
+    """Upload dihentikan lewat abort() dari thread lain"""
+
+
+def write_jsonl(path: Path, record: Dict[str, Any]):
+    """Tambahkan satu record ke file JSON lines (aman dipanggil dari beberapa thread)"""
+    path = Path(path)
+    line = json.dumps(record, ensure_ascii=False, default=str)
+    with _write_lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(line + "\n")
+
+
+class PhaseTimer:
+    def __init__(self, platform: str, flow: str, log: Optional[Callable[[str, str], None]] = None,
+                 cancel: Optional[threading.Event] = None):
+        """
+        Initialize Phase Timer
+
+        Args:
+            platform: Nama platform (tiktok, facebook, youtube)
+            flow: Nama alur (upload_video, upload_status, upload_reels)
+            log: Fungsi logging (message, level)
+            cancel: Token pembatalan milik upload ini; begin() raise UploadCancelled setelah token di-set
+        """
+        self.platform = platform
+        self.flow = flow
+        self._log_fn = log
+        self.cancel = cancel
+        self.started_at = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self.spans: List[Dict[str, Any]] = []
+        self.sleep_seconds = 0.0
+        self._current: Optional[str] = None
+        self._current_start = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel is not None and self.cancel.is_set()
+
+    def begin(self, phase: str):
+        """Mulai fase baru (fase yang sedang berjalan otomatis ditutup); batas fase juga titik pembatalan"""
+        if self.cancelled and phase not in UNCANCELLABLE_PHASES:
+            raise UploadCancelled(f"Upload dihentikan sebelum fase '{phase}'")
+        self.end()
+        self._current = phase
+        self._current_start = time.perf_counter()
+
+    def end(self, ok: bool = True):
+        """Tutup fase yang sedang berjalan"""
+        if self._current is None:
+            return
+        now = time.perf_counter()
+        seconds = now - self._current_start
+        self.spans.append({
+            "phase": self._current,
+            "start": round(self._current_start - self._start, 3),
+            "seconds": round(seconds, 3),
+            "ok": ok
+        })
+        if self._log_fn:
+            self._log_fn(f"Fase '{self._current}' {seconds:.2f}s", "DEBUG")
+        self._current = None
+
+    def sleep(self, seconds: float):
+        """time.sleep yang tercatat sebagai waktu sleep tetap"""
+        time.sleep(seconds)
+        self.sleep_seconds += seconds
+
+    def summary(self, wait_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """Ringkasan timing; total per fase dijumlahkan jika fase yang sama muncul lebih dari sekali"""
+        phases: Dict[str, float] = {}
+        for span in self.spans:
+            phases[span["phase"]] = round(phases.get(span["phase"], 0.0) + span["seconds"], 3)
+        summary = {
+            "platform": self.platform,
+            "flow": self.flow,
+            "started_at": self.started_at.isoformat(),
+            "total_seconds": round(time.perf_counter() - self._start, 3),
+            "sleep_seconds": round(self.sleep_seconds, 3),
+            "phases": phases,
+            "spans": list(self.spans)
+        }
+        if wait_seconds is not None:
+            summary["wait_seconds"] = wait_seconds
+        return summary
+
+    def attach(self, result: Dict[str, Any], wait_seconds: Optional[float] = None,
+               jsonl_path: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Tutup fase terakhir, lampirkan timing ke result["timings"], catat ke metrics dan tulis ke JSON lines jika diminta
+
+        Fase yang masih terbuka ditandai gagal jika upload gagal (fase tempat error terjadi).
+        """
+        self.end(ok=bool(result.get("success")) or bool(result.get("duplicate")))
+        result["timings"] = self.summary(wait_seconds)
+        metrics.observe_upload(result, result["timings"])
+        if jsonl_path:
+            record = {"success": result.get("success", False), "message": result.get("message")}
+            for key in ("video_path", "media_path", "video_id", "deferred", "duplicate"):
+                if key in result:
+                    record[key] = result[key]
+            record.update(result["timings"])
+            try:
+                write_jsonl(jsonl_path, record)
+            except OSError as e:
+                if self._log_fn:
+                    self._log_fn(f"Gagal menulis timing ke {jsonl_path}: {e}", "WARNING")
+        return result
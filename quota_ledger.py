@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Quota Ledger - Pencatatan unit quota YouTube Data API per project per hari
+Hari quota mengikuti reset Google (tengah malam waktu Pasifik), sehingga sisa quota
+bisa dihitung tanpa request ke API
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import metrics
+
+try:
+    from zoneinfo import ZoneInfo
+    PACIFIC = ZoneInfo("America/Los_Angeles")
+except Exception:  # Python < 3.9 atau tzdata tidak tersedia (Windows)
+    PACIFIC = None
+
+DEFAULT_LEDGER_PATH = Path(__file__).parent / "jobs" / "youtube_quota.db"
+
+# Quota default project Google Cloud; bisa di-override lewat environment
+DAILY_QUOTA_ENV = "YOUTUBE_DAILY_QUOTA"
+DEFAULT_DAILY_QUOTA = 10000
+
+# Biaya unit per method (https://developers.google.com/youtube/v3/determine_quota_cost)
+QUOTA_COSTS = {
+    "videos.insert": 1600,
+    "videos.update": 50,
+    "videos.list": 1,
+    "channels.list": 1,
+    "thumbnails.set": 50,
+    "playlistItems.insert": 50,
+    "search.list": 100
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quota_usage (
+    project TEXT NOT NULL,
+    day TEXT NOT NULL,
+    method TEXT NOT NULL,
+    calls INTEGER NOT NULL DEFAULT 0,
+    units INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (project, day, method)
+);
+"""
+
+# Method pseudo untuk menandai quota habis menurut server
+EXHAUSTED_METHOD = "_exhausted"
+
+
+def _us_pacific_offset(utc_now: datetime) -> timedelta:
+    """Offset waktu Pasifik tanpa tzdata: PDT dari Minggu kedua Maret s/d Minggu pertama November (02:00 lokal)"""
+    year = utc_now.year
+    march = datetime(year, 3, 8)
+    dst_start = march + timedelta(days=(6 - march.weekday()) % 7, hours=2 + 8)
+    november = datetime(year, 11, 1)
+    dst_end = november + timedelta(days=(6 - november.weekday()) % 7, hours=2 + 7)
+    naive = utc_now.replace(tzinfo=None)
+    return timedelta(hours=-7) if dst_start <= naive < dst_end else timedelta(hours=-8)
+
+
+def pacific_now() -> datetime:
+    """Waktu sekarang di zona Pasifik"""
+    utc_now = datetime.now(timezone.utc)
+    if PACIFIC is not None:
+        return utc_now.astimezone(PACIFIC)
+    return utc_now + _us_pacific_offset(utc_now)
+
+
+def quota_day() -> str:
+    """Tanggal quota saat ini (YYYY-MM-DD waktu Pasifik)"""
+    return pacific_now().strftime("%Y-%m-%d")
+
+
+def seconds_until_reset() -> float:
+    """Detik sampai quota reset (tengah malam waktu Pasifik berikutnya)"""
+    now = pacific_now()
+    midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return max(0.0, (midnight - now).total_seconds())
+
+
+def daily_quota() -> int:
+    try:
+        return int(os.environ.get(DAILY_QUOTA_ENV, DEFAULT_DAILY_QUOTA))
+    except ValueError:
+        return DEFAULT_DAILY_QUOTA
+
+
+class QuotaLedger:
+    def __init__(self, project: str, db_path: Path = DEFAULT_LEDGER_PATH, daily_limit: Optional[int] = None):
+        """
+        Initialize Quota Ledger
+
+        Args:
+            project: ID project Google Cloud (quota dihitung per project)
+            db_path: Path database SQLite
+            daily_limit: Quota harian (default dari YOUTUBE_DAILY_QUOTA atau 10000)
+        """
+        self.project = project
+        self.daily_limit = daily_limit if daily_limit is not None else daily_quota()
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _add(self, day: str, method: str, units: int):
+        self._conn.execute(
+            "INSERT INTO quota_usage (project, day, method, calls, units) VALUES (?, ?, ?, 1, ?) "
+            "ON CONFLICT (project, day, method) DO UPDATE SET calls = calls + 1, units = units + excluded.units",
+            (self.project, day, method, units)
+        )
+
+    def _used(self, day: str) -> int:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(units), 0) AS used FROM quota_usage WHERE project = ? AND day = ?",
+            (self.project, day)
+        ).fetchone()
+        return row["used"]
+
+    def record(self, method: str, units: Optional[int] = None):
+        """Catat satu request API (biaya default dari QUOTA_COSTS)"""
+        units = QUOTA_COSTS.get(method, 1) if units is None else units
+        with self._lock:
+            self._add(quota_day(), method, units)
+        self._observe(method, units)
+
+    def _observe(self, method: str, units: int):
+        metrics.QUOTA_UNITS.inc(units, project=self.project, method=method)
+        metrics.QUOTA_REMAINING.set(self.remaining(), project=self.project)
+
+    def try_spend(self, method: str, units: Optional[int] = None) -> bool:
+        """
+        Catat request hanya jika sisa quota hari ini cukup (atomik antar thread/proses)
+
+        Returns:
+            True jika quota dicatat dan request boleh dijalankan
+        """
+        units = QUOTA_COSTS.get(method, 1) if units is None else units
+        day = quota_day()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._used(day) + units > self.daily_limit:
+                    self._conn.execute("ROLLBACK")
+                    return False
+                self._add(day, method, units)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self._observe(method, units)
+        return True
+
+    def refund(self, method: str, units: Optional[int] = None):
+        """
+        Kembalikan unit yang dicatat untuk request yang tidak pernah diterima API
+        (tidak berlaku jika server sudah melaporkan quota hari ini habis)
+        """
+        units = QUOTA_COSTS.get(method, 1) if units is None else units
+        day = quota_day()
+        with self._lock:
+            refunded = self._conn.execute(
+                "UPDATE quota_usage SET calls = MAX(0, calls - 1), units = MAX(0, units - ?) "
+                "WHERE project = ? AND day = ? AND method = ? AND NOT EXISTS ("
+                "SELECT 1 FROM quota_usage WHERE project = ? AND day = ? AND method = ?)",
+                (units, self.project, day, method, self.project, day, EXHAUSTED_METHOD)
+            ).rowcount
+        # Counter unit tidak bisa dikurangi: refund dicatat di counter terpisah
+        if refunded:
+            metrics.QUOTA_REFUNDED_UNITS.inc(units, project=self.project, method=method)
+        metrics.QUOTA_REMAINING.set(self.remaining(), project=self.project)
+
+    def mark_exhausted(self):
+        """Server melaporkan quotaExceeded: anggap sisa quota hari ini nol"""
+        day = quota_day()
+        with self._lock:
+            remaining = self.daily_limit - self._used(day)
+            if remaining > 0:
+                self._add(day, EXHAUSTED_METHOD, remaining)
+        metrics.QUOTA_REMAINING.set(0, project=self.project)
+
+    def used(self) -> int:
+        with self._lock:
+            return self._used(quota_day())
+
+    def remaining(self) -> int:
+        return max(0, self.daily_limit - self.used())
+
+    def report(self) -> Dict[str, Any]:
+        """Ringkasan pemakaian quota hari ini tanpa request ke API"""
+        day = quota_day()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT method, calls, units FROM quota_usage WHERE project = ? AND day = ? ORDER BY units DESC",
+                (self.project, day)
+            ).fetchall()
+        used = sum(row["units"] for row in rows)
+        return {
+            "project": self.project,
+            "day": day,
+            "limit": self.daily_limit,
+            "used": used,
+            "remaining": max(0, self.daily_limit - used),
+            "exhausted": any(row["method"] == EXHAUSTED_METHOD for row in rows),
+            "resets_in_seconds": round(seconds_until_reset()),
+            "methods": {row["method"]: {"calls": row["calls"], "units": row["units"]} for row in rows}
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
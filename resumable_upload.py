@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Resumable Upload - Upload bertahap (chunked) untuk YouTube Data API
+File dibaca per chunk dari disk, ukuran chunk menyesuaikan throughput yang terukur
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaFileUpload
+
+# Ukuran chunk wajib kelipatan 256 KiB (aturan resumable upload Google)
+CHUNK_ALIGNMENT = 256 * 1024
+MIN_CHUNK_SIZE = 1024 * 1024
+MAX_CHUNK_SIZE = 64 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Target durasi satu chunk: cukup besar untuk throughput, cukup kecil supaya retry murah
+TARGET_CHUNK_SECONDS = 5.0
+
+# Session URI resumable upload berlaku sekitar satu minggu; dibuang sedikit lebih awal
+SESSION_TTL_SECONDS = 6 * 24 * 3600
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+def align_chunk_size(size: float) -> int:
+    """Bulatkan ke kelipatan 256 KiB di dalam batas MIN/MAX"""
+    size = max(MIN_CHUNK_SIZE, min(MAX_CHUNK_SIZE, int(size)))
+    return max(CHUNK_ALIGNMENT, size // CHUNK_ALIGNMENT * CHUNK_ALIGNMENT)
+
+
+class AdaptiveMediaFileUpload(MediaFileUpload):
+    """MediaFileUpload yang ukuran chunk-nya bisa diubah di tengah upload"""
+
+    def __init__(self, filename: str, mimetype: Optional[str] = None, chunksize: int = DEFAULT_CHUNK_SIZE):
+        super().__init__(filename, mimetype=mimetype, chunksize=align_chunk_size(chunksize), resumable=True)
+
+    def set_chunksize(self, chunksize: int):
+        self._chunksize = align_chunk_size(chunksize)
+
+
+class ChunkSizer:
+    def __init__(self, media: AdaptiveMediaFileUpload, target_seconds: float = TARGET_CHUNK_SECONDS):
+        """
+        Atur ukuran chunk berdasarkan throughput chunk sebelumnya
+
+        Args:
+            media: Media upload yang chunk-nya diatur
+            target_seconds: Target durasi satu chunk
+        """
+        self.media = media
+        self.target_seconds = target_seconds
+        self._rate: Optional[float] = None
+
+    @property
+    def chunk_size(self) -> int:
+        return self.media.chunksize()
+
+    def observe(self, sent_bytes: int, seconds: float) -> Optional[float]:
+        """
+        Catat satu chunk yang sudah di-ack server dan sesuaikan chunk berikutnya
+
+        Returns:
+            Throughput chunk ini dalam bytes/detik (None jika tidak terukur)
+        """
+        if sent_bytes <= 0 or seconds <= 0:
+            return None
+
+        rate = sent_bytes / seconds
+        # Exponential moving average supaya satu chunk lambat tidak langsung mengecilkan chunk
+        self._rate = rate if self._rate is None else 0.7 * self._rate + 0.3 * rate
+        self.media.set_chunksize(self._rate * self.target_seconds)
+        return rate
+
+    def shrink(self):
+        """Perkecil chunk setelah error supaya data yang dikirim ulang lebih sedikit"""
+        self.media.set_chunksize(self.chunk_size // 2)
+
+
+class ThroughputMeter:
+    def __init__(self, total_bytes: int, callback: Optional[ProgressCallback] = None, start_bytes: int = 0):
+        """
+        Hitung progress dan bytes/detik dari offset yang sudah di-ack server
+
+        Args:
+            total_bytes: Ukuran file
+            callback: Dipanggil dengan dict event progress
+            start_bytes: Offset awal (upload yang dilanjutkan), tidak dihitung ke throughput
+        """
+        self.total_bytes = total_bytes
+        self.callback = callback
+        self.start = time.time()
+        self.start_bytes = start_bytes
+        self.acked_bytes = start_bytes
+
+    def update(self, acked_bytes: int, chunk_rate: Optional[float], chunk_size: int) -> Dict[str, Any]:
+        self.acked_bytes = acked_bytes
+        elapsed = time.time() - self.start
+        event = {
+            "bytes_sent": acked_bytes,
+            "total_bytes": self.total_bytes,
+            "progress": acked_bytes / self.total_bytes if self.total_bytes else 1.0,
+            "bytes_per_second": chunk_rate,
+            "average_bytes_per_second": (acked_bytes - self.start_bytes) / elapsed if elapsed > 0 else None,
+            "chunk_size": chunk_size,
+            "elapsed_seconds": round(elapsed, 2)
+        }
+        if self.callback:
+            self.callback(event)
+        return event
+
+    def average_rate(self) -> Optional[float]:
+        elapsed = time.time() - self.start
+        return (self.acked_bytes - self.start_bytes) / elapsed if elapsed > 0 else None
+
+
+def file_fingerprint(path: str) -> Dict[str, Any]:
+    """Path absolut, ukuran dan mtime file"""
+    stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def query_upload_offset(http, uri: str, total_bytes: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Tanya server berapa byte session resumable yang sudah diterima (PUT kosong, Content-Range: bytes */total)
+    
+    Returns:
+        Tuple (offset berikutnya, response body jika upload ternyata sudah selesai)
+    
+    Raises:
+        HttpError: Session tidak dikenal lagi (404/410) atau error lain dari server
+    """
+    resp, content = http.request(uri, "PUT", body=b"",
+                                 headers={"Content-Range": f"bytes */{total_bytes}", "Content-Length": "0"})
+    if resp.status in (200, 201):
+        return total_bytes, json.loads(content.decode('utf-8') if isinstance(content, bytes) else content)
+    if resp.status == 308:
+        # Header range: "bytes=0-<byte terakhir>"; tanpa header berarti belum ada byte yang diterima
+        received = resp.get('range')
+        return (int(received.rsplit('-', 1)[1]) + 1 if received else 0), None
+    raise HttpError(resp, content, uri=uri)
+
+
+class UploadSessionStore:
+    def __init__(self, path: Path, log: Optional[Callable[[str, str], None]] = None,
+                 ttl: float = SESSION_TTL_SECONDS):
+        """
+        Simpan session URI resumable upload supaya upload bisa dilanjutkan setelah proses restart
+
+        Args:
+            path: Path file JSON session
+            log: Fungsi logging (message, level)
+            ttl: Umur maksimal session dalam detik
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._log_fn = log
+        self._lock = threading.Lock()
+
+    def _log(self, message: str, level: str = "INFO"):
+        if self._log_fn:
+            self._log_fn(message, level)
+
+    @staticmethod
+    def session_key(video_path: str, metadata: Dict[str, Any]) -> str:
+        """Kunci session: fingerprint file + metadata upload"""
+        payload = json.dumps({"file": file_fingerprint(video_path), "metadata": metadata}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data: Dict[str, Dict[str, Any]]):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self._log(f"Gagal menyimpan session upload: {e}", "WARNING")
+
+    def _expired(self, session: Dict[str, Any]) -> bool:
+        if time.time() - session.get("created_at", 0) > self.ttl:
+            return True
+        fingerprint = session.get("file", {})
+        try:
+            return file_fingerprint(fingerprint.get("path", "")) != fingerprint
+        except OSError:
+            return True
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Session yang masih berlaku untuk kunci ini (None jika tidak ada)"""
+        with self._lock:
+            session = self._read().get(key)
+        if session and not self._expired(session):
+            return session
+        return None
+
+    def save(self, key: str, uri: str, offset: int, video_path: str):
+        """Simpan/update session URI dan offset yang sudah di-ack server"""
+        with self._lock:
+            data = self._read()
+            session = data.get(key)
+            if not session or session.get("uri") != uri:
+                session = {"uri": uri, "file": file_fingerprint(video_path), "created_at": time.time()}
+            session["offset"] = offset
+            session["updated_at"] = time.time()
+            data[key] = session
+            self._write(data)
+
+    def remove(self, key: str):
+        with self._lock:
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+    def collect_garbage(self) -> int:
+        """Hapus session yang kedaluwarsa atau file-nya sudah berubah/hilang"""
+        with self._lock:
+            data = self._read()
+            expired = [key for key, session in data.items() if self._expired(session)]
+            for key in expired:
+                del data[key]
+            if expired:
+                self._write(data)
+        if expired:
+            self._log(f"{len(expired)} session upload kedaluwarsa dihapus", "DEBUG")
+        return len(expired)
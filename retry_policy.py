@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Retry Policy - Klasifikasi error upload YouTube dan backoff eksponensial dengan jitter
+Quota habis dan error client gagal langsung, error server/rate limit/network di-retry
+dengan delay berbeda per kategori
+"""
+
+import random
+import socket
+import ssl
+import http.client
+from typing import Dict, FrozenSet, Optional
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+# Kategori error
+QUOTA = "quota"                      # 403 quotaExceeded / dailyLimitExceeded: baru pulih setelah reset harian
+RATE_LIMIT = "rate_limit"            # 429 / 403 rateLimitExceeded: pulih dalam hitungan detik
+SERVER = "server"                    # 5xx / 408
+SESSION_EXPIRED = "session_expired"  # 404 / 410 pada session URI resumable
+NETWORK = "network"                  # connection reset, timeout, putus di tengah chunk
+CLIENT = "client"                    # 4xx lain: request salah, retry tidak membantu
+UNKNOWN = "unknown"                  # exception lain (bug, file, dsb.)
+
+QUOTA_REASONS = ("quotaExceeded", "dailyLimitExceeded")
+RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+_NETWORK_ERRORS = (ConnectionError, TimeoutError, socket.timeout, ssl.SSLError,
+                   http.client.HTTPException, httplib2.HttpLib2Error)
+
+DEFAULT_RETRYABLE = frozenset({SERVER, RATE_LIMIT, NETWORK})
+
+# Delay dasar per kategori (detik): putus koneksi tidak berarti server sibuk, jadi cukup jeda singkat
+# sebelum query offset; rate limit butuh jeda paling panjang
+DEFAULT_BASE_DELAYS = {
+    NETWORK: 0.25,
+    SERVER: 1.0,
+    RATE_LIMIT: 2.0
+}
+
+
+def _content(error: HttpError) -> str:
+    return error.content.decode('utf-8', 'ignore') if isinstance(error.content, bytes) else str(error.content)
+
+
+def classify_error(error: BaseException) -> str:
+    """Kategori error dari satu percobaan upload chunk"""
+    if isinstance(error, HttpError):
+        status = error.resp.status
+        if status in (403, 429):
+            content = _content(error)
+            if any(reason in content for reason in QUOTA_REASONS):
+                return QUOTA
+            if status == 429 or any(reason in content for reason in RATE_LIMIT_REASONS):
+                return RATE_LIMIT
+            return CLIENT
+        if status >= 500 or status == 408:
+            return SERVER
+        if status in (404, 410):
+            return SESSION_EXPIRED
+        return CLIENT
+    if isinstance(error, _NETWORK_ERRORS):
+        return NETWORK
+    return UNKNOWN
+
+
+class RetryPolicy:
+    def __init__(self, max_retries: int = 6, base_delays: Optional[Dict[str, float]] = None,
+                 max_delay: float = 32.0, jitter: bool = True, retryable: FrozenSet[str] = DEFAULT_RETRYABLE):
+        """
+        Tentukan error mana yang di-retry dan berapa lama menunggu
+
+        Args:
+            max_retries: Retry berturut-turut maksimal (chunk yang berhasil mereset hitungan)
+            base_delays: Delay dasar per kategori; delay retry ke-n = base * 2**n, dibatasi max_delay
+            max_delay: Batas atas delay satu retry (detik)
+            jitter: Full jitter (delay acak 0..batas) supaya banyak worker tidak retry serentak
+            retryable: Kategori yang boleh di-retry
+        """
+        self.max_retries = max_retries
+        self.base_delays = dict(DEFAULT_BASE_DELAYS if base_delays is None else base_delays)
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retryable = frozenset(retryable)
+
+    def should_retry(self, category: str, retry: int) -> bool:
+        """retry: nomor retry yang akan dilakukan (mulai dari 1)"""
+        return category in self.retryable and retry <= self.max_retries
+
+    def delay(self, category: str, retry: int) -> float:
+        cap = min(self.max_delay, self.base_delays.get(category, 1.0) * 2 ** retry)
+        return random.uniform(0, cap) if self.jitter else cap
+
+    def scaled(self, factor: float) -> "RetryPolicy":
+        """Salinan dengan semua delay dikali factor (untuk harness fault injection yang cepat)"""
+        return RetryPolicy(self.max_retries, {k: v * factor for k, v in self.base_delays.items()},
+                           self.max_delay * factor, self.jitter, self.retryable)
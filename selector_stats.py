@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Selector Stats - Statistik hit/miss/latency per selector yang disimpan di disk
+Dipakai untuk mengurutkan ulang kandidat selector berdasarkan tingkat keberhasilan
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from colorama import init, Fore, Style
+import argparse
+
+# Initialize colorama
+init(autoreset=True)
+
+DEFAULT_STATS_PATH = Path(__file__).parent / "cache" / "selector_stats.json"
+
+# Urutan asli dipertahankan sampai selector punya data sebanyak ini
+MIN_ATTEMPTS_FOR_REORDER = 3
+
+
+def _empty_entry() -> Dict[str, float]:
+    return {"hits": 0, "misses": 0, "latency_total": 0.0}
+
+
+class SelectorStats:
+    def __init__(self, path: Path = DEFAULT_STATS_PATH, log: Optional[Callable[[str, str], None]] = None):
+        """
+        Initialize Selector Stats
+
+        Args:
+            path: Path file JSON statistik
+            log: Fungsi logging (message, level)
+        """
+        self.path = Path(path)
+        self._log_fn = log
+        self._lock = threading.Lock()
+        self._data = self._read()
+        # Perubahan yang belum ditulis, di-merge ke file saat save()
+        self._pending: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    def _log(self, message: str, level: str = "INFO"):
+        if self._log_fn:
+            self._log_fn(message, level)
+
+    def _read(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _bump(self, group: str, selector: str, hit: bool, latency: float = 0.0):
+        for store in (self._data, self._pending):
+            entry = store.setdefault(group, {}).setdefault(selector, _empty_entry())
+            if hit:
+                entry["hits"] += 1
+                entry["latency_total"] += latency
+            else:
+                entry["misses"] += 1
+
+    def record(self, group: str, tried: List[str], matched: Optional[str], latency: float = 0.0):
+        """
+        Catat hasil satu lookup
+
+        Args:
+            group: Nama grup selector, misalnya 'tiktok.post_button'
+            tried: Selector dalam urutan dicoba
+            matched: Selector yang cocok (None jika semua gagal)
+            latency: Waktu sampai selector cocok dalam detik
+        """
+        with self._lock:
+            for selector in tried:
+                if selector == matched:
+                    self._bump(group, selector, True, latency)
+                    break
+                self._bump(group, selector, False)
+
+    def _score(self, entry: Dict[str, float]):
+        attempts = entry["hits"] + entry["misses"]
+        # Laplace smoothing supaya selector baru tidak langsung dianggap mati
+        success_rate = (entry["hits"] + 1) / (attempts + 2)
+        mean_latency = entry["latency_total"] / entry["hits"] if entry["hits"] else float("inf")
+        return (-success_rate, mean_latency)
+
+    def order(self, group: str, selectors: List[str]) -> List[str]:
+        """Urutkan selector: tingkat sukses tertinggi dan latency tercepat dulu"""
+        with self._lock:
+            stats = self._data.get(group, {})
+            entries = [stats.get(s) for s in selectors]
+
+        if not any(e and e["hits"] + e["misses"] >= MIN_ATTEMPTS_FOR_REORDER for e in entries):
+            return list(selectors)
+
+        def sort_key(item):
+            index, selector = item
+            entry = entries[index]
+            if not entry or entry["hits"] + entry["misses"] < MIN_ATTEMPTS_FOR_REORDER:
+                # Belum cukup data: skor netral, urutan asli sebagai tie-break
+                return (-0.5, float("inf"), index)
+            return self._score(entry) + (index,)
+
+        return [s for _, s in sorted(enumerate(selectors), key=sort_key)]
+
+    def save(self):
+        """Merge perubahan ke file (aman jika beberapa proses menulis bergantian)"""
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+
+            data = self._read()
+            for group, selectors in pending.items():
+                for selector, delta in selectors.items():
+                    entry = data.setdefault(group, {}).setdefault(selector, _empty_entry())
+                    for key in entry:
+                        entry[key] += delta.get(key, 0)
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                self._data = data
+            except OSError as e:
+                self._log(f"Gagal menyimpan statistik selector: {e}", "WARNING")
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Semua statistik selector sebagai list baris"""
+        with self._lock:
+            rows = []
+            for group, selectors in sorted(self._data.items()):
+                for selector, entry in selectors.items():
+                    attempts = entry["hits"] + entry["misses"]
+                    rows.append({
+                        "group": group,
+                        "selector": selector,
+                        "hits": entry["hits"],
+                        "misses": entry["misses"],
+                        "hit_rate": entry["hits"] / attempts if attempts else 0.0,
+                        "mean_latency": entry["latency_total"] / entry["hits"] if entry["hits"] else None
+                    })
+            return rows
+
+    def dead_selectors(self, min_attempts: int = 5) -> List[Dict[str, Any]]:
+        """Selector yang tidak pernah cocok setelah minimal min_attempts percobaan"""
+        return [row for row in self.report() if row["hits"] == 0 and row["misses"] >= min_attempts]
+
+    def clear(self):
+        """Hapus semua statistik"""
+        with self._lock:
+            self._data = {}
+            self._pending = {}
+            if self.path.exists():
+                self.path.unlink()
+
+
+def _short(selector: str, width: int = 70) -> str:
+    return selector if len(selector) <= width else selector[:width - 3] + "..."
+
+
+def print_report(stats: SelectorStats, min_attempts: int = 5):
+    """Cetak laporan statistik dan selector mati"""
+    rows = stats.report()
+    if not rows:
+        print(f"{Fore.YELLOW}⚠️ Belum ada statistik selector")
+        return
+
+    current_group = None
+    for row in rows:
+        if row["group"] != current_group:
+            current_group = row["group"]
+            print(f"\n{Fore.MAGENTA}📊 {current_group}")
+        latency = f"{row['mean_latency']:.2f}s" if row["mean_latency"] is not None else "-"
+        color = Fore.GREEN if row["hits"] else Fore.RED
+        print(f"{color}  {row['hit_rate'] * 100:5.1f}% "
+              f"({row['hits']}/{row['hits'] + row['misses']}) {latency:>7}  {_short(row['selector'])}{Style.RESET_ALL}")
+
+    dead = stats.dead_selectors(min_attempts)
+    print()
+    if dead:
+        print(f"{Fore.RED}💀 Selector mati (0 hit dari minimal {min_attempts} percobaan): {len(dead)}")
+        for row in dead:
+            print(f"{Fore.RED}  [{row['group']}] {_short(row['selector'])}")
+    else:
+        print(f"{Fore.GREEN}✅ Tidak ada selector mati")
+
+
+def main():
+    """Main function untuk CLI"""
+    parser = argparse.ArgumentParser(description="Laporan statistik selector")
+    parser.add_argument("--min-attempts", type=int, default=5, help="Minimal percobaan sebelum selector dianggap mati")
+    parser.add_argument("--clear", action="store_true", help="Hapus semua statistik selector")
+
+    args = parser.parse_args()
+
+    stats = SelectorStats()
+    if args.clear:
+        stats.clear()
+        print(f"{Fore.GREEN}✅ Statistik selector dihapus")
+        return
+
+    print_report(stats, args.min_attempts)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,25 +6,98 @@ Dengan dukungan YouTube Data API v3
 
 import os
 import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 from colorama import init, Fore, Style
 import argparse
 
-# Import uploader classes
-from tiktok_uploader import TikTokUploader
-from facebook_uploader import FacebookUploader
-from youtube_api_uploader import YouTubeAPIUploader
+# Modul platform (Selenium, Google API client) baru di-import saat uploader-nya dipakai,
+# supaya --help dan perintah satu platform tidak membayar biaya import semuanya
+if TYPE_CHECKING:
+    from driver_pool import DriverPool
+    from tiktok_uploader import TikTokUploader
+    from facebook_uploader import FacebookUploader
+    from youtube_api_uploader import YouTubeAPIUploader
 
 # Initialize colorama
 init(autoreset=True)
 
+# Platform video yang didukung upload_to_all_video_platforms
+VIDEO_PLATFORMS = ['tiktok', 'facebook_reels', 'youtube_shorts']
+
+# Batas waktu default per platform (detik) untuk upload paralel
+DEFAULT_PLATFORM_TIMEOUTS = {
+    'tiktok': 600,
+    'facebook_reels': 600,
+    'youtube_shorts': 1800
+}
+
+# Waktu tunggu maksimal (detik) worker yang di-abort berhenti di batas fase/chunk berikutnya
+ABORT_GRACE_SECONDS = 30
+
 class SocialMediaUploader:
-    def __init__(self, headless: bool = False, debug: bool = False):
+    def __init__(self, headless: bool = False, debug: bool = False, reuse_browser: bool = False, max_browser_uses: int = 25,
+                 offline_driver: bool = False, force_upload: bool = False, block_requests: bool = False,
+                 page_load_strategy: str = 'normal', timings_log: Optional[str] = None):
         self.headless = headless
         self.debug = debug
-        self.tiktok_uploader = TikTokUploader(headless=headless, debug=debug)
-        self.facebook_uploader = FacebookUploader(headless=headless, debug=debug)
-        self.youtube_uploader = YouTubeAPIUploader(debug=debug)
+        self.reuse_browser = reuse_browser
+        self.max_browser_uses = max_browser_uses
+        self.offline_driver = offline_driver
+        self.force_upload = force_upload
+        self.block_requests = block_requests
+        self.page_load_strategy = page_load_strategy
+        self.timings_log = timings_log
+        
+        # Pool browser yang dipasang ke uploader saat dibuat (misalnya dibagi antar worker bulk upload)
+        self.driver_pools: Dict[str, "DriverPool"] = {}
+        
+        # Uploader dibuat saat pertama kali dipakai
+        self._uploaders: Dict[str, Any] = {}
+        self._uploaders_lock = threading.Lock()
+
+    def _browser_uploader(self, key: str, uploader_cls):
+        uploader = uploader_cls(headless=self.headless, debug=self.debug, offline_driver=self.offline_driver,
+                                force_upload=self.force_upload, block_requests=self.block_requests,
+                                page_load_strategy=self.page_load_strategy, timings_log=self.timings_log)
+        if key in self.driver_pools:
+            uploader.driver_pool = self.driver_pools[key]
+        elif self.reuse_browser:
+            # Pakai ulang browser yang sudah login antar upload
+            uploader.enable_driver_pool(max_uses=self.max_browser_uses)
+        return uploader
+
+    def _get_uploader(self, key: str):
+        with self._uploaders_lock:
+            uploader = self._uploaders.get(key)
+            if uploader is None:
+                if key == 'tiktok':
+                    from tiktok_uploader import TikTokUploader
+                    uploader = self._browser_uploader(key, TikTokUploader)
+                elif key == 'facebook':
+                    from facebook_uploader import FacebookUploader
+                    uploader = self._browser_uploader(key, FacebookUploader)
+                else:
+                    from youtube_api_uploader import YouTubeAPIUploader
+                    uploader = YouTubeAPIUploader(debug=self.debug, force_upload=self.force_upload,
+                                                  timings_log=self.timings_log)
+                self._uploaders[key] = uploader
+            return uploader
+
+    @property
+    def tiktok_uploader(self) -> "TikTokUploader":
+        return self._get_uploader('tiktok')
+
+    @property
+    def facebook_uploader(self) -> "FacebookUploader":
+        return self._get_uploader('facebook')
+
+    @property
+    def youtube_uploader(self) -> "YouTubeAPIUploader":
+        return self._get_uploader('youtube')
 
     def _log(self, message: str, level: str = "INFO"):
         """Simple logging"""
@@ -74,55 +147,113 @@ class SocialMediaUploader:
         
         return self.youtube_uploader.upload_shorts(video_path, title, description, privacy)
 
-    def upload_to_all_video_platforms(self, video_path: str, tiktok_caption: str, facebook_description: str, youtube_title: str, youtube_description: str = "", youtube_privacy: str = "public"):
-        """Upload video ke TikTok, Facebook Reels, dan YouTube Shorts sekaligus"""
-        results = {}
-        
-        # Upload ke TikTok
+    def _run_platform(self, key: str, name: str, intro: str, upload_fn: Callable[..., Dict[str, Any]], *args) -> Dict[str, Any]:
+        """Jalankan upload satu platform, catat hasil dan wall time-nya"""
+        start = time.time()
         try:
-            self._log("📱 Mengupload ke TikTok...", "INFO")
-            tiktok_result = self.upload_to_tiktok(video_path, tiktok_caption)
-            results['tiktok'] = tiktok_result
+            self._log(intro, "INFO")
+            result = upload_fn(*args)
             
-            if tiktok_result['success']:
-                self._log("TikTok upload berhasil!", "SUCCESS")
+            if result['success']:
+                self._log(f"{name} upload berhasil!", "SUCCESS")
+                if 'video_url' in result:
+                    self._log(f"Video URL: {result.get('video_url', 'N/A')}", "INFO")
             else:
-                self._log(f"TikTok upload gagal: {tiktok_result['message']}", "ERROR")
+                self._log(f"{name} upload gagal: {result['message']}", "ERROR")
         except Exception as e:
-            self._log(f"Error TikTok upload: {str(e)}", "ERROR")
-            results['tiktok'] = {"success": False, "message": str(e)}
+            self._log(f"Error {name} upload: {str(e)}", "ERROR")
+            result = {"success": False, "message": str(e)}
         
-        # Upload ke Facebook Reels
-        try:
-            self._log("📘 Mengupload reels ke Facebook...", "INFO")
-            facebook_result = self.upload_to_facebook_reels(video_path, facebook_description)
-            results['facebook_reels'] = facebook_result
-            
-            if facebook_result['success']:
-                self._log("Facebook Reels upload berhasil!", "SUCCESS")
-            else:
-                self._log(f"Facebook Reels upload gagal: {facebook_result['message']}", "ERROR")
-        except Exception as e:
-            self._log(f"Error Facebook Reels upload: {str(e)}", "ERROR")
-            results['facebook_reels'] = {"success": False, "message": str(e)}
+        result['elapsed_seconds'] = round(time.time() - start, 2)
+        return result
+
+    def upload_to_all_video_platforms(self, video_path: str, tiktok_caption: str, facebook_description: str, youtube_title: str, youtube_description: str = "", youtube_privacy: str = "public",
+                                      parallel: bool = False, timeouts: Optional[Dict[str, float]] = None,
+                                      platforms: Optional[List[str]] = None):
+        """
+        Upload video ke TikTok, Facebook Reels, dan YouTube Shorts sekaligus
+        
+        Args:
+            parallel: Jalankan ketiga upload bersamaan di thread pool
+            timeouts: Batas waktu per platform dalam detik (mode paralel),
+                      key: 'tiktok', 'facebook_reels', 'youtube_shorts'
+            platforms: Hanya upload ke platform ini (default: semua)
+        """
+        jobs = [
+            ('tiktok', "TikTok", "📱 Mengupload ke TikTok...",
+             self.upload_to_tiktok, (video_path, tiktok_caption)),
+            ('facebook_reels', "Facebook Reels", "📘 Mengupload reels ke Facebook...",
+             self.upload_to_facebook_reels, (video_path, facebook_description)),
+            ('youtube_shorts', "YouTube Shorts", "📺 Mengupload ke YouTube Shorts (API)...",
+             self.upload_to_youtube_shorts, (video_path, youtube_title, youtube_description, youtube_privacy))
+        ]
+        if platforms is not None:
+            jobs = [job for job in jobs if job[0] in platforms]
         
-        # Upload ke YouTube Shorts
-        try:
-            self._log("📺 Mengupload ke YouTube Shorts (API)...", "INFO")
-            youtube_result = self.upload_to_youtube_shorts(video_path, youtube_title, youtube_description, youtube_privacy)
-            results['youtube_shorts'] = youtube_result
+        results = {}
+        start = time.time()
+        
+        if not parallel:
+            for key, name, intro, upload_fn, args in jobs:
+                results[key] = self._run_platform(key, name, intro, upload_fn, *args)
+        else:
+            timeouts = {**DEFAULT_PLATFORM_TIMEOUTS, **(timeouts or {})}
+            self._log("🚀 Upload paralel ke semua platform...", "INFO")
             
-            if youtube_result['success']:
-                self._log("YouTube Shorts upload berhasil!", "SUCCESS")
-                self._log(f"Video URL: {youtube_result.get('video_url', 'N/A')}", "INFO")
-            else:
-                self._log(f"YouTube Shorts upload gagal: {youtube_result['message']}", "ERROR")
-        except Exception as e:
-            self._log(f"Error YouTube Shorts upload: {str(e)}", "ERROR")
-            results['youtube_shorts'] = {"success": False, "message": str(e)}
+            executor = ThreadPoolExecutor(max_workers=max(1, len(jobs)), thread_name_prefix="upload")
+            futures = {
+                key: executor.submit(self._run_platform, key, name, intro, upload_fn, *args)
+                for key, name, intro, upload_fn, args in jobs
+            }
+            
+            timed_out = []
+            for key, name, _, _, _ in jobs:
+                # Deadline dihitung dari awal fan-out, bukan dari saat result() dipanggil
+                remaining = max(0, timeouts[key] - (time.time() - start))
+                try:
+                    results[key] = futures[key].result(timeout=remaining)
+                except FutureTimeoutError:
+                    self._log(f"{name} upload timeout setelah {timeouts[key]} detik", "ERROR")
+                    self._abort_platform(key)
+                    timed_out.append((key, name))
+                    results[key] = {
+                        "success": False,
+                        "message": f"Timeout setelah {timeouts[key]} detik",
+                        "elapsed_seconds": round(time.time() - start, 2)
+                    }
+            
+            # Beri worker yang di-abort waktu terbatas untuk berhenti (browser ditutup, YouTube setelah chunk saat ini)
+            grace_deadline = time.time() + ABORT_GRACE_SECONDS
+            for key, name in timed_out:
+                try:
+                    late = futures[key].result(timeout=max(0, grace_deadline - time.time()))
+                except FutureTimeoutError:
+                    self._log(f"{name} belum berhenti {ABORT_GRACE_SECONDS} detik setelah abort, worker ditinggalkan", "WARNING")
+                    continue
+                if late.get('success'):
+                    # Chunk/langkah terakhir selesai sebelum abort sempat berlaku: video sudah terpublish
+                    self._log(f"{name} upload ternyata selesai setelah timeout", "WARNING")
+                    results[key] = {**late, "timed_out": True}
+            executor.shutdown(wait=False)
+        
+        total = time.time() - start
+        per_platform = ", ".join(f"{key} {result.get('elapsed_seconds', 0):.1f}s" for key, result in results.items())
+        self._log(f"⏱️ Total waktu upload: {total:.1f}s ({per_platform})", "INFO")
         
         return results
 
+    def _abort_platform(self, key: str):
+        """Hentikan upload yang timeout: browser ditutup, upload YouTube berhenti sebelum chunk berikutnya"""
+        uploader = self._uploaders.get({'facebook_reels': 'facebook', 'youtube_shorts': 'youtube'}.get(key, key))
+        if uploader:
+            uploader.abort()
+
+    def close(self):
+        """Tutup semua browser yang masih hidup di pool"""
+        for key in ('tiktok', 'facebook'):
+            if key in self._uploaders:
+                self._uploaders[key].close()
+
     def check_all_cookies(self):
         """Cek status cookies untuk semua platform"""
         self._log("📱 Status Cookies TikTok:", "INFO")
@@ -182,12 +313,67 @@ def main():
     parser.add_argument("--check-cookies", action="store_true", help="Cek status semua cookies")
     parser.add_argument("--check-youtube-quota", action="store_true", help="Cek YouTube API quota")
     parser.add_argument("--youtube-channel-info", action="store_true", help="Info channel YouTube")
+    parser.add_argument("--selector-report", action="store_true", help="Laporan statistik selector dan selector mati")
     parser.add_argument("--platform", "-p", choices=['tiktok', 'facebook-status', 'facebook-reels', 'youtube-shorts', 'all-video'], help="Platform target")
+    parser.add_argument("--reuse-browser", action="store_true", help="Pakai ulang browser yang sudah login antar upload")
+    parser.add_argument("--max-browser-uses", type=int, default=25, help="Recycle browser setelah dipakai sebanyak ini")
+    parser.add_argument("--offline-driver", action="store_true", help="Resolusi ChromeDriver tanpa akses network")
+    parser.add_argument("--parallel", action="store_true", help="Upload all-video / setiap baris manifest ke semua platform secara bersamaan")
+    parser.add_argument("--platform-timeout", type=float, help="Batas waktu per platform (detik) untuk upload paralel")
+    parser.add_argument("--manifest", help="Bulk upload dari manifest .jsonl/.csv (satu video per baris)")
+    parser.add_argument("--workers", type=int, default=1, help="Jumlah worker untuk bulk upload manifest")
+    parser.add_argument("--manifest-report", help="Tulis hasil per baris manifest ke file JSON lines")
+    parser.add_argument("--queue", action="store_true", help="Simpan status upload per platform di antrian persisten (manifest / all-video)")
+    parser.add_argument("--resume", action="store_true", help="Lanjutkan job di antrian yang belum selesai")
+    parser.add_argument("--queue-status", action="store_true", help="Tampilkan status antrian upload")
+    parser.add_argument("--force", action="store_true", help="Upload ulang walaupun video sudah pernah diupload ke akun yang sama")
+    parser.add_argument("--block-requests", action="store_true", help="Blokir analytics, iklan, font dan preview media di browser")
+    parser.add_argument("--page-load-strategy", choices=['normal', 'eager', 'none'], default='normal',
+                        help="Strategi load halaman; eager/none lanjut begitu elemen kunci halaman ada")
+    parser.add_argument("--timings-log", help="Tulis timing per fase setiap upload ke file JSON lines")
+    parser.add_argument("--metrics-port", type=int, help="Ekspos metrics Prometheus di http://127.0.0.1:PORT/metrics")
+    parser.add_argument("--metrics-textfile", help="Tulis metrics ke file .prom untuk textfile collector node_exporter")
     
     args = parser.parse_args()
     
-    uploader = SocialMediaUploader(headless=args.headless, debug=args.debug)
+    if args.metrics_port or args.metrics_textfile:
+        import metrics
+        if args.metrics_textfile:
+            metrics.enable_textfile(args.metrics_textfile)
+        if args.metrics_port:
+            metrics.start_http_server(args.metrics_port)
+            print(f"{Fore.CYAN}ℹ️ Metrics tersedia di http://127.0.0.1:{args.metrics_port}/metrics")
+    
+    uploader = SocialMediaUploader(
+        headless=args.headless,
+        debug=args.debug,
+        reuse_browser=args.reuse_browser,
+        max_browser_uses=args.max_browser_uses,
+        offline_driver=args.offline_driver,
+        force_upload=args.force,
+        block_requests=args.block_requests,
+        page_load_strategy=args.page_load_strategy,
+        timings_log=args.timings_log
+    )
     
+    try:
+        run_cli(uploader, args)
+    finally:
+        uploader.close()
+        if args.metrics_textfile:
+            # Snapshot terakhir (browser launch, selector, quota sesudah upload terakhir)
+            metrics.write_textfile()
+
+
+def platform_timeouts(args) -> Optional[Dict[str, float]]:
+    """Timeout per platform dari argumen CLI"""
+    if not args.platform_timeout:
+        return None
+    return {key: args.platform_timeout for key in DEFAULT_PLATFORM_TIMEOUTS}
+
+
+def run_cli(uploader: SocialMediaUploader, args):
+    """Jalankan aksi CLI / mode interaktif"""
     # Handle different actions
     if args.clear_cookies:
         uploader.clear_all_cookies()
@@ -205,6 +391,55 @@ def main():
         uploader.get_youtube_channel_info()
         return
     
+    if args.selector_report:
+        from selector_stats import SelectorStats, print_report
+        print_report(SelectorStats())
+        return
+    
+    if args.queue_status:
+        from job_queue import JobQueue, print_status
+        print_status(JobQueue())
+        return
+    
+    # Bulk upload dari manifest atau lanjutkan antrian
+    if args.manifest or args.resume:
+        if args.manifest and not os.path.exists(args.manifest):
+            print(f"{Fore.RED}❌ File manifest tidak ditemukan: {args.manifest}")
+            sys.exit(1)
+        
+        from bulk_uploader import BulkUploader, print_summary
+        from job_queue import JobQueue
+        
+        bulk = BulkUploader(
+            headless=args.headless,
+            debug=args.debug,
+            workers=args.workers,
+            offline_driver=args.offline_driver,
+            max_browser_uses=args.max_browser_uses,
+            force_upload=args.force,
+            block_requests=args.block_requests,
+            page_load_strategy=args.page_load_strategy,
+            timings_log=args.timings_log,
+            defaults={
+                "tiktok_caption": args.tiktok_caption,
+                "facebook_description": args.facebook_description,
+                "youtube_description": args.youtube_description,
+                "youtube_privacy": args.youtube_privacy
+            },
+            queue=JobQueue() if args.queue or args.resume else None,
+            parallel=args.parallel,
+            timeouts=platform_timeouts(args)
+        )
+        if args.manifest:
+            summary = bulk.run(args.manifest, report_path=args.manifest_report)
+        else:
+            summary = bulk.resume(report_path=args.manifest_report)
+        print_summary(summary)
+        
+        if summary["items"] and summary["failed_items"] == summary["items"]:
+            sys.exit(1)
+        return
+    
     # Handle platform-specific uploads
     if args.platform:
         if args.platform == 'tiktok':
@@ -283,14 +518,31 @@ def main():
                 print(f"{Fore.RED}❌ YouTube title diperlukan untuk upload ke semua platform")
                 sys.exit(1)
             
-            results = uploader.upload_to_all_video_platforms(
-                args.video, 
-                args.tiktok_caption, 
-                args.facebook_description, 
-                args.youtube_title, 
-                args.youtube_description, 
-                args.youtube_privacy
-            )
+            if args.queue:
+                from job_queue import JobQueue
+                
+                queue = JobQueue()
+                job_id = queue.enqueue(args.video, VIDEO_PLATFORMS, {
+                    "tiktok_caption": args.tiktok_caption,
+                    "facebook_description": args.facebook_description,
+                    "youtube_title": args.youtube_title,
+                    "youtube_description": args.youtube_description,
+                    "youtube_privacy": args.youtube_privacy
+                })
+                print(f"{Fore.CYAN}📋 Job {job_id} masuk antrian (lanjutkan dengan --resume jika terputus)")
+                results = queue.run_job(job_id, uploader, parallel=args.parallel,
+                                        timeouts=platform_timeouts(args))["results"]
+            else:
+                results = uploader.upload_to_all_video_platforms(
+                    args.video, 
+                    args.tiktok_caption, 
+                    args.facebook_description, 
+                    args.youtube_title, 
+                    args.youtube_description, 
+                    args.youtube_privacy,
+                    parallel=args.parallel,
+                    timeouts=platform_timeouts(args)
+                )
             
             success_count = sum(1 for result in results.values() if result.get('success', False))
             total_count = len(results)
@@ -469,7 +721,9 @@ def main():
                 facebook_description, 
                 youtube_title, 
                 youtube_description, 
-                youtube_privacy
+                youtube_privacy,
+                parallel=args.parallel,
+                timeouts=platform_timeouts(args)
             )
             
             success_count = sum(1 for result in results.values() if result.get('success', False))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark - Ukur waktu start CLI social_media_uploader
+Membandingkan import lazy (sekarang) dengan import semua modul platform di depan (eager)
+"""
+
+import sys
+import time
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from colorama import init, Fore, Style
+import argparse
+
+# Initialize colorama
+init(autoreset=True)
+
+BASE_DIR = Path(__file__).parent
+
+# Simulasi perilaku lama: semua modul platform di-import saat start
+EAGER_PREFIX = "import tiktok_uploader, facebook_uploader, youtube_api_uploader\n"
+
+
+def _cli(*argv: str) -> str:
+    return (
+        "import sys, runpy\n"
+        f"sys.argv = ['social_media_uploader.py', {', '.join(repr(a) for a in argv)}]\n"
+        "runpy.run_path('social_media_uploader.py', run_name='__main__')\n"
+    )
+
+
+SCENARIOS = {
+    "--help": _cli("--help"),
+    "--check-youtube-quota": _cli("--check-youtube-quota"),
+    "--queue-status": _cli("--queue-status"),
+    "tiktok saja (setup uploader)": (
+        "from social_media_uploader import SocialMediaUploader\n"
+        "SocialMediaUploader().tiktok_uploader\n"
+    ),
+    "youtube saja (setup uploader)": (
+        "from social_media_uploader import SocialMediaUploader\n"
+        "SocialMediaUploader().youtube_uploader\n"
+    )
+}
+
+
+def time_run(code: str) -> Optional[float]:
+    """Jalankan kode di interpreter baru, kembalikan wall time (None jika gagal)"""
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", code], cwd=BASE_DIR,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - start
+    return elapsed if proc.returncode == 0 else None
+
+
+def measure(code: str, runs: int) -> Optional[Dict[str, float]]:
+    samples: List[float] = []
+    for _ in range(runs):
+        elapsed = time_run(code)
+        if elapsed is None:
+            return None
+        samples.append(elapsed)
+    return {"median": statistics.median(samples), "min": min(samples)}
+
+
+def _fmt(stats: Optional[Dict[str, float]]) -> str:
+    return f"{stats['median'] * 1000:8.0f}ms" if stats else f"{'gagal':>10}"
+
+
+def main():
+    """Main function untuk CLI"""
+    parser = argparse.ArgumentParser(description="Benchmark waktu start social_media_uploader")
+    parser.add_argument("--runs", type=int, default=5, help="Jumlah run per skenario")
+    parser.add_argument("--no-eager", action="store_true", help="Lewati pembanding eager import")
+
+    args = parser.parse_args()
+
+    baseline = measure("pass\n", args.runs)
+    print(f"{Fore.MAGENTA}⏱️ Startup benchmark ({args.runs} run, median wall time)")
+    print(f"Interpreter kosong: {_fmt(baseline)}\n")
+    print(f"{'Skenario':<32}{'lazy':>10}{'eager':>10}  speedup")
+
+    for name, code in SCENARIOS.items():
+        lazy = measure(code, args.runs)
+        eager = None if args.no_eager else measure(EAGER_PREFIX + code, args.runs)
+
+        speedup = ""
+        if lazy and eager:
+            ratio = eager["median"] / lazy["median"]
+            color = Fore.GREEN if ratio > 1.05 else Fore.WHITE
+            speedup = f"{color}{ratio:.2f}x{Style.RESET_ALL}"
+        print(f"{name:<32}{_fmt(lazy)}{_fmt(eager)}  {speedup}")
+
+    print(f"\n{Fore.CYAN}ℹ️ 'gagal' berarti perintah error (misalnya dependency platform tidak terpasang)")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,44 +8,67 @@ import os
 import sys
 import json
 import time
-import platform
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
-    WebDriverException,
-    ElementNotInteractableException,
     StaleElementReferenceException
 )
-from webdriver_manager.chrome import ChromeDriverManager
 from colorama import init, Fore, Style, Back
 import argparse
 
+from driver_pool import DriverPool
+from chromedriver_cache import ChromeDriverResolver
+from page_waits import PageWaiter, SelectorMatch, PAGE_LOAD_STRATEGIES, find_first_match, find_button_by_text
+from selector_stats import SelectorStats
+from upload_ledger import UploadLedger, cookie_account
+from cdp_cookies import set_cookies
+from phase_timer import PhaseTimer
+import metrics
+from network_blocking import BLOCKLIST_FILENAME, load_blocklist, apply_blocklist, enable_network_log
+
 # Initialize colorama untuk Windows compatibility
 init(autoreset=True)
 
 class TikTokUploader:
-    def __init__(self, headless: bool = False, debug: bool = False):
+    def __init__(self, headless: bool = False, debug: bool = False, driver_pool: Optional[DriverPool] = None,
+                 offline_driver: bool = False, force_upload: bool = False, block_requests: bool = False,
+                 page_load_strategy: str = 'normal', timings_log: Optional[str] = None):
         """
         Initialize TikTok Uploader
         
         Args:
             headless: Jalankan browser dalam mode headless
             debug: Enable debug logging
+            driver_pool: Pool browser yang dipakai ulang antar upload (opsional)
+            offline_driver: Resolusi ChromeDriver tanpa akses network (cache/PATH saja)
+            force_upload: Upload ulang walaupun video sudah tercatat di ledger
+            block_requests: Blokir analytics, iklan, font dan preview media lewat CDP
+            page_load_strategy: 'normal', 'eager' atau 'none'; selain 'normal' navigasi tidak menunggu
+                                semua resource, halaman dianggap siap begitu elemen kuncinya ada
+            timings_log: File JSON lines untuk timing per fase setiap upload (opsional)
         """
+        if page_load_strategy not in PAGE_LOAD_STRATEGIES:
+            raise ValueError(f"page_load_strategy harus salah satu dari {', '.join(PAGE_LOAD_STRATEGIES)}")
+        
         self.headless = headless
         self.debug = debug
+        self.force_upload = force_upload
+        self.page_load_strategy = page_load_strategy
         self.driver = None
         self.wait = None
+        self.driver_pool = driver_pool
+        self._pooled = None
+        self.waiter = None
         
         # Setup paths - menggunakan folder cookies dengan file JSON
         self.base_dir = Path(__file__).parent
@@ -54,10 +77,35 @@ class TikTokUploader:
         self.cookies_path = self.cookies_dir / "tiktok_cookies.json"
         self.screenshots_dir = self.base_dir / "screenshots"
         self.screenshots_dir.mkdir(exist_ok=True)
+        self.cache_dir = self.base_dir / "cache"
+        
+        # Resolver ChromeDriver dengan cache di disk
+        self.driver_resolver = ChromeDriverResolver(
+            self.cache_dir / "chromedriver.json",
+            offline=offline_driver,
+            log=self._log
+        )
+        
+        # Statistik hit/miss selector untuk urutan adaptif
+        self.selector_stats = SelectorStats(self.cache_dir / "selector_stats.json", log=self._log)
+        
+        # Ledger video yang sudah dipublish, mencegah upload ganda ke akun yang sama
+        self.ledger = UploadLedger(self.base_dir / "jobs" / "upload_ledger.db")
+        
+        # Pola URL yang diblokir di browser (default per platform, bisa diganti lewat network_blocklist.json)
+        self.blocked_urls = load_blocklist('tiktok', self.base_dir / BLOCKLIST_FILENAME) if block_requests else []
+        
+        # Timing per fase alur upload yang sedang berjalan
+        self.timer = PhaseTimer('tiktok', 'idle')
+        self.timings_log = Path(timings_log) if timings_log else None
+        
+        # Rekam event network Chrome (dipakai network_benchmark.py untuk menghitung bytes)
+        self.measure_network = False
         
         # TikTok URLs
         self.upload_url = "https://www.tiktok.com/tiktokstudio/upload?from=webapp"
         self.login_url = "https://www.tiktok.com/login"
+        self.login_keywords = ["login", "passport"]
         
         # Selectors - Menggunakan selector yang baru diberikan
         self.selectors = {
@@ -93,6 +141,12 @@ class TikTokUploader:
                 ".btn-post",
                 ".upload-btn-post"
             ],
+            'file_input': [
+                "input[type='file']",
+                "input[accept*='video']",
+                "[data-e2e='upload-btn'] input",
+                ".upload-btn input"
+            ],
             'success_indicators': [
                 ".success-message",
                 "[data-e2e='upload-success-message']",
@@ -127,61 +181,11 @@ class TikTokUploader:
         print(f"{color}{icon} {message}{Style.RESET_ALL}")
 
     def _get_chromedriver_path(self):
-        """Get ChromeDriver path dengan fallback untuk Windows"""
-        try:
-            # Coba download ChromeDriver terbaru
-            self._log("Mendownload ChromeDriver terbaru...")
-            driver_path = ChromeDriverManager().install()
-            
-            # Validasi file exists dan executable
-            if os.path.exists(driver_path):
-                # Untuk Windows, pastikan file adalah .exe
-                if platform.system() == "Windows" and not driver_path.endswith('.exe'):
-                    # Cari file .exe di direktori yang sama
-                    driver_dir = os.path.dirname(driver_path)
-                    for file in os.listdir(driver_dir):
-                        if file.endswith('.exe') and 'chromedriver' in file.lower():
-                            driver_path = os.path.join(driver_dir, file)
-                            break
-                
-                self._log(f"ChromeDriver ditemukan: {driver_path}", "SUCCESS")
-                return driver_path
-            else:
-                raise FileNotFoundError("ChromeDriver tidak ditemukan setelah download")
-                
-        except Exception as e:
-            self._log(f"Error downloading ChromeDriver: {e}", "WARNING")
-            
-            # Fallback: cari ChromeDriver di PATH
-            self._log("Mencari ChromeDriver di sistem PATH...")
-            
-            chrome_names = ['chromedriver', 'chromedriver.exe']
-            for name in chrome_names:
-                # Cek di PATH
-                import shutil
-                path = shutil.which(name)
-                if path:
-                    self._log(f"ChromeDriver ditemukan di PATH: {path}", "SUCCESS")
-                    return path
-            
-            # Fallback terakhir: cek lokasi umum Windows
-            if platform.system() == "Windows":
-                common_paths = [
-                    r"C:\Program Files\Google\Chrome\Application\chromedriver.exe",
-                    r"C:\Program Files (x86)\Google\Chrome\Application\chromedriver.exe",
-                    r"C:\chromedriver\chromedriver.exe",
-                    r"C:\tools\chromedriver.exe"
-                ]
-                
-                for path in common_paths:
-                    if os.path.exists(path):
-                        self._log(f"ChromeDriver ditemukan: {path}", "SUCCESS")
-                        return path
-            
-            raise FileNotFoundError("ChromeDriver tidak ditemukan. Silakan install Chrome dan ChromeDriver.")
+        """Get ChromeDriver path (cache disk, download, lalu fallback PATH/Windows)"""
+        return self.driver_resolver.resolve()
 
-    def _setup_driver(self):
-        """Setup Chrome WebDriver dengan konfigurasi optimal dan suppress logs"""
+    def _create_driver(self):
+        """Buat Chrome WebDriver baru dengan konfigurasi optimal dan suppress logs"""
         self._log("Menyiapkan browser...")
         
         chrome_options = Options()
@@ -253,6 +257,11 @@ class TikTokUploader:
         if self.headless:
             self._log("Mode headless diaktifkan")
         
+        if self.measure_network:
+            enable_network_log(chrome_options)
+        
+        chrome_options.page_load_strategy = self.page_load_strategy
+        
         try:
             # Get ChromeDriver path dengan error handling
             driver_path = self._get_chromedriver_path()
@@ -268,15 +277,18 @@ class TikTokUploader:
             os.environ['WDM_LOG_LEVEL'] = '0'
             os.environ['WDM_PRINT_FIRST_LINE'] = 'False'
             
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # Anti-detection script
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
-            # Setup wait
-            self.wait = WebDriverWait(self.driver, 30)
+            if self.blocked_urls:
+                apply_blocklist(driver, self.blocked_urls, log=self._log)
+            
+            metrics.BROWSER_LAUNCHES.inc(platform='tiktok')
             
             self._log("Browser siap digunakan", "SUCCESS")
+            return driver
             
         except Exception as e:
             self._log(f"Gagal menyiapkan browser: {str(e)}", "ERROR")
@@ -291,31 +303,182 @@ class TikTokUploader:
             
             raise
 
-    def _find_element_by_selectors(self, selectors: list, timeout: int = 10, visible: bool = True) -> Optional[Any]:
-        """Mencari elemen menggunakan multiple selectors - versi sederhana"""
-        for i, selector in enumerate(selectors):
+    def _setup_driver(self):
+        """Setup Chrome WebDriver untuk satu sesi upload"""
+        self.driver = self._create_driver()
+        
+        # Setup wait
+        self.wait = WebDriverWait(self.driver, 30)
+        self.waiter = PageWaiter(self.driver, log=self._log)
+
+    def enable_driver_pool(self, max_size: int = 1, max_uses: int = 25) -> DriverPool:
+        """
+        Aktifkan pool browser sehingga upload berikutnya memakai ulang browser yang sudah login
+        
+        Args:
+            max_size: Jumlah maksimum browser di pool
+            max_uses: Browser di-recycle setelah dipakai sebanyak ini
+        """
+        if not self.driver_pool:
+            self.driver_pool = DriverPool(self._create_driver, max_size=max_size, max_uses=max_uses, log=self._log)
+        return self.driver_pool
+
+    def _start_session(self) -> bool:
+        """
+        Siapkan browser untuk satu upload (baru atau dari pool) dan load cookies
+        
+        Returns:
+            True jika cookies dimuat / browser sudah login
+        """
+        self.timer.begin('driver_setup')
+        if not self.driver_pool:
+            self._setup_driver()
+            self.timer.begin('cookie_load')
+            return self.load_cookies()
+        
+        self._pooled = self.driver_pool.checkout()
+        self.driver = self._pooled.driver
+        self.wait = WebDriverWait(self.driver, 30)
+        self.waiter = PageWaiter(self.driver, log=self._log)
+        
+        if self._pooled.warm:
+            self._log("Memakai browser dari pool (sudah login)", "SUCCESS")
+            return True
+        
+        self.timer.begin('cookie_load')
+        cookies_loaded = self.load_cookies()
+        self._pooled.warm = cookies_loaded
+        return cookies_loaded
+
+    def account_id(self) -> str:
+        """Identitas akun TikTok (kunci ledger upload): cookie browser yang sedang login, selain itu file cookies"""
+        if self.driver:
             try:
-                if visible:
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                else:
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                
-                # Log sederhana tanpa menampilkan selector panjang
-                if i == 0:
-                    self._log("Elemen ditemukan", "SUCCESS")
-                else:
-                    self._log(f"Elemen ditemukan (alternatif {i+1})", "SUCCESS")
-                return element
-                
-            except TimeoutException:
-                continue
-                
+                cookie = self.driver.get_cookie('uid_tt')
+                if cookie and cookie.get('value'):
+                    return str(cookie['value'])
+            except Exception:
+                pass
+        return cookie_account(self.cookies_path, ['uid_tt'])
+
+    def _previous_upload(self, video_path: str):
+        """
+        Cek ledger untuk video yang sama di akun yang sama
+        
+        Returns:
+            (content hash, hasil upload sebelumnya atau None)
+        """
+        content_hash = self.ledger.content_hash(video_path)
+        return content_hash, self._lookup_previous(content_hash)
+
+    def _lookup_previous(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Hasil upload sebelumnya untuk akun saat ini (None jika belum ada atau force_upload)"""
+        if self.force_upload:
+            return None
+        
+        previous = self.ledger.lookup(content_hash, 'tiktok', self.account_id())
+        if previous:
+            self._log("Video ini sudah pernah diupload ke akun yang sama, dilewati (pakai --force untuk upload ulang)", "WARNING")
+        return previous
+
+    def _end_session(self, discard: bool = False):
+        """Tutup browser, atau kembalikan ke pool jika pool aktif"""
+        if self.driver:
+            self.timer.begin('teardown')
+        self.selector_stats.save()
+        
+        if self.waiter and self.driver:
+            self._log(f"Total waktu wait: {self.waiter.total_seconds():.2f}s ({len(self.waiter.timings)} wait)", "DEBUG")
+        
+        if self._pooled:
+            self._log("Mengembalikan browser ke pool...", "DEBUG")
+            self.driver_pool.release(self._pooled, discard=discard)
+            self._pooled = None
+            self.driver = None
+            return
+        
+        if self.driver:
+            self._log("Menutup browser...")
+            try:
+                self.driver.quit()
+            except:
+                pass
+            self.driver = None
+
+    def abort(self):
+        """
+        Paksa hentikan upload yang sedang berjalan (dari thread lain): browser ditutup, dan upload yang
+        belum punya browser (membuat driver, menunggu pool) berhenti di batas fase berikutnya
+        """
+        if self.timer.cancel is not None:
+            self.timer.cancel.set()
+        driver = self.driver
+        if driver:
+            self._log("Menghentikan upload, menutup browser...", "WARNING")
+            try:
+                driver.quit()
+            except:
+                pass
+
+    def close(self):
+        """Tutup semua browser di pool"""
+        if self.driver_pool:
+            self.driver_pool.close()
+
+    def _selector_group(self, selectors: list) -> Optional[str]:
+        """Nama grup statistik untuk list selector, misalnya 'tiktok.post_button'"""
+        for name, candidates in self.selectors.items():
+            if candidates is selectors:
+                return f"tiktok.{name}"
         return None
 
+    def _match_selectors(self, selectors: list, timeout: int = 10, visible: bool = True) -> Optional[SelectorMatch]:
+        """
+        Race semua selector dengan satu deadline bersama (satu execute_script per poll tick)
+        
+        Returns:
+            SelectorMatch berisi elemen dan index (di list asli) selector yang cocok, atau None
+        """
+        group = self._selector_group(selectors)
+        if not group:
+            return find_first_match(self.driver, selectors, timeout=timeout, visible=visible)
+        
+        # Selector dengan tingkat sukses tertinggi dicoba lebih dulu
+        ordered = self.selector_stats.order(group, selectors)
+        match = find_first_match(self.driver, ordered, timeout=timeout, visible=visible)
+        
+        if not match:
+            self.selector_stats.record(group, ordered, None)
+            metrics.observe_selector(group, None)
+            return None
+        
+        self.selector_stats.record(group, ordered, match.selector, match.seconds)
+        index = selectors.index(match.selector)
+        metrics.observe_selector(group, index)
+        return match._replace(index=index)
+
+    def _find_element_by_selectors(self, selectors: list, timeout: int = 10, visible: bool = True) -> Optional[Any]:
+        """Mencari elemen menggunakan multiple selectors - versi sederhana"""
+        match = self._match_selectors(selectors, timeout=timeout, visible=visible)
+        if not match:
+            return None
+        
+        # Log sederhana tanpa menampilkan selector panjang
+        if match.index == 0:
+            self._log("Elemen ditemukan", "SUCCESS")
+        else:
+            self._log(f"Elemen ditemukan (alternatif {match.index+1})", "SUCCESS")
+        return match.element
+
+    def _navigate(self, url: Optional[str] = None):
+        """Buka URL (atau refresh jika url kosong); pemanggil menunggu kondisi siap halaman sesudahnya"""
+        if self.page_load_strategy == 'none':
+            self.waiter.mark_navigation()
+        if url:
+            self.driver.get(url)
+        else:
+            self.driver.refresh()
+
     def load_cookies(self) -> bool:
         """Load cookies dari file JSON"""
         if not self.cookies_path.exists():
@@ -336,9 +499,24 @@ class TikTokUploader:
                 self._log("File cookies kosong", "WARNING")
                 return False
             
-            # Navigate ke TikTok dulu sebelum set cookies
-            self.driver.get("https://www.tiktok.com")
-            time.sleep(2)
+            # Pasang semua cookies sekaligus lewat CDP, sebelum halaman apa pun dibuka
+            cookies_added = set_cookies(self.driver, cookies, '.tiktok.com', log=self._log)
+            if cookies_added:
+                self._log(f"Cookies dimuat: {cookies_added}/{len(cookies)}", "SUCCESS")
+                return True
+            
+            return self._add_cookies_via_page(cookies)
+            
+        except Exception as e:
+            self._log(f"Gagal memuat cookies: {str(e)}", "ERROR")
+            return False
+
+    def _add_cookies_via_page(self, cookies: list) -> bool:
+        """Fallback tanpa CDP: buka TikTok dulu lalu add_cookie satu per satu"""
+        try:
+            self._log("CDP tidak tersedia, memuat cookies lewat halaman TikTok", "DEBUG")
+            self._navigate("https://www.tiktok.com")
+            self.waiter.ready_state()
             
             # Add cookies
             cookies_added = 0
@@ -413,25 +591,24 @@ class TikTokUploader:
     def check_login_required(self) -> bool:
         """Cek apakah perlu login"""
         current_url = self.driver.current_url
-        return "login" in current_url or "passport" in current_url
+        return any(keyword in current_url for keyword in self.login_keywords)
+
+    def _wait_upload_page(self):
+        """Tunggu halaman upload siap (input file ada) atau dialihkan ke login"""
+        self.waiter.page_ready(self.selectors['file_input'], self.login_keywords, label="halaman upload")
 
     def wait_for_login(self, timeout: int = 180):
         """Tunggu user login manual"""
         self._log("Silakan login secara manual di browser...", "WARNING")
         self._log(f"Menunggu login selesai (timeout {timeout} detik)...", "INFO")
         
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            current_url = self.driver.current_url
-            
-            # Cek apakah sudah tidak di halaman login
-            if not ("login" in current_url or "passport" in current_url):
-                self._log("Login berhasil!", "SUCCESS")
-                self.save_cookies()  # Simpan cookies setelah login
-                return True
-            
-            time.sleep(2)
+        # Cek apakah sudah tidak di halaman login
+        if self.waiter.url_excludes(self.login_keywords, timeout=timeout, label="login"):
+            self._log("Login berhasil!", "SUCCESS")
+            self.save_cookies()  # Simpan cookies setelah login
+            if self._pooled:
+                self._pooled.warm = True
+            return True
         
         raise TimeoutException("Timeout menunggu login")
 
@@ -450,20 +627,13 @@ class TikTokUploader:
                 # Coba klik tombol upload
                 self.driver.execute_script("arguments[0].click();", upload_button)
                 self._log("Tombol upload diklik", "SUCCESS")
-                time.sleep(2)
+                self.waiter.selector(self.selectors['file_input'], timeout=5, visible=False, label="input file")
             except Exception as e:
                 self._log(f"Gagal klik tombol upload: {e}", "WARNING")
         
         # Cari input file (bisa tersembunyi)
-        file_input_selectors = [
-            "input[type='file']",
-            "input[accept*='video']",
-            "[data-e2e='upload-btn'] input",
-            ".upload-btn input"
-        ]
-        
         file_input = None
-        for selector in file_input_selectors:
+        for selector in self.selectors['file_input']:
             try:
                 file_input = self.driver.find_element(By.CSS_SELECTOR, selector)
                 if file_input:
@@ -485,21 +655,18 @@ class TikTokUploader:
         """Tunggu video diproses menggunakan selector baru"""
         self._log("Menunggu video diproses...")
         
-        start_time = time.time()
+        # Cek indikator pemrosesan selesai menggunakan selector baru
+        processed = self.waiter.selector(
+            self.selectors['upload_success_status'],
+            timeout=timeout,
+            label="video diproses"
+        )
         
-        while time.time() - start_time < timeout:
-            # Cek indikator pemrosesan selesai menggunakan selector baru
-            for selector in self.selectors['upload_success_status']:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element.is_displayed():
-                        self._log("Video berhasil diproses", "SUCCESS")
-                        time.sleep(3)  # Tunggu UI siap
-                        return True
-                except:
-                    continue
-            
-            time.sleep(2)
+        if processed:
+            self._log("Video berhasil diproses", "SUCCESS")
+            # Tunggu UI siap: input caption terlihat
+            self.waiter.selector(self.selectors['caption_input'], timeout=5, label="caption siap")
+            return True
         
         self._log("Timeout menunggu pemrosesan, melanjutkan...", "WARNING")
         return False
@@ -522,12 +689,12 @@ class TikTokUploader:
         try:
             # Focus dan clear existing content
             caption_input.click()
-            time.sleep(0.5)
+            self.waiter.focused(caption_input)
             
             # Select all dan hapus
             caption_input.send_keys(Keys.CONTROL + "a")
             caption_input.send_keys(Keys.BACKSPACE)
-            time.sleep(0.5)
+            self.waiter.text_cleared(caption_input)
             
             # Type caption baru
             caption_input.send_keys(caption)
@@ -538,67 +705,61 @@ class TikTokUploader:
         except Exception as e:
             self._log(f"Gagal menambahkan caption: {str(e)}", "WARNING")
 
+    def _wait_post_settled(self, post_button, timeout: int = 10):
+        """Tunggu setelah klik post: tombol hilang, URL berubah, atau indikator sukses muncul"""
+        self.timer.begin('confirmation')
+        condition = (
+            "location.href !== args.url || !args.el.isConnected || "
+            "args.selectors.some(function(s) { try { return document.querySelector(s); } catch (e) { return false; } })"
+        )
+        self.waiter.until(
+            condition,
+            timeout=timeout,
+            label="post selesai",
+            args={"el": post_button, "url": self.driver.current_url, "selectors": self.selectors['success_indicators']},
+            stale_result=True
+        )
+
     def post_video(self):
         """Post video menggunakan selector baru"""
         self._log("Mencari tombol post...")
         
-        # Coba selector utama terlebih dahulu (yang baru diberikan)
-        primary_selector = self.selectors['post_button'][0]
+        # Race selector utama dan alternatif dengan satu deadline bersama
+        match = self._match_selectors(self.selectors['post_button'], timeout=10)
         
-        try:
-            self._log("Mencoba tombol post utama...")
-            
-            # Tunggu elemen muncul
-            post_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, primary_selector))
-            )
+        if match and match.index == 0:
+            post_button = match.element
             
             # Klik menggunakan JavaScript untuk memastikan
             self.driver.execute_script("arguments[0].click();", post_button)
             
             self._log("Tombol post berhasil diklik!", "SUCCESS")
-            time.sleep(5)
+            self._wait_post_settled(post_button)
             
             # Setelah klik post, anggap berhasil dan tutup browser
             self._log("Video berhasil dipost!", "SUCCESS")
             return True
-            
-        except TimeoutException:
-            self._log("Selector utama tidak ditemukan, mencoba alternatif...", "WARNING")
         
-        # Coba fallback selectors
-        self._log("Mencoba tombol post alternatif...")
+        if match:
+            post_button = match.element
+            post_button.click()
+            self._log(f"Tombol post diklik (alternatif {match.index})", "SUCCESS")
+            self._wait_post_settled(post_button)
+            return True
         
-        for i, selector in enumerate(self.selectors['post_button'][1:], 1):
-            try:
-                post_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                )
-                
-                # Cek apakah tombol enabled
-                if post_button.is_enabled():
-                    post_button.click()
-                    self._log(f"Tombol post diklik (alternatif {i})", "SUCCESS")
-                    time.sleep(5)
-                    return True
-                    
-            except TimeoutException:
-                continue
+        self._log("Selector post tidak ditemukan, mencoba alternatif...", "WARNING")
         
         # Fallback terakhir: cari berdasarkan text
         self._log("Mencari tombol berdasarkan teks...")
         
         try:
-            buttons = self.driver.find_elements(By.TAG_NAME, "button")
+            match = find_button_by_text(self.driver, ['post', 'publish', 'share'], selector="button")
             
-            for button in buttons:
-                text = button.text.lower()
-                if any(keyword in text for keyword in ['post', 'publish', 'share']):
-                    if button.is_enabled() and button.is_displayed():
-                        button.click()
-                        self._log(f"Tombol post ditemukan: '{button.text}'", "SUCCESS")
-                        time.sleep(5)
-                        return True
+            if match:
+                match.element.click()
+                self._log(f"Tombol post ditemukan: '{match.text}'", "SUCCESS")
+                self._wait_post_settled(match.element)
+                return True
         
         except Exception as e:
             self._log(f"Error saat mencari tombol berdasarkan teks: {str(e)}", "ERROR")
@@ -611,16 +772,9 @@ class TikTokUploader:
         
         try:
             # Cek indikator sukses
-            for selector in self.selectors['success_indicators']:
-                try:
-                    element = WebDriverWait(self.driver, 3).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    if element.is_displayed():
-                        self._log("Konfirmasi upload sukses!", "SUCCESS")
-                        return True
-                except TimeoutException:
-                    continue
+            if self._match_selectors(self.selectors['success_indicators'], timeout=3):
+                self._log("Konfirmasi upload sukses!", "SUCCESS")
+                return True
             
             # Cek URL redirect
             current_url = self.driver.current_url
@@ -663,53 +817,77 @@ class TikTokUploader:
             caption: Caption untuk video
             
         Returns:
-            Dict dengan status upload
+            Dict dengan status upload dan timing per fase (key 'timings')
         """
+        self.timer = PhaseTimer('tiktok', 'upload_video', log=self._log, cancel=threading.Event())
+        self.waiter = None
+        result = self._upload_video(video_path, caption)
+        return self._attach_timings(result)
+
+    def _attach_timings(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        wait_seconds = self.waiter.total_seconds() if self.waiter else None
+        return self.timer.attach(result, wait_seconds, self.timings_log)
+
+    def _upload_video(self, video_path: str, caption: str) -> Dict[str, Any]:
         try:
-            # Setup driver
-            self._setup_driver()
+            content_hash, previous = self._previous_upload(video_path)
+            if previous:
+                return previous
             
-            # Load cookies
-            cookies_loaded = self.load_cookies()
+            # Setup driver dan load cookies
+            cookies_loaded = self._start_session()
             
             # Navigate ke upload page
+            self.timer.begin('navigation')
             self._log("Navigasi ke TikTok Studio...")
-            self.driver.get(self.upload_url)
-            time.sleep(3)
+            self._navigate(self.upload_url)
+            self._wait_upload_page()
             
             # Cek apakah perlu login
+            self.timer.begin('login_check')
             if self.check_login_required():
                 if cookies_loaded:
                     self._log("Cookies dimuat tapi masih perlu login, refresh halaman...", "WARNING")
-                    self.driver.refresh()
-                    time.sleep(3)
+                    self._navigate()
+                    self._wait_upload_page()
                 
                 if self.check_login_required():
                     self.wait_for_login()
                     # Navigate ulang ke upload page setelah login
-                    self.driver.get(self.upload_url)
-                    time.sleep(3)
+                    self._navigate(self.upload_url)
+                    self._wait_upload_page()
+            
+            # Cek ulang dengan akun yang benar-benar login (cookies bisa belum ada / basi saat cek awal)
+            previous = self._lookup_previous(content_hash)
+            if previous:
+                return previous
             
             # Upload file
+            self.timer.begin('file_handoff')
             self.upload_file(video_path)
             
             # Tunggu processing
+            self.timer.begin('processing_wait')
             self.wait_for_processing()
             
             # Tambahkan caption
+            self.timer.begin('caption')
             self.add_caption(caption)
             
             # Post video
+            self.timer.begin('post')
             success = self.post_video()
             
             if success:
                 self._log("Video berhasil diupload ke TikTok!", "SUCCESS")
-                return {
+                result = {
                     "success": True,
                     "message": "Upload berhasil",
                     "video_path": video_path,
                     "caption": caption
                 }
+                self.ledger.record(content_hash, 'tiktok', self.account_id(), result)
+                return result
             else:
                 return {
                     "success": False,
@@ -725,6 +903,10 @@ class TikTokUploader:
             # Ambil screenshot untuk debugging
             self.take_screenshot(f"error_{int(time.time())}.png")
             
+            # Browser dengan state error tidak dikembalikan ke pool
+            self.timer.end(ok=False)
+            self._end_session(discard=True)
+            
             return {
                 "success": False,
                 "message": error_msg,
@@ -733,12 +915,7 @@ class TikTokUploader:
             }
         
         finally:
-            if self.driver:
-                self._log("Menutup browser...")
-                try:
-                    self.driver.quit()
-                except:
-                    pass
+            self._end_session()
 
     def check_cookies_status(self):
         """Cek status cookies"""
@@ -810,10 +987,18 @@ def main():
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--clear-cookies", action="store_true", help="Hapus cookies")
     parser.add_argument("--check-cookies", action="store_true", help="Cek status cookies")
+    parser.add_argument("--offline-driver", action="store_true", help="Resolusi ChromeDriver tanpa akses network")
+    parser.add_argument("--force", action="store_true", help="Upload ulang walaupun video sudah pernah diupload")
+    parser.add_argument("--block-requests", action="store_true", help="Blokir analytics, iklan, font dan preview media di browser")
+    parser.add_argument("--page-load-strategy", choices=['normal', 'eager', 'none'], default='normal',
+                        help="Strategi load halaman; eager/none lanjut begitu elemen kunci halaman ada")
+    parser.add_argument("--timings-log", help="Tulis timing per fase setiap upload ke file JSON lines")
     
     args = parser.parse_args()
     
-    uploader = TikTokUploader(headless=args.headless, debug=args.debug)
+    uploader = TikTokUploader(headless=args.headless, debug=args.debug, offline_driver=args.offline_driver,
+                             force_upload=args.force, block_requests=args.block_requests,
+                             page_load_strategy=args.page_load_strategy, timings_log=args.timings_log)
     
     # Handle different actions
     if args.clear_cookies:
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Upload Ledger - Catatan video yang sudah dipublish per platform dan akun
+Kunci ledger adalah hash isi file, sehingga file yang di-rename tetap dikenali
+"""
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+DEFAULT_LEDGER_PATH = Path(__file__).parent / "jobs" / "upload_ledger.db"
+
+# Ukuran blok saat hashing supaya memori tetap kecil untuk file besar
+HASH_BLOCK_SIZE = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    content_hash TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    account TEXT NOT NULL,
+    video_id TEXT,
+    video_url TEXT,
+    result TEXT NOT NULL,
+    uploaded_at REAL NOT NULL,
+    PRIMARY KEY (content_hash, platform, account)
+);
+CREATE TABLE IF NOT EXISTS file_hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+"""
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 isi file, dibaca per blok"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cookie_account(cookies_path: Path, names: Iterable[str]) -> str:
+    """
+    Identitas akun dari file cookies (misalnya 'c_user' Facebook)
+
+    Returns:
+        Nilai cookie pertama yang ditemukan, atau 'default'
+    """
+    try:
+        with open(cookies_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return "default"
+
+    cookies = data.get('cookies', []) if isinstance(data, dict) else data
+    values = {c.get('name'): c.get('value') for c in cookies if isinstance(c, dict)}
+    for name in names:
+        if values.get(name):
+            return str(values[name])
+    return "default"
+
+
+class UploadLedger:
+    def __init__(self, db_path: Path = DEFAULT_LEDGER_PATH):
+        """
+        Initialize Upload Ledger
+
+        Args:
+            db_path: Path database SQLite
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def content_hash(self, video_path: str) -> str:
+        """Hash isi video; hasil di-cache per path selama ukuran dan mtime tidak berubah"""
+        path = os.path.abspath(video_path)
+        stat = os.stat(path)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash FROM file_hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, stat.st_size, stat.st_mtime_ns)
+            ).fetchone()
+        if row:
+            return row["content_hash"]
+
+        content_hash = hash_file(path)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, content_hash) VALUES (?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime_ns, content_hash)
+            )
+        return content_hash
+
+    def lookup(self, content_hash: str, platform: str, account: str) -> Optional[Dict[str, Any]]:
+        """Hasil upload sebelumnya untuk kombinasi video, platform dan akun (None jika belum ada)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, uploaded_at FROM uploads WHERE content_hash = ? AND platform = ? AND account = ?",
+                (content_hash, platform, account)
+            ).fetchone()
+        if not row:
+            return None
+
+        result = json.loads(row["result"])
+        result["duplicate"] = True
+        result["uploaded_at"] = row["uploaded_at"]
+        return result
+
+    def record(self, content_hash: str, platform: str, account: str, result: Dict[str, Any]):
+        """Simpan hasil upload yang berhasil"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO uploads "
+                "(content_hash, platform, account, video_id, video_url, result, uploaded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    content_hash, platform, account,
+                    result.get("video_id"), result.get("video_url"),
+                    json.dumps(result, ensure_ascii=False, default=str),
+                    time.time()
+                )
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
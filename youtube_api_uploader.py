@@ -8,34 +8,113 @@ import os
 import sys
 import json
 import time
+import hashlib
 import mimetypes
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set, Tuple
 from datetime import datetime
 
 import google.auth
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
 from colorama import init, Fore, Style
 import argparse
 
+from upload_ledger import UploadLedger
+from phase_timer import PhaseTimer, UploadCancelled
+from credential_manager import CredentialManager, write_token_file
+from quota_ledger import QuotaLedger, QUOTA_COSTS
+from retry_policy import RetryPolicy, classify_error, QUOTA, SESSION_EXPIRED
+from resumable_upload import (
+    AdaptiveMediaFileUpload, ChunkSizer, ProgressCallback, ThroughputMeter, UploadSessionStore,
+    DEFAULT_CHUNK_SIZE, query_upload_offset
+)
+
+try:
+    from googleapiclient.discovery_cache import get_static_doc
+except ImportError:  # googleapiclient < 2.0 tanpa dokumen statis
+    get_static_doc = None
+
 # Initialize colorama
 init(autoreset=True)
 
+DISCOVERY_URL = "https://www.googleapis.com/discovery/v1/apis/{api}/{version}/rest"
+
+# Cache process-wide discovery document per API (service sendiri disimpan per thread di uploader)
+_discovery_docs: Dict[Tuple[str, str], str] = {}
+_cache_lock = threading.Lock()
+
+
+def load_discovery_document(api: str, version: str, cache_dir: Path) -> str:
+    """Discovery document dari memori, dokumen statis library, cache disk, atau network (lalu disimpan)"""
+    key = (api, version)
+    with _cache_lock:
+        doc = _discovery_docs.get(key)
+        if doc:
+            return doc
+        
+        cache_path = cache_dir / f"{api}_{version}_discovery.json"
+        if get_static_doc:
+            doc = get_static_doc(api, version)
+        if not doc and cache_path.exists():
+            doc = cache_path.read_text(encoding='utf-8')
+        if not doc:
+            resp, content = httplib2.Http().request(DISCOVERY_URL.format(api=api, version=version))
+            if resp.status != 200:
+                raise Exception(f"Gagal mengambil discovery document: HTTP {resp.status}")
+            doc = content.decode('utf-8')
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_text(doc, encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        
+        _discovery_docs[key] = doc
+        return doc
+
+
+def credential_identity(creds: Credentials) -> str:
+    """Identitas credential (client, refresh token, scopes) untuk kunci cache service"""
+    raw = f"{creds.client_id}:{creds.refresh_token}:{','.join(sorted(creds.scopes or []))}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
 class YouTubeAPIUploader:
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, force_upload: bool = False, timings_log: Optional[str] = None,
+                 api_root: Optional[str] = None, token_uri: Optional[str] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
         """
         Initialize YouTube API Uploader
         
         Args:
             debug: Enable debug logging
+            force_upload: Upload ulang walaupun video sudah tercatat di ledger
+            timings_log: File JSON lines untuk timing per fase setiap upload (opsional)
+            api_root: Root URL API pengganti googleapis.com (misalnya fake_youtube_server untuk benchmark)
+            token_uri: Endpoint token OAuth pengganti (google-auth selalu memakai endpoint Google saat membaca file token)
+            retry_policy: Klasifikasi error dan backoff untuk chunk yang gagal (default RetryPolicy())
         """
         self.debug = debug
-        self.youtube = None
+        self.force_upload = force_upload
+        self.timings_log = Path(timings_log) if timings_log else None
+        self.api_root = api_root.rstrip('/') + '/' if api_root else None
+        self.token_uri = token_uri
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.credentials = None
+        self.credential_manager = None
+        
+        # Service per thread: transport httplib2 tidak thread-safe
+        self._local = threading.local()
+        
+        # Token pembatalan upload yang sedang berjalan (satu per panggilan upload_video), di-set abort()
+        self._cancels: Set[threading.Event] = set()
+        self._cancels_lock = threading.Lock()
         
         # Setup paths
         self.base_dir = Path(__file__).parent
@@ -43,6 +122,16 @@ class YouTubeAPIUploader:
         self.credentials_dir.mkdir(exist_ok=True)
         self.token_path = self.credentials_dir / "youtube_token.json"
         self.credentials_path = self.credentials_dir / "youtube_credentials.json"
+        self.cache_dir = self.base_dir / "cache"
+        
+        # Ledger unit quota per project per hari (reset tengah malam waktu Pasifik)
+        self.quota = QuotaLedger(self._project_id(), self.base_dir / "jobs" / "youtube_quota.db")
+        
+        # Ledger video yang sudah dipublish, mencegah quota terbuang untuk upload ganda
+        self.ledger = UploadLedger(self.base_dir / "jobs" / "upload_ledger.db")
+        
+        # Session URI resumable upload, supaya upload yang terputus bisa dilanjutkan setelah restart
+        self.upload_sessions = UploadSessionStore(self.credentials_dir / "youtube_upload_sessions.json", log=self._log)
         
         # YouTube API scopes
         self.scopes = ['https://www.googleapis.com/auth/youtube.upload']
@@ -51,6 +140,15 @@ class YouTubeAPIUploader:
         self.api_service_name = "youtube"
         self.api_version = "v3"
 
+    @property
+    def youtube(self):
+        """Service YouTube milik thread ini (None jika thread ini belum inisialisasi)"""
+        return getattr(self._local, "youtube", None)
+
+    @youtube.setter
+    def youtube(self, service):
+        self._local.youtube = service
+
     def _log(self, message: str, level: str = "INFO"):
         """Enhanced logging dengan warna"""
         colors = {
@@ -97,6 +195,8 @@ class YouTubeAPIUploader:
         if self.token_path.exists():
             try:
                 creds = Credentials.from_authorized_user_file(str(self.token_path), self.scopes)
+                if self.token_uri:
+                    creds = creds.with_token_uri(self.token_uri)
                 self._log("Token existing dimuat", "SUCCESS")
             except Exception as e:
                 self._log(f"Error loading token: {e}", "WARNING")
@@ -123,23 +223,83 @@ class YouTubeAPIUploader:
                 self._log("Autentikasi berhasil!", "SUCCESS")
             
             # Simpan credentials untuk next time
-            with open(self.token_path, 'w') as token:
-                token.write(creds.to_json())
+            write_token_file(creds, self.token_path)
             self._log("Token disimpan untuk penggunaan selanjutnya", "SUCCESS")
         
         return creds
 
+    def _build_service(self, **kwargs):
+        """Build service dari discovery document yang di-cache"""
+        doc = load_discovery_document(self.api_service_name, self.api_version, self.cache_dir)
+        if self.api_root:
+            # rootUrl juga dipakai untuk URL upload media; client_options.api_endpoint hanya mengganti host-nya
+            service = json.loads(doc)
+            service.update(rootUrl=self.api_root, mtlsRootUrl=self.api_root,
+                           baseUrl=self.api_root + service.get('servicePath', ''))
+            doc = json.dumps(service)
+        return build_from_document(doc, **kwargs)
+
     def initialize_youtube_service(self):
-        """Initialize YouTube API service"""
+        """Initialize YouTube API service untuk thread ini (credential dibagi, service tidak)"""
         try:
-            creds = self.setup_credentials()
-            self.youtube = build(self.api_service_name, self.api_version, credentials=creds)
+            # Thread ini sudah punya service dan credential masih berlaku
+            if self.youtube is not None and self.credentials and \
+                    (self.credentials.valid or self.credentials.refresh_token):
+                return True
+            
+            # Satu objek Credentials per file token, direfresh di background sebelum expired
+            manager = CredentialManager.shared(self.token_path)
+            if manager and not (manager.credentials.valid or manager.credentials.refresh_token):
+                CredentialManager.unregister(self.token_path)
+                manager = None
+            if manager is None:
+                manager = CredentialManager.register(self.setup_credentials(), self.token_path, log=self._log)
+            self.credential_manager = manager
+            creds = self.credentials = manager.credentials
+            
+            self.youtube = self._build_service(credentials=creds)
             self._log("YouTube API service berhasil diinisialisasi", "SUCCESS")
             return True
         except Exception as e:
             self._log(f"Gagal inisialisasi YouTube API: {str(e)}", "ERROR")
             return False
 
+    def _project_id(self) -> str:
+        """ID project Google Cloud dari credentials.json (quota dihitung per project)"""
+        try:
+            with open(self.credentials_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            client = data.get('installed') or data.get('web') or {}
+            return client.get('project_id') or client.get('client_id') or "default"
+        except (OSError, ValueError):
+            return "default"
+
+    def _is_quota_error(self, error: HttpError) -> bool:
+        return classify_error(error) == QUOTA
+
+    def _refund_unaccepted_insert(self, insert_request):
+        """Kembalikan unit videos.insert yang dicadangkan jika session upload belum sempat dibuat di server"""
+        if insert_request is None or insert_request.resumable_uri is None:
+            self.quota.refund('videos.insert')
+            self._log(f"Upload belum diterima API, {QUOTA_COSTS['videos.insert']} unit quota dikembalikan", "DEBUG")
+
+    def account_id(self) -> str:
+        """
+        Identitas user OAuth (hash refresh token) sebagai kunci ledger upload
+
+        Field 'account' di token biasanya kosong dan client_id sama untuk semua channel
+        yang diotorisasi lewat OAuth app yang sama, jadi keduanya tidak bisa dipakai.
+        """
+        creds = self.credentials
+        if creds is None:
+            try:
+                creds = Credentials.from_authorized_user_file(str(self.token_path), self.scopes)
+            except (OSError, ValueError):
+                return "default"
+        if not creds.refresh_token:
+            return "default"
+        return credential_identity(creds)
+
     def get_video_category_id(self, category_name: str = "Entertainment") -> str:
         """Get video category ID berdasarkan nama kategori"""
         category_mapping = {
@@ -174,9 +334,10 @@ class YouTubeAPIUploader:
 
     def upload_video(self, video_path: str, title: str, description: str = "", 
                     tags: list = None, category: str = "Entertainment", 
-                    privacy: str = "public") -> Dict[str, Any]:
+                    privacy: str = "public", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    progress_callback: Optional[ProgressCallback] = None) -> Dict[str, Any]:
         """
-        Upload video ke YouTube
+        Upload video ke YouTube (resumable, per chunk)
         
         Args:
             video_path: Path ke file video
@@ -185,11 +346,32 @@ class YouTubeAPIUploader:
             tags: List tags untuk video
             category: Kategori video
             privacy: Privacy setting (public, unlisted, private)
+            chunk_size: Ukuran chunk awal; selanjutnya menyesuaikan throughput
+            progress_callback: Dipanggil dengan dict progress (bytes_sent, bytes_per_second, ...)
             
         Returns:
-            Dict dengan status upload dan video info
+            Dict dengan status upload, video info dan timing per fase (key 'timings')
         """
-        
+        # Timer dan token pembatalan lokal: upload_many memanggil method ini dari beberapa thread sekaligus
+        cancel = threading.Event()
+        timer = PhaseTimer('youtube', 'upload_video', log=self._log, cancel=cancel)
+        with self._cancels_lock:
+            self._cancels.add(cancel)
+        try:
+            result = self._upload_video(timer, video_path, title, description, tags, category, privacy,
+                                        chunk_size, progress_callback)
+        except UploadCancelled as e:
+            # Dibatalkan sebelum fase pertama dimulai
+            result = {"success": False, "cancelled": True, "message": str(e), "video_path": video_path, "title": title}
+        finally:
+            with self._cancels_lock:
+                self._cancels.discard(cancel)
+        return timer.attach(result, jsonl_path=self.timings_log)
+
+    def _upload_video(self, timer: PhaseTimer, video_path: str, title: str, description: str,
+                      tags: Optional[list], category: str, privacy: str, chunk_size: int,
+                      progress_callback: Optional[ProgressCallback]) -> Dict[str, Any]:
+        timer.begin('prepare')
         if not os.path.exists(video_path):
             raise FileNotFoundError(f"File video tidak ditemukan: {video_path}")
         
@@ -203,6 +385,15 @@ class YouTubeAPIUploader:
             self._log("File bukan video yang valid", "ERROR")
             raise ValueError("File harus berupa video")
         
+        # Lewati video yang sudah pernah diupload ke akun ini (hemat ~1600 unit quota)
+        content_hash = self.ledger.content_hash(video_path)
+        if not self.force_upload:
+            previous = self.ledger.lookup(content_hash, 'youtube', self.account_id())
+            if previous:
+                self._log("Video ini sudah pernah diupload ke akun yang sama, dilewati (pakai --force untuk upload ulang)", "WARNING")
+                self._log(f"Video URL: {previous.get('video_url', 'N/A')}", "INFO")
+                return previous
+        
         # Setup tags
         if tags is None:
             tags = []
@@ -228,15 +419,36 @@ class YouTubeAPIUploader:
             }
         }
         
-        # Prepare media upload
-        media = MediaFileUpload(
-            video_path,
-            chunksize=-1,  # Upload in single chunk
-            resumable=True,
-            mimetype=mime_type
-        )
+        # Prepare media upload: file dibaca per chunk dari disk
+        media = AdaptiveMediaFileUpload(video_path, mimetype=mime_type, chunksize=chunk_size)
+        sizer = ChunkSizer(media)
+        
+        # Session dari proses sebelumnya untuk file dan metadata yang sama
+        self.upload_sessions.collect_garbage()
+        session_key = self.upload_sessions.session_key(video_path, body)
+        session = self.upload_sessions.get(session_key)
+        
+        # Upload baru ditunda jika sisa quota hari ini tidak cukup (session lama sudah dibayar)
+        if not session and not self.quota.try_spend('videos.insert'):
+            report = self.quota.report()
+            hours = report["resets_in_seconds"] / 3600
+            error_msg = (f"Quota harian tidak cukup ({report['remaining']}/{report['limit']} unit tersisa, "
+                         f"perlu {QUOTA_COSTS['videos.insert']}), upload ditunda sampai reset {hours:.1f} jam lagi")
+            self._log(error_msg, "WARNING")
+            return {
+                "success": False,
+                "deferred": True,
+                "message": error_msg,
+                "retry_after": report["resets_in_seconds"],
+                "video_path": video_path,
+                "title": title
+            }
         
+        # Unit quota dicadangkan untuk session baru; dikembalikan jika API tidak pernah menerima upload-nya
+        reserved = not session
+        insert_request = None
         try:
+            timer.begin('session_init')
             self._log("Memulai upload ke YouTube...", "INFO")
             
             # Execute upload request
@@ -246,41 +458,95 @@ class YouTubeAPIUploader:
                 media_body=media
             )
             
+            if session:
+                self._log(f"Melanjutkan upload sebelumnya dari byte {session['offset']}", "INFO")
+                insert_request.resumable_uri = session["uri"]
+                insert_request.resumable_progress = session["offset"]
+            
+            meter = ThroughputMeter(media.size(), progress_callback, start_bytes=insert_request.resumable_progress)
+            
             # Upload dengan progress tracking
+            timer.begin('transfer')
             response = None
             error = None
             retry = 0
-            max_retries = 3
+            policy = self.retry_policy
+            last_progress = -1
+            # Session lama: offset yang tersimpan bisa tertinggal dari yang sudah diterima server
+            resuming = bool(session)
             
             while response is None:
+                if timer.cancelled:
+                    raise UploadCancelled(f"Upload dihentikan di byte {insert_request.resumable_progress}, "
+                                          "session disimpan untuk dilanjutkan")
+                acked_before = insert_request.resumable_progress
+                chunk_start = time.time()
                 try:
-                    self._log(f"Upload attempt {retry + 1}/{max_retries + 1}")
+                    if resuming:
+                        insert_request.resumable_progress, response = query_upload_offset(
+                            insert_request.http, insert_request.resumable_uri, media.size())
+                        resuming = False
+                        self._log(f"Server sudah menerima {insert_request.resumable_progress} byte", "DEBUG")
+                        meter = ThroughputMeter(media.size(), progress_callback, start_bytes=insert_request.resumable_progress)
+                        continue
+                    
+                    self._log(f"Mengirim chunk {sizer.chunk_size / (1024 * 1024):.1f}MB dari byte {acked_before}", "DEBUG")
                     status, response = insert_request.next_chunk()
                     
-                    if status:
-                        progress = int(status.progress() * 100)
-                        self._log(f"Upload progress: {progress}%", "INFO")
-                
-                except HttpError as e:
-                    if e.resp.status in [500, 502, 503, 504]:
-                        error = f"HTTP Error {e.resp.status}: {e.content}"
-                        self._log(f"Retriable error: {error}", "WARNING")
-                        retry += 1
-                        if retry > max_retries:
-                            raise Exception(f"Max retries exceeded: {error}")
-                        time.sleep(2 ** retry)  # Exponential backoff
-                    else:
-                        raise Exception(f"HTTP Error {e.resp.status}: {e.content}")
+                    acked = media.size() if response else insert_request.resumable_progress
+                    rate = sizer.observe(acked - acked_before, time.time() - chunk_start)
+                    event = meter.update(acked, rate, sizer.chunk_size)
+                    
+                    # Retry hanya dihitung berturut-turut; chunk yang berhasil mereset hitungan
+                    if acked > acked_before:
+                        retry = 0
+                    if status and insert_request.resumable_uri:
+                        self.upload_sessions.save(session_key, insert_request.resumable_uri, acked, video_path)
+                    # Session lama terbukti masih berlaku
+                    session = None
+                    
+                    progress = int(event["progress"] * 100)
+                    if status and progress != last_progress:
+                        last_progress = progress
+                        speed = (rate or 0) / (1024 * 1024)
+                        self._log(f"Upload progress: {progress}% ({acked / (1024 * 1024):.1f}/{file_size:.1f}MB, {speed:.2f}MB/s)", "INFO")
                 
                 except Exception as e:
-                    error = str(e)
-                    self._log(f"Upload error: {error}", "ERROR")
+                    category = classify_error(e)
+                    if session and category == SESSION_EXPIRED:
+                        # Session lama sudah tidak berlaku di server, mulai session baru
+                        self._log("Session upload sebelumnya kedaluwarsa, upload dimulai dari awal", "WARNING")
+                        self.upload_sessions.remove(session_key)
+                        session = None
+                        resuming = False
+                        self.quota.record('videos.insert')
+                        reserved = True
+                        insert_request = self.youtube.videos().insert(
+                            part=','.join(body.keys()),
+                            body=body,
+                            media_body=media
+                        )
+                        meter = ThroughputMeter(media.size(), progress_callback)
+                        continue
+                    
+                    error = f"HTTP Error {e.resp.status}: {e.content}" if isinstance(e, HttpError) else str(e)
+                    if category == QUOTA:
+                        self.quota.mark_exhausted()
                     retry += 1
-                    if retry > max_retries:
-                        raise Exception(f"Upload failed after {max_retries} retries: {error}")
-                    time.sleep(2 ** retry)
+                    if not policy.should_retry(category, retry):
+                        if category in policy.retryable:
+                            raise Exception(f"Max retries exceeded ({category}): {error}")
+                        raise Exception(error)
+                    
+                    sizer.shrink()
+                    delay = policy.delay(category, retry)
+                    self._log(f"Retriable error ({category}): {error}", "WARNING")
+                    self._log(f"Retry {retry}/{policy.max_retries} dalam {delay:.1f}s, melanjutkan dari byte yang sudah diterima server ({insert_request.resumable_progress})", "INFO")
+                    timer.sleep(delay)
             
             if response:
+                timer.begin('confirmation')
+                self.upload_sessions.remove(session_key)
                 video_id = response['id']
                 video_url = f"https://www.youtube.com/watch?v={video_id}"
                 
@@ -288,7 +554,7 @@ class YouTubeAPIUploader:
                 self._log(f"Video ID: {video_id}", "INFO")
                 self._log(f"Video URL: {video_url}", "INFO")
                 
-                return {
+                result = {
                     "success": True,
                     "message": "Upload berhasil",
                     "video_id": video_id,
@@ -297,16 +563,37 @@ class YouTubeAPIUploader:
                     "description": description,
                     "privacy": privacy,
                     "is_shorts": is_shorts,
-                    "file_size_mb": file_size
+                    "video_path": video_path,
+                    "bytes": media.size(),
+                    "file_size_mb": file_size,
+                    "bytes_per_second": meter.average_rate()
                 }
+                self.ledger.record(content_hash, 'youtube', self.account_id(), result)
+                return result
             else:
                 raise Exception("Upload gagal: No response received")
                 
+        except UploadCancelled as e:
+            self._log(str(e), "WARNING")
+            if reserved:
+                self._refund_unaccepted_insert(insert_request)
+            return {
+                "success": False,
+                "cancelled": True,
+                "message": str(e),
+                "video_path": video_path,
+                "title": title
+            }
+            
         except HttpError as e:
             error_msg = f"YouTube API Error: {e.resp.status} - {e.content}"
             self._log(error_msg, "ERROR")
+            if reserved:
+                self._refund_unaccepted_insert(insert_request)
             
             # Parse specific errors
+            if self._is_quota_error(e):
+                self.quota.mark_exhausted()
             if e.resp.status == 403:
                 self._log("Kemungkinan quota API habis atau akses ditolak", "ERROR")
             elif e.resp.status == 400:
@@ -322,6 +609,8 @@ class YouTubeAPIUploader:
         except Exception as e:
             error_msg = f"Upload error: {str(e)}"
             self._log(error_msg, "ERROR")
+            if reserved:
+                self._refund_unaccepted_insert(insert_request)
             
             return {
                 "success": False,
@@ -330,8 +619,17 @@ class YouTubeAPIUploader:
                 "title": title
             }
 
+    def abort(self):
+        """Hentikan upload yang sedang berjalan (dari thread lain) setelah chunk yang sedang dikirim selesai"""
+        with self._cancels_lock:
+            cancels = list(self._cancels)
+        if cancels:
+            self._log("Menghentikan upload YouTube setelah chunk saat ini...", "WARNING")
+        for cancel in cancels:
+            cancel.set()
+
     def upload_shorts(self, video_path: str, title: str, description: str = "", 
-                     privacy: str = "public") -> Dict[str, Any]:
+                     privacy: str = "public", progress_callback: Optional[ProgressCallback] = None) -> Dict[str, Any]:
         """
         Upload YouTube Shorts (wrapper untuk upload_video dengan optimasi Shorts)
         
@@ -340,6 +638,7 @@ class YouTubeAPIUploader:
             title: Title video
             description: Deskripsi video
             privacy: Privacy setting
+            progress_callback: Dipanggil dengan dict progress upload
             
         Returns:
             Dict dengan status upload
@@ -360,8 +659,83 @@ class YouTubeAPIUploader:
             description=description,
             tags=shorts_tags,
             category="Entertainment",
-            privacy=privacy
+            privacy=privacy,
+            progress_callback=progress_callback
+        )
+
+    def _worker_service(self):
+        """Service dengan transport HTTP sendiri untuk satu thread, memakai credential bersama"""
+        http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+        return self._build_service(http=http)
+
+    def upload_many(self, videos: List[Dict[str, Any]], workers: int = 3, shorts: bool = True) -> Dict[str, Any]:
+        """
+        Upload beberapa video secara bersamaan
+        
+        Args:
+            videos: List dict argumen upload (video_path, title, description, privacy, tags, category)
+            workers: Jumlah upload paralel
+            shorts: Upload sebagai Shorts (upload_shorts) atau video biasa (upload_video)
+            
+        Returns:
+            Dict ringkasan dengan hasil per video (format sama dengan upload_video)
+        """
+        if workers < 1:
+            raise ValueError("workers minimal 1")
+        
+        if not self.credentials and not self.initialize_youtube_service():
+            return {"success": False, "message": "Gagal inisialisasi YouTube API", "results": []}
+        
+        # Refresh sekali di depan supaya worker tidak berebut refresh token
+        if not self.credentials.valid and self.credentials.refresh_token:
+            self.credential_manager.refresh()
+        
+        def upload_one(item: Dict[str, Any]) -> Dict[str, Any]:
+            if self.youtube is None:
+                self.youtube = self._worker_service()
+            
+            try:
+                if shorts:
+                    return self.upload_shorts(
+                        item["video_path"], item["title"], item.get("description", ""), item.get("privacy", "public")
+                    )
+                return self.upload_video(**item)
+            except Exception as e:
+                error_msg = f"Upload error: {str(e)}"
+                self._log(error_msg, "ERROR")
+                return {
+                    "success": False,
+                    "message": error_msg,
+                    "video_path": item.get("video_path"),
+                    "title": item.get("title")
+                }
+        
+        self._log(f"Mengupload {len(videos)} video dengan {workers} worker...", "INFO")
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="youtube") as executor:
+            results = list(executor.map(upload_one, videos))
+        elapsed = time.time() - start
+        
+        uploaded_bytes = sum(
+            os.path.getsize(item["video_path"])
+            for item, result in zip(videos, results)
+            if result.get("success") and not result.get("duplicate")
         )
+        success_count = sum(1 for result in results if result.get("success"))
+        
+        summary = {
+            "success": success_count == len(results),
+            "message": f"{success_count}/{len(results)} upload berhasil",
+            "results": results,
+            "uploaded_bytes": uploaded_bytes,
+            "elapsed_seconds": round(elapsed, 2),
+            "bytes_per_second": uploaded_bytes / elapsed if elapsed > 0 else None
+        }
+        
+        speed = (summary["bytes_per_second"] or 0) / (1024 * 1024)
+        self._log(f"{summary['message']} dalam {elapsed:.1f}s ({speed:.2f}MB/s total)",
+                  "SUCCESS" if summary["success"] else "WARNING")
+        return summary
 
     def get_channel_info(self) -> Dict[str, Any]:
         """Get informasi channel YouTube"""
@@ -374,6 +748,7 @@ class YouTubeAPIUploader:
                 part="snippet,statistics",
                 mine=True
             )
+            self.quota.record('channels.list')
             response = request.execute()
             
             if response['items']:
@@ -401,55 +776,37 @@ class YouTubeAPIUploader:
             return {"success": False, "message": error_msg}
 
     def check_api_quota(self) -> Dict[str, Any]:
-        """Check API quota usage (estimasi)"""
-        try:
-            # Lakukan request sederhana untuk test quota
-            if not self.youtube:
-                if not self.initialize_youtube_service():
-                    return {"success": False, "message": "Gagal inisialisasi YouTube API"}
-            
-            # Test dengan request ringan
-            request = self.youtube.channels().list(
-                part="id",
-                mine=True
-            )
-            response = request.execute()
-            
-            self._log("API quota tersedia", "SUCCESS")
-            return {
-                "success": True,
-                "message": "API quota tersedia",
-                "quota_available": True
-            }
-            
-        except HttpError as e:
-            if e.resp.status == 403:
-                error_msg = "API quota habis atau akses ditolak"
-                self._log(error_msg, "ERROR")
-                return {
-                    "success": False,
-                    "message": error_msg,
-                    "quota_available": False
-                }
-            else:
-                error_msg = f"API Error: {e.resp.status}"
-                self._log(error_msg, "ERROR")
-                return {
-                    "success": False,
-                    "message": error_msg,
-                    "quota_available": False
-                }
-        except Exception as e:
-            error_msg = f"Error checking quota: {str(e)}"
-            self._log(error_msg, "ERROR")
-            return {
-                "success": False,
-                "message": error_msg,
-                "quota_available": False
-            }
+        """Check sisa quota dari ledger lokal (tanpa request ke API)"""
+        report = self.quota.report()
+        uploads_left = report["remaining"] // QUOTA_COSTS['videos.insert']
+        hours = report["resets_in_seconds"] / 3600
+        
+        self._log(f"Project: {report['project']} (hari quota {report['day']} waktu Pasifik)", "INFO")
+        self._log(f"Quota terpakai: {report['used']}/{report['limit']} unit", "INFO")
+        for method, usage in report["methods"].items():
+            self._log(f"  {method}: {usage['calls']}x = {usage['units']} unit", "DEBUG")
+        
+        if report["exhausted"] or uploads_left == 0:
+            self._log(f"Quota tidak cukup untuk upload, reset {hours:.1f} jam lagi", "ERROR")
+        else:
+            self._log(f"Sisa quota: {report['remaining']} unit (~{uploads_left} upload), reset {hours:.1f} jam lagi", "SUCCESS")
+        
+        return {
+            "success": True,
+            "message": "API quota tersedia" if uploads_left else "API quota habis",
+            "quota_available": uploads_left > 0,
+            "uploads_left": uploads_left,
+            **report
+        }
 
     def clear_credentials(self):
         """Hapus credentials dan token"""
+        # Buang service semua thread sekaligus
+        self._local = threading.local()
+        self.credentials = None
+        self.credential_manager = None
+        CredentialManager.unregister(self.token_path)
+        
         try:
             if self.token_path.exists():
                 self.token_path.unlink()
@@ -500,10 +857,14 @@ def main():
     parser.add_argument("--check-credentials", action="store_true", help="Cek status credentials")
     parser.add_argument("--check-quota", action="store_true", help="Cek API quota")
     parser.add_argument("--channel-info", action="store_true", help="Tampilkan info channel")
+    parser.add_argument("--force", action="store_true", help="Upload ulang walaupun video sudah pernah diupload")
+    parser.add_argument("--batch", help="Upload banyak video dari file JSONL (video_path, title, description, privacy)")
+    parser.add_argument("--workers", type=int, default=3, help="Jumlah upload paralel untuk --batch")
+    parser.add_argument("--timings-log", help="Tulis timing per fase setiap upload ke file JSON lines")
     
     args = parser.parse_args()
     
-    uploader = YouTubeAPIUploader(debug=args.debug)
+    uploader = YouTubeAPIUploader(debug=args.debug, force_upload=args.force, timings_log=args.timings_log)
     
     # Handle different actions
     if args.clear_credentials:
@@ -523,6 +884,23 @@ def main():
             uploader.get_channel_info()
         return
     
+    if args.batch:
+        with open(args.batch, 'r', encoding='utf-8') as f:
+            videos = [json.loads(line) for line in f if line.strip() and not line.startswith("#")]
+        for item in videos:
+            item.setdefault("privacy", args.privacy)
+        
+        summary = uploader.upload_many(videos, workers=args.workers)
+        for result in summary["results"]:
+            if result["success"]:
+                print(f"{Fore.GREEN}✅ {result['title']}: {result['video_url']}")
+            else:
+                print(f"{Fore.RED}❌ {result.get('title')}: {result['message']}")
+        
+        if not summary["success"]:
+            sys.exit(1)
+        return
+    
     if args.video and args.title:
         if not os.path.exists(args.video):
             print(f"{Fore.RED}❌ File video tidak ditemukan: {args.video}")
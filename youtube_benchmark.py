@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+YouTube Benchmark - Ukur throughput, memori dan overhead kirim ulang YouTubeAPIUploader
+terhadap fake_youtube_server untuk beberapa ukuran file dan ukuran chunk, tanpa memakai quota
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import statistics
+import tracemalloc
+import multiprocessing
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httplib2
+from colorama import init, Fore, Style
+import argparse
+
+from fake_youtube_server import FakeYouTubeServer, STATS_PATH, DEFAULT_CONFIG
+
+# Initialize colorama
+init(autoreset=True)
+
+MB = 1024 * 1024
+
+
+def _serve(config: Dict[str, Any], conn):
+    server = FakeYouTubeServer(config=config)
+    conn.send(server.base_url)
+    server._httpd.serve_forever()
+
+
+def start_server_process(config: Dict[str, Any]):
+    """
+    Jalankan fake server di proses terpisah supaya memori dan CPU server tidak ikut terukur
+
+    Returns:
+        Tuple (process, base_url)
+    """
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_serve, args=(config, child), name="fake-youtube", daemon=True)
+    process.start()
+    return process, parent.recv()
+
+
+def server_stats(base_url: str) -> Dict[str, int]:
+    resp, content = httplib2.Http().request(base_url + STATS_PATH)
+    return json.loads(content)
+
+
+def make_video(workdir: Path, size_mb: float) -> str:
+    path = workdir / f"bench_{size_mb:g}MB.mp4"
+    if not path.exists():
+        remaining = int(size_mb * MB)
+        with open(path, 'wb') as f:
+            while remaining > 0:
+                block = os.urandom(min(remaining, 8 * MB))
+                f.write(block)
+                remaining -= len(block)
+    return str(path)
+
+
+def make_uploader(base_url: str, workdir: Path, debug: bool = False):
+    """YouTubeAPIUploader yang diarahkan ke fake server; token, ledger dan quota ditulis ke folder sementara"""
+    from google.oauth2.credentials import Credentials
+    from credential_manager import write_token_file
+    from quota_ledger import QuotaLedger
+    from upload_ledger import UploadLedger
+    from resumable_upload import UploadSessionStore
+    from youtube_api_uploader import YouTubeAPIUploader
+
+    uploader = YouTubeAPIUploader(debug=debug, force_upload=True, api_root=base_url + "/",
+                                  token_uri=base_url + "/token")
+    uploader.credentials_path = workdir / "youtube_credentials.json"
+    uploader.token_path = workdir / "youtube_token.json"
+    uploader.credentials_path.write_text(json.dumps({"installed": {"client_id": "fake-client", "project_id": "benchmark"}}))
+
+    # Token sudah expired: inisialisasi pertama melewati refresh ke endpoint token fake server
+    creds = Credentials(token="expired", refresh_token="fake-refresh", token_uri=uploader.token_uri,
+                        client_id="fake-client", client_secret="fake-secret", scopes=uploader.scopes)
+    creds.expiry = datetime.utcnow() - timedelta(hours=1)
+    write_token_file(creds, uploader.token_path)
+
+    uploader.quota.close()
+    uploader.quota = QuotaLedger("benchmark", workdir / "youtube_quota.db", daily_limit=10 ** 9)
+    uploader.ledger.close()
+    uploader.ledger = UploadLedger(workdir / "upload_ledger.db")
+    uploader.upload_sessions = UploadSessionStore(workdir / "youtube_upload_sessions.json", log=uploader._log)
+    return uploader
+
+
+def measure_upload(uploader, base_url: str, video: str, chunk_mb: float) -> Dict[str, Any]:
+    """Satu upload: durasi, throughput, peak memori Python dan request/bytes yang diterima server"""
+    before = server_stats(base_url)
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = uploader.upload_video(video, "Benchmark", chunk_size=int(chunk_mb * MB))
+    finally:
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    after = server_stats(base_url)
+    delta = {key: after[key] - before.get(key, 0) for key in after}
+
+    size = os.path.getsize(video)
+    return {
+        "success": bool(result.get("success")),
+        "message": result.get("message"),
+        "seconds": seconds,
+        "bytes_per_second": size / seconds if result.get("success") else None,
+        "peak_memory_bytes": peak,
+        "requests": delta["requests"],
+        "chunks": delta["chunks"],
+        "resent_bytes": max(0, delta["bytes_received"] - delta["bytes_acked"]),
+        "resend_ratio": max(0, delta["bytes_received"] - delta["bytes_acked"]) / size if size else 0.0,
+        "sleep_seconds": result.get("timings", {}).get("sleep_seconds", 0.0),
+        "phases": result.get("timings", {}).get("phases", {})
+    }
+
+
+def summarize(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    ok = [s for s in samples if s["success"]]
+    if not ok:
+        return {"runs": len(samples), "success": 0, "message": samples[-1]["message"] if samples else None}
+    median = lambda key: statistics.median(s[key] for s in ok)
+    return {
+        "runs": len(samples),
+        "success": len(ok),
+        "seconds": median("seconds"),
+        "bytes_per_second": median("bytes_per_second"),
+        "peak_memory_bytes": max(s["peak_memory_bytes"] for s in ok),
+        "requests": median("requests"),
+        "chunks": median("chunks"),
+        "resend_ratio": median("resend_ratio"),
+        "sleep_seconds": median("sleep_seconds")
+    }
+
+
+def _floats(value: str) -> List[float]:
+    return [float(v) for v in value.split(",") if v.strip()]
+
+
+def main():
+    """Main function untuk CLI"""
+    parser = argparse.ArgumentParser(description="Benchmark upload YouTube terhadap fake_youtube_server lokal")
+    parser.add_argument("--sizes", type=_floats, default=[8, 32, 128], help="Ukuran file dalam MB, dipisah koma")
+    parser.add_argument("--chunk-sizes", type=_floats, default=[1, 8, 32], help="Ukuran chunk awal dalam MB, dipisah koma")
+    parser.add_argument("--runs", type=int, default=3, help="Jumlah run per kombinasi")
+    parser.add_argument("--bandwidth", type=float, default=0, help="Batas bandwidth server (MB/detik, 0 = tanpa batas)")
+    parser.add_argument("--latency", type=float, default=DEFAULT_CONFIG["latency"], help="Delay per response server (detik)")
+    parser.add_argument("--ack-ratio", type=float, default=DEFAULT_CONFIG["ack_ratio"], help="Fraksi chunk yang diakui server per PUT")
+    parser.add_argument("--report", help="Tulis hasil ke file JSON")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+
+    args = parser.parse_args()
+    config = {
+        "bandwidth": int(args.bandwidth * MB),
+        "latency": args.latency,
+        "ack_ratio": args.ack_ratio
+    }
+
+    process, base_url = start_server_process(config)
+    results: List[Dict[str, Any]] = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="sosmd-ytbench-") as tmp:
+            workdir = Path(tmp)
+            uploader = make_uploader(base_url, workdir, debug=args.debug)
+            if not uploader.initialize_youtube_service() or not uploader.get_channel_info()["success"]:
+                print(f"{Fore.RED}❌ Tidak bisa terhubung ke fake server {base_url}")
+                sys.exit(1)
+
+            for size_mb in args.sizes:
+                video = make_video(workdir, size_mb)
+                for chunk_mb in args.chunk_sizes:
+                    print(f"{Fore.CYAN}▶ {size_mb:g}MB, chunk awal {chunk_mb:g}MB")
+                    samples = [measure_upload(uploader, base_url, video, chunk_mb) for _ in range(args.runs)]
+                    results.append({"size_mb": size_mb, "chunk_mb": chunk_mb, **summarize(samples)})
+            uploader.quota.close()
+            uploader.ledger.close()
+    finally:
+        process.terminate()
+        process.join()
+
+    bandwidth = f"{args.bandwidth:g}MB/s" if args.bandwidth else "tanpa batas"
+    print(f"\n{Fore.MAGENTA}📺 YouTube upload benchmark ({args.runs} run, median) - bandwidth {bandwidth}, "
+          f"latency {args.latency:g}s, ack {args.ack_ratio:g}")
+    print(f"{'File':>8}{'Chunk':>8}{'waktu':>9}{'MB/s':>9}{'peak mem':>11}{'request':>9}{'kirim ulang':>13}{'sleep':>8}")
+    for row in results:
+        head = f"{row['size_mb']:>6g}MB{row['chunk_mb']:>6g}MB"
+        if not row["success"]:
+            print(f"{head}  {Fore.RED}gagal: {row.get('message')}{Style.RESET_ALL}")
+            continue
+        print(f"{head}{row['seconds']:8.2f}s{row['bytes_per_second'] / MB:9.2f}"
+              f"{row['peak_memory_bytes'] / MB:9.1f}MB{row['requests']:9.0f}"
+              f"{row['resend_ratio'] * 100:12.1f}%{row['sleep_seconds']:7.1f}s")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({"config": config, "results": results}, f, indent=2)
+
+    if any(row["success"] < row["runs"] for row in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()